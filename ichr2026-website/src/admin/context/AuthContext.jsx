@@ -116,6 +116,19 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    const accessToken = localStorage.getItem('accessToken');
+    if (accessToken) {
+      // Revoke both tokens on the server; signing out locally does not wait for it
+      fetch('http://localhost:5002/api/admin/logout', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${accessToken}`
+        },
+        body: JSON.stringify({ refresh_token: localStorage.getItem('refreshToken') })
+      }).catch(() => {});
+    }
+
     localStorage.removeItem('adminUser');
     localStorage.removeItem('accessToken');
     localStorage.removeItem('refreshToken');
@@ -93,7 +93,17 @@ const MessagesPage = () => {
     setPagination((prev) => ({ ...prev, page: 1 })); // Reset to first page when filters change
   };
 
-  const handleViewMessage = async (message) => {
+  const handleViewMessage = async (summary) => {
+    // The list only carries table fields; the message body comes from the detail endpoint
+    let message;
+    try {
+      const detail = await get(`/admin/messages/${summary.message_id}`);
+      message = { ...summary, ...detail.data };
+    } catch (err) {
+      console.error('Failed to load message:', err);
+      return;
+    }
+
     setSelectedMessage(message);
     setResponseForm({
       response: message.response || '',
@@ -95,19 +95,34 @@ const PapersPage = () => {
     setPagination((prev) => ({ ...prev, page: 1 })); // Reset to first page when filters change
   };
 
-  const handleViewPaper = (paper) => {
-    setSelectedPaper(paper);
-    setIsViewDialogOpen(true);
+  // The list only carries table fields; abstracts and comments come from the detail endpoint
+  const fetchPaperDetail = async (paper) => {
+    const response = await get(`/admin/papers/${paper.submission_id}`);
+    return { ...paper, ...response.data };
   };
 
-  const handleReviewPaper = (paper) => {
-    setSelectedPaper(paper);
-    setReviewForm({
-      status: paper.status,
-      reviewer_comments: paper.reviewer_comments || '',
-      review_score: paper.review_score?.toString() || '',
-    });
-    setIsReviewDialogOpen(true);
+  const handleViewPaper = async (paper) => {
+    try {
+      setSelectedPaper(await fetchPaperDetail(paper));
+      setIsViewDialogOpen(true);
+    } catch (err) {
+      console.error('Failed to load paper details:', err);
+    }
+  };
+
+  const handleReviewPaper = async (paper) => {
+    try {
+      const detail = await fetchPaperDetail(paper);
+      setSelectedPaper(detail);
+      setReviewForm({
+        status: detail.status,
+        reviewer_comments: detail.reviewer_comments || '',
+        review_score: detail.review_score?.toString() || '',
+      });
+      setIsReviewDialogOpen(true);
+    } catch (err) {
+      console.error('Failed to load paper details:', err);
+    }
   };
 
   const handleReviewFormChange = (field, value) => {
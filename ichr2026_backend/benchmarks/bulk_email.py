@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the bulk email dispatcher.
+Sends a campaign to every seeded registrant through a local aiosmtpd sink
+and reports messages/sec for different numbers of parallel SMTP
+connections, with a static and a personalised template, plus one
+rate-limited run. The sink waits SINK_LATENCY per message to stand in for
+the round trip to a real relay; pass 0 as --latency to measure raw
+throughput.
+
+Requires aiosmtpd (pip install aiosmtpd).
+
+Usage: python benchmarks/bulk_email.py [rows ...] [--latency=ms]   (default: 1000 10000, 5 ms)
+"""
+
+import asyncio
+import socket
+import sys
+import time
+from aiosmtpd.controller import Controller
+from flask import current_app
+from common import make_app, remove_app, seed_registrations, parse_sizes
+from src.models.user import db
+from src.models.conference import EmailCampaign
+from src.services.jobs import job_queue
+from src.services.mail import init_mail_config
+from src.services.bulk_email import run_campaign
+
+SINK_LATENCY = 0.005
+
+class CountingHandler:
+    def __init__(self, latency):
+        self.latency = latency
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.received += 1
+        return '250 OK'
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def send(subject, message, **config):
+    current_app.config.update(config)
+    campaign = EmailCampaign(campaign_id=f'BENCH-{time.perf_counter_ns()}', subject=subject, message=message)
+    db.session.add(campaign)
+    db.session.commit()
+    start = time.perf_counter()
+    campaign = run_campaign(campaign.campaign_id)
+    return campaign.sent_count, time.perf_counter() - start
+
+def run(rows, latency):
+    handler = CountingHandler(latency)
+    port = free_port()
+    controller = Controller(handler, hostname='127.0.0.1', port=port)
+    controller.start()
+    app = make_app()
+    try:
+        app.config.update(MAIL_BACKEND='smtp', MAIL_SERVER='127.0.0.1', MAIL_PORT=port)
+        init_mail_config(app)
+        job_queue.init_app(app)
+        with app.app_context():
+            seed_registrations(rows)
+            for connections in (1, 4, 8):
+                for label, subject, message in (
+                    ('static', 'Conference update', 'The programme is now online.'),
+                    ('personalised', 'Hello $full_name', 'Your registration $registration_id is on file.'),
+                ):
+                    sent, seconds = send(subject, message, MAIL_CONNECTIONS=connections, MAIL_RATE_LIMIT=0)
+                    print(f"  {connections} connections {label:<13} sent={sent:<7} {sent / seconds:9.0f} msg/s")
+            limit = 200
+            sent, seconds = send('Rate limited', 'Hi', MAIL_CONNECTIONS=4, MAIL_RATE_LIMIT=limit)
+            print(f"  4 connections limit={limit}/s   sent={sent:<7} {sent / seconds:9.0f} msg/s")
+            print(f"  sink received {handler.received} messages")
+    finally:
+        controller.stop()
+        remove_app(app)
+
+if __name__ == '__main__':
+    latency = SINK_LATENCY
+    for arg in sys.argv[1:]:
+        if arg.startswith('--latency='):
+            latency = float(arg.split('=', 1)[1]) / 1000
+    for rows in parse_sizes(sys.argv[1:], [1000, 10000]):
+        print(f"{rows} registrations, sink latency {latency * 1000:.0f} ms")
+        run(rows, latency)
@@ -0,0 +1,173 @@
+"""
+Shared helpers for the ICHR2026 backend benchmarks.
+Builds a throwaway app on a temporary SQLite file and seeds it with synthetic rows.
+"""
+
+import os
+import sys
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import event
+from src.models.user import db
+from src.services.database import init_database
+from src.models.conference import (
+    Registration, PaperSubmission, ContactMessage,
+    RegistrationCategory, RegistrationStatus, PaperCategory, PaperStatus
+)
+
+BATCH_SIZE = 10000
+MESSAGE_SUBJECTS = [
+    'Paper submission question', 'Registration help', 'Hotel accommodation',
+    'Programme schedule', 'Sponsorship enquiry', 'General inquiry'
+]
+
+def make_app(db_path=None, config=None):
+    """Create a bare app bound to a temporary SQLite database, with the production connection settings"""
+    if db_path is None:
+        fd, db_path = tempfile.mkstemp(suffix='.db', prefix='ichr2026_bench_')
+        os.close(fd)
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{db_path}"
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config.update(config or {})
+    init_database(app)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    app.config['BENCH_DB_PATH'] = db_path
+    return app
+
+def remove_app(app):
+    """Dispose the engine and delete the temporary database"""
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+    db_path = app.config['BENCH_DB_PATH']
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+def _random_created_at(now, days=200):
+    return now - timedelta(seconds=random.randint(0, days * 86400))
+
+def _insert_batches(table, make_row, count):
+    for offset in range(0, count, BATCH_SIZE):
+        rows = [make_row(i) for i in range(offset, min(offset + BATCH_SIZE, count))]
+        db.session.execute(table.insert(), rows)
+    db.session.commit()
+
+def seed_registrations(count):
+    """Bulk insert synthetic registrations through Core"""
+    now = datetime.utcnow()
+    categories = [c.name for c in RegistrationCategory]
+    statuses = [s.name for s in RegistrationStatus]
+
+    def make_row(i):
+        created_at = _random_created_at(now)
+        return {
+            'registration_id': f'ICHR2026-REG-B{i:09d}',
+            'full_name': f'Registrant {i}',
+            'email': f'registrant{i}@example.org',
+            'phone': '+94000000000',
+            'affiliation': f'University {i % 500}',
+            'country': 'Sri Lanka',
+            'category': random.choice(categories),
+            'paper_title': '',
+            'special_requirements': '',
+            'status': random.choice(statuses),
+            'created_at': created_at,
+            'updated_at': created_at,
+            'payment_amount': random.choice([0, 3000, 4000, 5000]),
+            'payment_currency': 'LKR',
+            'payment_status': random.choice(['pending', 'paid']),
+        }
+
+    _insert_batches(Registration.__table__, make_row, count)
+
+def seed_papers(count):
+    """Bulk insert synthetic paper submissions through Core"""
+    now = datetime.utcnow()
+    categories = [c.name for c in PaperCategory]
+    statuses = [s.name for s in PaperStatus]
+
+    def make_row(i):
+        created_at = _random_created_at(now)
+        return {
+            'submission_id': f'ICHR2026-SUB-B{i:09d}',
+            'title': f'On the harmony of systems, part {i}',
+            'abstract': 'Lorem ipsum dolor sit amet. ' * 40,
+            'keywords': 'harmony, research, systems',
+            'category': random.choice(categories),
+            'authors': f'Author {i}, Co-Author {i}',
+            'corresponding_author_email': f'author{i}@example.org',
+            'affiliation': f'University {i % 500}',
+            'phone': '+94000000000',
+            'file_name': f'paper_{i}.pdf',
+            'file_path': f'/tmp/paper_{i}.pdf',
+            'file_size': random.randint(100000, 5000000),
+            'file_type': 'pdf',
+            'status': random.choice(statuses),
+            'reviewer_comments': None,
+            'review_score': random.choice([None, random.uniform(0, 10)]),
+            'created_at': created_at,
+            'updated_at': created_at,
+        }
+
+    _insert_batches(PaperSubmission.__table__, make_row, count)
+
+def seed_messages(count):
+    """Bulk insert synthetic contact messages through Core"""
+    now = datetime.utcnow()
+
+    def make_row(i):
+        created_at = _random_created_at(now)
+        return {
+            'message_id': f'ICHR2026-MSG-B{i:09d}',
+            'name': f'Visitor {i}',
+            'email': f'visitor{i}@example.org',
+            'subject': random.choice(MESSAGE_SUBJECTS),
+            'message': 'Hello, I have a question about the conference. ' * 10,
+            'status': random.choice(['new', 'read', 'responded', 'closed']),
+            'created_at': created_at,
+            'updated_at': created_at,
+        }
+
+    _insert_batches(ContactMessage.__table__, make_row, count)
+
+class QueryCounter:
+    """Context manager counting statements sent to the engine"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._on_execute)
+
+def timed(fn, repeat=5):
+    """Run fn repeatedly and return (best seconds, last result)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def parse_sizes(argv, default):
+    """Row counts from the command line, e.g. `10000 100000 1000000`"""
+    sizes = [int(arg.replace('_', '')) for arg in argv if arg.replace('_', '').isdigit()]
+    return sizes or default
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark for concurrent registrations.
+N processes, each with its own app from create_app() like a gunicorn
+worker, post registrations through the test client for DURATION seconds
+while one more process pages through the registration list. Runs once
+with SQLite's default settings (rollback journal, synchronous=FULL, 5 s
+busy timeout, no mmap) and once with those of src/services/database.py,
+and reports registrations per second, refused registrations ("database is
+locked"), write p50/p99 and list pages per second.
+
+Usage: python benchmarks/concurrent_writes.py [registrants ...]   (default: 1 4 16)
+"""
+
+import multiprocessing
+import random
+import sys
+import time
+import uuid
+from common import make_app, remove_app, seed_registrations, parse_sizes
+from src.main import create_app
+from src.models.user import db
+from src.models.conference import Registration
+from src.migrations.runner import prepare_database
+from src.services.passwords import passwords
+
+DURATION = 5
+SEED_ROWS = 20000
+SQLITE_DEFAULTS = {
+    'SQLITE_JOURNAL_MODE': 'delete',
+    'SQLITE_SYNCHRONOUS': 'full',
+    'SQLITE_BUSY_TIMEOUT': 5000,
+    'SQLITE_MMAP_SIZE': 0,
+    'SQLITE_CACHE_SIZE': -2000,
+}
+MODES = [('sqlite defaults', SQLITE_DEFAULTS), ('tuned', {})]
+
+def worker_app(uri, settings):
+    # Caching is off so that every list page is read from the database
+    return create_app({'SQLALCHEMY_DATABASE_URI': uri, 'JOB_AUTOSTART': False, 'CACHE_ENABLED': False, **settings})
+
+def registrant(uri, settings, barrier, results):
+    client = worker_app(uri, settings).test_client()
+    latencies, refused = [], 0
+    barrier.wait()
+    deadline = time.perf_counter() + DURATION
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = client.post('/api/registration', json={
+            'fullName': 'Concurrent Registrant', 'email': f'{uuid.uuid4().hex[:12]}@example.org',
+            'phone': '+94 77 000 0000', 'affiliation': 'University of Vavuniya', 'country': 'Sri Lanka',
+            'category': 'student'
+        })
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 201:
+            refused += 1
+    results.put(('write', latencies, refused))
+
+def reader(uri, settings, barrier, results):
+    client = worker_app(uri, settings).test_client()
+    pages = 0
+    barrier.wait()
+    deadline = time.perf_counter() + DURATION
+    while time.perf_counter() < deadline:
+        client.get(f'/api/registrations?page={random.randint(1, 20)}&per_page=50')
+        pages += 1
+    results.put(('read', pages, 0))
+
+def run(label, settings, registrants):
+    app = make_app(config=settings)
+    passwords.init_app(app)
+    try:
+        with app.app_context():
+            prepare_database()
+            seed_registrations(SEED_ROWS)
+            db.session.remove()
+            db.engine.dispose()
+        uri = app.config['SQLALCHEMY_DATABASE_URI']
+
+        context = multiprocessing.get_context('spawn')
+        barrier = context.Barrier(registrants + 2)
+        results = context.Queue()
+        processes = [context.Process(target=registrant, args=(uri, settings, barrier, results))
+                     for _ in range(registrants)]
+        processes.append(context.Process(target=reader, args=(uri, settings, barrier, results)))
+        for process in processes:
+            process.start()
+        barrier.wait()
+        start = time.perf_counter()
+        outcomes = [results.get() for _ in processes]
+        elapsed = time.perf_counter() - start
+        for process in processes:
+            process.join()
+
+        latencies = sorted(latency for kind, values, _ in outcomes if kind == 'write' for latency in values)
+        refused = sum(count for kind, _, count in outcomes if kind == 'write')
+        pages = sum(values for kind, values, _ in outcomes if kind == 'read')
+        with app.app_context():
+            stored = Registration.query.count() - SEED_ROWS
+        print(f'  {label:<16} registrants={registrants:<3} writes/s={stored / elapsed:7.1f}  refused={refused:<5}'
+              f'  p50={latencies[len(latencies) // 2] * 1000:7.1f} ms'
+              f'  p99={latencies[int(len(latencies) * 0.99)] * 1000:7.1f} ms  list pages/s={pages / elapsed:6.1f}')
+    finally:
+        remove_app(app)
+
+if __name__ == '__main__':
+    for registrants in parse_sizes(sys.argv[1:], [1, 4, 16]):
+        for label, settings in MODES:
+            run(label, settings, registrants)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the statistics endpoints.
+Compares the original per-bucket COUNT(*) dashboard with the counter-backed
+builders in src/services/stats.py, then reports query counts and latency for
+every other /stats builder and for a full counter rebuild.
+
+Usage: python benchmarks/dashboard_stats.py [rows ...]   (default: 10000 100000 1000000)
+"""
+
+import sys
+from datetime import datetime, timedelta
+from common import (
+    make_app, remove_app, seed_registrations, seed_papers, seed_messages,
+    QueryCounter, timed, parse_sizes
+)
+from src.models.user import db
+from src.models.conference import (
+    Registration, PaperSubmission, ContactMessage,
+    RegistrationCategory, RegistrationStatus, PaperCategory, PaperStatus
+)
+from src.services.counters import rebuild_counters, check_counters
+from src.services.stats import (
+    dashboard_stats, registration_stats, paper_stats, contact_stats, summary_report
+)
+
+def legacy_dashboard_stats():
+    """The original one-query-per-figure dashboard, kept for comparison"""
+    overview = {
+        'total_registrations': Registration.query.count(),
+        'pending_registrations': Registration.query.filter_by(status=RegistrationStatus.PENDING).count(),
+        'confirmed_registrations': Registration.query.filter_by(status=RegistrationStatus.CONFIRMED).count(),
+        'total_papers': PaperSubmission.query.count(),
+        'pending_papers': PaperSubmission.query.filter_by(status=PaperStatus.SUBMITTED).count(),
+        'accepted_papers': PaperSubmission.query.filter_by(status=PaperStatus.ACCEPTED).count(),
+        'total_messages': ContactMessage.query.count(),
+        'unread_messages': ContactMessage.query.filter_by(status='new').count(),
+    }
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    recent_activity = {
+        'recent_registrations': Registration.query.filter(Registration.created_at >= week_ago).count(),
+        'recent_papers': PaperSubmission.query.filter(PaperSubmission.created_at >= week_ago).count(),
+        'recent_messages': ContactMessage.query.filter(ContactMessage.created_at >= week_ago).count(),
+    }
+    overview['total_revenue'] = db.session.query(db.func.sum(Registration.payment_amount)).filter(
+        Registration.payment_status == 'paid'
+    ).scalar() or 0
+    registration_by_category = {
+        category.value: Registration.query.filter_by(category=category).count()
+        for category in RegistrationCategory
+    }
+    papers_by_category = {
+        category.value: PaperSubmission.query.filter_by(category=category).count()
+        for category in PaperCategory
+    }
+    monthly_registrations = []
+    for i in range(6):
+        month_start = datetime.utcnow().replace(day=1) - timedelta(days=30*i)
+        month_end = month_start + timedelta(days=30)
+        count = Registration.query.filter(
+            Registration.created_at >= month_start,
+            Registration.created_at < month_end
+        ).count()
+        monthly_registrations.append({'month': month_start.strftime('%Y-%m'), 'count': count})
+    return {
+        'overview': overview,
+        'recent_activity': recent_activity,
+        'breakdowns': {
+            'registration_by_category': registration_by_category,
+            'papers_by_category': papers_by_category
+        },
+        'trends': {'monthly_registrations': monthly_registrations}
+    }
+
+def run(rows):
+    app = make_app()
+    try:
+        with app.app_context():
+            seed_registrations(rows)
+            seed_papers(rows // 4)
+            seed_messages(rows // 4)
+            seconds, _ = timed(rebuild_counters, repeat=1)
+            print(f"  rebuild_counters   best={seconds * 1000:9.1f} ms")
+
+            results = {}
+            for name, fn in (('legacy', legacy_dashboard_stats), ('counters', dashboard_stats)):
+                with QueryCounter(db.engine) as counter:
+                    fn()
+                seconds, data = timed(fn, repeat=3)
+                results[name] = data
+                print(f"  {name:<18} queries={counter.count:<3} best={seconds * 1000:9.1f} ms")
+
+            # Counters bucket by day, so only the all-time figures are compared exactly
+            legacy, counters = results['legacy'], results['counters']
+            for data in (legacy, counters):
+                data['overview']['total_revenue'] = round(data['overview']['total_revenue'], 2)
+            matches = all(legacy[key] == counters[key] for key in ('overview', 'breakdowns'))
+            print(f"  all-time figures match: {matches}")
+
+            now = datetime.utcnow()
+            builders = (
+                ('registration_stats', registration_stats),
+                ('paper_stats', paper_stats),
+                ('contact_stats', contact_stats),
+                ('summary_report', lambda: summary_report(now - timedelta(days=30), now)),
+            )
+            for name, fn in builders:
+                with QueryCounter(db.engine) as counter:
+                    fn()
+                seconds, _ = timed(fn, repeat=3)
+                print(f"  {name:<18} queries={counter.count:<3} best={seconds * 1000:9.1f} ms")
+
+            seconds, mismatches = timed(check_counters, repeat=1)
+            print(f"  check_counters     best={seconds * 1000:9.1f} ms drifted={len(mismatches)}")
+    finally:
+        remove_app(app)
+
+if __name__ == '__main__':
+    for rows in parse_sizes(sys.argv[1:], [10000, 100000, 1000000]):
+        print(f"{rows} registrations ({rows // 4} papers, {rows // 4} messages)")
+        run(rows)
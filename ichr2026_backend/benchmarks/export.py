@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the admin exports.
+Compares the previous approach (ORM .all() into one StringIO) with the
+streamed Core export as CSV (plain and gzip-compressed), JSON Lines, a
+three-column projection and Parquet (when pyarrow is installed), reporting
+time to first chunk, total time, output size and peak Python memory
+(tracemalloc).
+
+Usage: python benchmarks/export.py [rows ...]   (default: 10000 100000 1000000)
+"""
+
+import csv
+import io
+import sys
+import time
+import tracemalloc
+from common import make_app, remove_app, seed_registrations, parse_sizes
+from src.models.conference import Registration
+from src.services import export
+from src.services.export import csv_chunks, jsonl_chunks, parquet_chunks, gzip_chunks
+
+def legacy_export():
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['Registration ID', 'Full Name', 'Email', 'Phone', 'Affiliation', 'Country',
+                     'Category', 'Paper Title', 'Status', 'Payment Status', 'Payment Amount', 'Created At'])
+    for reg in Registration.query.all():
+        writer.writerow([
+            reg.registration_id, reg.full_name, reg.email, reg.phone, reg.affiliation, reg.country,
+            reg.category.value if reg.category else '', reg.paper_title or '',
+            reg.status.value if reg.status else '', reg.payment_status or '',
+            reg.payment_amount or '',
+            reg.created_at.strftime('%Y-%m-%d %H:%M:%S') if reg.created_at else ''
+        ])
+    yield output.getvalue()
+
+def measure(make_chunks):
+    """(seconds to first chunk, total seconds, bytes, peak MiB) of consuming a chunk stream"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    for chunk in make_chunks():
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, size, peak / (1024 * 1024)
+
+def run(rows):
+    app = make_app()
+    try:
+        with app.app_context():
+            seed_registrations(rows)
+            variants = [
+                ('legacy .all()', legacy_export),
+                ('streamed csv', lambda: csv_chunks('registrations')),
+                ('streamed gzip', lambda: gzip_chunks(csv_chunks('registrations'))),
+                ('streamed jsonl', lambda: jsonl_chunks('registrations')),
+                ('csv 3 columns', lambda: csv_chunks('registrations', ['email', 'status', 'created_at'])),
+            ]
+            if export.PYARROW_AVAILABLE:
+                variants.append(('parquet', lambda: parquet_chunks('registrations')))
+            for name, make_chunks in variants:
+                first, total, size, peak = measure(make_chunks)
+                print(f"  {name:<15} first chunk={first * 1000:9.1f} ms  total={total:7.2f} s  "
+                      f"size={size / 1e6:8.1f} MB  peak={peak:8.1f} MiB")
+    finally:
+        remove_app(app)
+
+if __name__ == '__main__':
+    for rows in parse_sizes(sys.argv[1:], [10000, 100000, 1000000]):
+        print(f"{rows} registrations")
+        run(rows)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the list indexes added by migration v002.
+Seeds the tables, drops the secondary indexes, then prints the SQLite query
+plan and best latency of the list/lookup queries before and after applying
+the migration.
+
+Usage: python benchmarks/indexes.py [rows ...]   (default: 10000 100000 1000000)
+"""
+
+import sqlite3
+import sys
+from flask import current_app
+from common import make_app, remove_app, seed_registrations, seed_papers, seed_messages, timed, parse_sizes
+from src.models.user import db
+from src.models.conference import (
+    Registration, PaperSubmission, ContactMessage,
+    RegistrationStatus, RegistrationCategory, PaperStatus
+)
+from src.migrations import v002_list_indexes
+
+def representative_queries(rows):
+    middle = Registration.query.order_by(
+        Registration.created_at.desc(), Registration.id.desc()
+    ).offset(rows // 2).first()
+    return {
+        'registrations by status': db.select(Registration).where(
+            Registration.status == RegistrationStatus.PENDING
+        ).order_by(Registration.created_at.desc()).limit(20),
+        'registrations by category': db.select(Registration).where(
+            Registration.category == RegistrationCategory.STUDENT
+        ).order_by(Registration.created_at.desc()).limit(20),
+        'registration status count': db.select(db.func.count()).select_from(Registration).where(
+            Registration.status == RegistrationStatus.PENDING
+        ),
+        'registration by email': db.select(Registration).where(
+            Registration.email == f'registrant{rows // 3}@example.org'
+        ),
+        'registrations keyset page': db.select(Registration).where(
+            db.tuple_(Registration.created_at, Registration.id) < db.tuple_(middle.created_at, middle.id)
+        ).order_by(Registration.created_at.desc(), Registration.id.desc()).limit(20),
+        'papers by status': db.select(PaperSubmission).where(
+            PaperSubmission.status == PaperStatus.SUBMITTED
+        ).order_by(PaperSubmission.created_at.desc()).limit(20),
+        'papers by author email': db.select(PaperSubmission).where(
+            PaperSubmission.corresponding_author_email == f'author{rows // 12}@example.org'
+        ),
+        'messages by status': db.select(ContactMessage).where(
+            ContactMessage.status == 'new'
+        ).order_by(ContactMessage.created_at.desc()).limit(20),
+        'messages by subject': db.select(ContactMessage).where(
+            ContactMessage.subject == 'Hotel accommodation'
+        ).limit(20),
+    }
+
+def query_plan(statement):
+    # A fresh connection, so no cached plan from before the schema change is reused
+    sql = str(statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+    connection = sqlite3.connect(current_app.config['BENCH_DB_PATH'])
+    try:
+        return [row[-1] for row in connection.execute(f'EXPLAIN QUERY PLAN {sql}')]
+    finally:
+        connection.close()
+
+def report(label, queries):
+    print(f"  -- {label}")
+    for name, statement in queries.items():
+        seconds, _ = timed(lambda: db.session.execute(statement).all(), repeat=3)
+        print(f"  {name:<28} {seconds * 1000:9.2f} ms  plan: {'; '.join(query_plan(statement))}")
+
+def run(rows):
+    app = make_app()
+    try:
+        with app.app_context():
+            seed_registrations(rows)
+            seed_papers(rows // 4)
+            seed_messages(rows // 4)
+            for name in v002_list_indexes.INDEX_NAMES:
+                db.session.execute(db.text(f'DROP INDEX IF EXISTS {name}'))
+            db.session.execute(db.text('ANALYZE'))
+            db.session.commit()
+
+            queries = representative_queries(rows)
+            report('without secondary indexes', queries)
+            with db.engine.begin() as connection:
+                v002_list_indexes.upgrade(connection)
+            report('after migration v002', queries)
+    finally:
+        remove_app(app)
+
+if __name__ == '__main__':
+    for rows in parse_sizes(sys.argv[1:], [10000, 100000, 1000000]):
+        print(f"{rows} registrations ({rows // 4} papers, {rows // 4} messages)")
+        run(rows)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Load test for the production server.
+Starts gunicorn with gunicorn.conf.py on a temporary database seeded with
+synthetic rows and a temporary root path for the uploaded files (or drives
+an already running server when a URL is given), then runs concurrent keep-alive clients written on asyncio streams. Each
+client loops over a mix of new registrations, paper submissions and admin
+list pages for LOAD_SECONDS seconds. Reports requests per second and p50/p99
+latency for every route and for the whole mix.
+
+Usage: python benchmarks/load.py [url] [clients ...]   (default: 8 32)
+Environment: LOAD_SECONDS (default 15), LOAD_USERNAME / LOAD_PASSWORD for
+an external server (default admin / admin123), GUNICORN_* for the server.
+"""
+
+import asyncio
+import json
+import os
+import random
+import socket
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from urllib.parse import urlsplit
+from common import make_app, remove_app, seed_registrations, seed_papers, seed_messages, parse_sizes
+from src.models.user import db
+from src.models.conference import PaperSubmission
+from src.migrations.runner import prepare_database
+from src.services.passwords import passwords
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_ROWS = 20000
+BOUNDARY = 'ichr2026loadboundary'
+# Smallest well-formed one-page PDF, so the processing jobs have real work to do
+PAPER_PDF = (
+    b'%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n'
+    b'2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n'
+    b'3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n'
+    b'trailer<</Root 1 0 R>>\n%%EOF\n'
+)
+
+# (route label, weight); admin pages are read far more often than forms are sent
+MIX = [
+    ('POST /api/registration', 3),
+    ('POST /api/papers/submit', 1),
+    ('GET /api/admin/registrations', 2),
+    ('GET /api/admin/papers', 2),
+    ('GET /api/admin/messages', 2),
+]
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, body=b'', headers=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f'{method} {path} HTTP/1.1', f'Host: {self.host}:{self.port}', f'Content-Length: {len(body)}']
+        lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length, close = 0, False
+        while (line := await self.reader.readline()) not in (b'\r\n', b''):
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+            elif name.lower() == 'connection' and value.strip().lower() == 'close':
+                close = True
+        payload = await self.reader.readexactly(length)
+        if close:
+            self.close()
+        return status, payload
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = self.reader = None
+
+def registration_request():
+    body = json.dumps({
+        'fullName': 'Load Test', 'email': f'load-{uuid.uuid4().hex[:12]}@example.org', 'phone': '+94 77 000 0000',
+        'affiliation': 'University of Vavuniya', 'country': 'Sri Lanka', 'category': 'spectator'
+    }).encode()
+    return 'POST', '/api/registration', body, {'Content-Type': 'application/json'}
+
+def paper_request():
+    fields = {
+        'title': 'Load test paper', 'abstract': 'Abstract ' * 40, 'keywords': 'load, test', 'category': 'research',
+        'authors': 'Load Test', 'email': 'load@example.org', 'affiliation': 'University of Vavuniya',
+        'phone': '+94 77 000 0000'
+    }
+    parts = [f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+             for name, value in fields.items()]
+    parts.append(f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="file"; filename="paper.pdf"\r\n'
+                 f'Content-Type: application/pdf\r\n\r\n'.encode() + PAPER_PDF + f'\r\n--{BOUNDARY}--\r\n'.encode())
+    return 'POST', '/api/papers/submit', b''.join(parts), {'Content-Type': f'multipart/form-data; boundary={BOUNDARY}'}
+
+def admin_list_request(path, token):
+    page = random.randint(1, 5)
+    return 'GET', f'{path}?page={page}&per_page=50', b'', {'Authorization': f'Bearer {token}'}
+
+def build_request(label, token):
+    if label == 'POST /api/registration':
+        return registration_request()
+    if label == 'POST /api/papers/submit':
+        return paper_request()
+    return admin_list_request(label.split()[1], token)
+
+async def login(host, port, username, password):
+    connection = Connection(host, port)
+    body = json.dumps({'username': username, 'password': password}).encode()
+    status, payload = await connection.request('POST', '/api/admin/login', body, {'Content-Type': 'application/json'})
+    connection.close()
+    if status != 200:
+        raise SystemExit(f'Admin login failed with {status}: {payload[:200]!r}')
+    return json.loads(payload)['access_token']
+
+async def client(host, port, token, deadline, results):
+    connection = Connection(host, port)
+    labels = [label for label, weight in MIX for _ in range(weight)]
+    try:
+        while time.perf_counter() < deadline:
+            label = random.choice(labels)
+            method, path, body, headers = build_request(label, token)
+            start = time.perf_counter()
+            try:
+                status, _ = await connection.request(method, path, body, headers)
+            except (OSError, asyncio.IncompleteReadError, IndexError, ValueError):
+                connection.close()
+                status = 'error'
+            results.append((label, status, time.perf_counter() - start))
+    finally:
+        connection.close()
+
+def percentile(latencies, fraction):
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+
+def report(clients, results, elapsed):
+    print(f'clients={clients}')
+    for label in [label for label, _ in MIX] + ['all']:
+        rows = [row for row in results if label in ('all', row[0])]
+        if not rows:
+            continue
+        latencies = sorted(row[2] for row in rows)
+        failed = {}
+        for row in rows:
+            if row[1] == 'error' or row[1] >= 400:
+                failed[row[1]] = failed.get(row[1], 0) + 1
+        print(f'  {label:<32} {len(rows) / elapsed:8.1f} req/s  p50={percentile(latencies, 0.5) * 1000:7.1f} ms'
+              f'  p99={percentile(latencies, 0.99) * 1000:7.1f} ms  failed={failed or 0}')
+
+async def run_load(host, port, clients, seconds, username, password):
+    token = await login(host, port, username, password)
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, token, start + seconds, results) for _ in range(clients)))
+    report(clients, results, time.perf_counter() - start)
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def wait_for(host, port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit('gunicorn exited during startup')
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit('gunicorn did not start listening in time')
+
+def self_hosted(client_counts, seconds):
+    app = make_app()
+    passwords.init_app(app)
+    with app.app_context():
+        prepare_database()
+        seed_registrations(SEED_ROWS)
+        seed_papers(SEED_ROWS)
+        seed_messages(SEED_ROWS)
+        # The seeded files do not exist; only the papers submitted during the run should be processed
+        db.session.execute(PaperSubmission.__table__.update().values(processing_status='done'))
+        db.session.commit()
+    port = free_port()
+    # Submitted papers, previews and the response cache stay out of the source tree
+    root = tempfile.mkdtemp(prefix='ichr2026_load_')
+    env = dict(os.environ, DATABASE_URL=app.config['SQLALCHEMY_DATABASE_URI'], APP_ROOT_PATH=root,
+               CACHE_SQLITE_PATH=os.path.join(root, 'response_cache.db'),
+               GUNICORN_BIND=f'127.0.0.1:{port}', GUNICORN_ACCESS_LOG='', GUNICORN_LOG_LEVEL='warning')
+    server = subprocess.Popen([sys.executable, '-m', 'gunicorn', 'src.wsgi:app'], cwd=BACKEND_DIR, env=env)
+    try:
+        wait_for('127.0.0.1', port, server)
+        for clients in client_counts:
+            asyncio.run(run_load('127.0.0.1', port, clients, seconds, 'admin', 'admin123'))
+    finally:
+        server.terminate()
+        server.wait(60)
+        remove_app(app)
+        shutil.rmtree(root, ignore_errors=True)
+
+if __name__ == '__main__':
+    urls = [arg for arg in sys.argv[1:] if arg.startswith(('http://', 'https://'))]
+    client_counts = parse_sizes(sys.argv[1:], [8, 32])
+    seconds = float(os.environ.get('LOAD_SECONDS', 15))
+    if urls:
+        target = urlsplit(urls[0])
+        for clients in client_counts:
+            asyncio.run(run_load(target.hostname, target.port or 80, clients, seconds,
+                                 os.environ.get('LOAD_USERNAME', 'admin'), os.environ.get('LOAD_PASSWORD', 'admin123')))
+    else:
+        self_hosted(client_counts, seconds)
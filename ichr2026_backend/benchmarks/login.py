@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark for admin logins.
+First times one password check per hash method and cost in a single
+thread. Then runs concurrent clients against /api/admin/login with the
+rate limiter off, for several PASSWORD_WORKERS settings, and reports
+logins per second, refused (503) attempts and the latency of a trivial
+request served while the logins are in flight. Finally shows the rate
+limiter turning away a burst of guesses for one username.
+
+Usage: python benchmarks/login.py [clients ...]   (default: 8 32)
+"""
+
+import sys
+import threading
+import time
+from common import make_app, remove_app, timed, parse_sizes
+from flask_jwt_extended import JWTManager
+from werkzeug.security import generate_password_hash
+from src.models.user import db
+from src.models.conference import AdminUser
+from src.routes.admin import admin_bp
+from src.services.passwords import passwords, argon2
+from src.services.ratelimit import login_limiter
+
+ATTEMPTS_PER_CLIENT = 8
+METHODS = [
+    ('pbkdf2 (werkzeug default)', {}, 'pbkdf2'),
+    ('scrypt n=2^14', {'PASSWORD_SCRYPT_N': 2 ** 14}, 'scrypt'),
+    ('scrypt n=2^15', {'PASSWORD_SCRYPT_N': 2 ** 15}, 'scrypt'),
+    ('argon2 t=3 m=64MiB', {'PASSWORD_HASH_METHOD': 'argon2'}, 'argon2'),
+    ('argon2 t=2 m=19MiB', {'PASSWORD_HASH_METHOD': 'argon2', 'PASSWORD_ARGON2_TIME_COST': 2,
+                            'PASSWORD_ARGON2_MEMORY_COST': 19 * 1024}, 'argon2'),
+]
+
+def build_app(**config):
+    app = make_app()
+    app.config['JWT_SECRET_KEY'] = 'ichr2026_login_benchmark_jwt_secret'
+    app.config.update(config)
+    JWTManager(app)
+    passwords.init_app(app)
+    login_limiter.init_app(app)
+    app.register_blueprint(admin_bp, url_prefix='/api')
+    app.add_url_rule('/ping', 'ping', lambda: 'pong')
+    with app.app_context():
+        db.session.add(AdminUser(username='admin', email='admin@example.org',
+                                 password_hash=passwords.hash_now('secret'), role='admin'))
+        db.session.commit()
+    return app
+
+def single_checks():
+    print('single-thread password checks')
+    for label, config, kind in METHODS:
+        if kind == 'argon2' and argon2 is None:
+            print(f'  {label:<28} skipped, argon2-cffi is not installed')
+            continue
+        app = build_app(**config)
+        try:
+            stored = generate_password_hash('secret', method='pbkdf2') if kind == 'pbkdf2' else passwords.hash_now('secret')
+            seconds, ok = timed(lambda: passwords.verify_now(stored, 'secret'), repeat=5)
+            assert ok
+            print(f'  {label:<28} {seconds * 1000:8.1f} ms/check  {1 / seconds:8.1f} checks/s')
+        finally:
+            remove_app(app)
+
+def login_storm(clients, workers):
+    app = build_app(PASSWORD_WORKERS=workers, PASSWORD_QUEUE=clients // 2, LOGIN_RATE_LIMIT_ENABLED=False)
+    outcomes = {}
+    pings = []
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def login_client():
+        client = app.test_client()
+        for _ in range(ATTEMPTS_PER_CLIENT):
+            status = client.post('/api/admin/login', json={'username': 'admin', 'password': 'secret'}).status_code
+            with lock:
+                outcomes[status] = outcomes.get(status, 0) + 1
+
+    def ping_client():
+        client = app.test_client()
+        while not done.is_set():
+            start = time.perf_counter()
+            client.get('/ping')
+            pings.append(time.perf_counter() - start)
+            time.sleep(0.01)
+
+    try:
+        threads = [threading.Thread(target=login_client) for _ in range(clients)]
+        pinger = threading.Thread(target=ping_client)
+        pinger.start()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        done.set()
+        pinger.join()
+
+        pings.sort()
+        p99 = pings[int(len(pings) * 0.99)] if pings else 0
+        print(f'  clients={clients:<3} workers={workers:<2} logins/s={outcomes.get(200, 0) / elapsed:7.1f}'
+              f'  refused={outcomes.get(503, 0):<4} ping p50={pings[len(pings) // 2] * 1000 if pings else 0:6.1f} ms'
+              f'  p99={p99 * 1000:6.1f} ms')
+    finally:
+        remove_app(app)
+
+def limiter_burst():
+    app = build_app(PASSWORD_SCRYPT_N=2 ** 14)
+    try:
+        client = app.test_client()
+        statuses = [client.post('/api/admin/login', json={'username': 'admin', 'password': 'guess'}).status_code
+                    for _ in range(20)]
+        counts = {status: statuses.count(status) for status in sorted(set(statuses))}
+        print(f'  20 wrong passwords for one username: {counts}')
+    finally:
+        remove_app(app)
+
+if __name__ == '__main__':
+    single_checks()
+    print('concurrent logins (scrypt n=2^15)')
+    for clients in parse_sizes(sys.argv[1:], [8, 32]):
+        for workers in (1, 2, 4):
+            login_storm(clients, workers)
+    print('rate limiter')
+    limiter_burst()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark for list pagination.
+Times OFFSET pagination (with its COUNT(*)) against keyset pagination on
+(created_at, id) at increasing page depths.
+
+Usage: python benchmarks/pagination.py [rows ...]   (default: 10000 100000 1000000)
+"""
+
+import sys
+from common import make_app, remove_app, seed_registrations, QueryCounter, timed, parse_sizes
+from src.models.user import db
+from src.models.conference import Registration
+from src.services.pagination import keyset_page, encode_cursor
+
+PER_PAGE = 20
+
+def offset_page(page):
+    return Registration.query.order_by(Registration.created_at.desc()).paginate(
+        page=page, per_page=PER_PAGE, error_out=False
+    ).items
+
+def run(rows):
+    app = make_app()
+    try:
+        with app.app_context():
+            seed_registrations(rows)
+            for fraction in (0, 0.5, 0.99):
+                offset = int(rows * fraction) // PER_PAGE * PER_PAGE
+                page = offset // PER_PAGE + 1
+
+                # Cursor pointing at the last row of the previous page
+                cursor = ''
+                if offset:
+                    previous = Registration.query.order_by(
+                        Registration.created_at.desc(), Registration.id.desc()
+                    ).offset(offset - 1).first()
+                    cursor = encode_cursor(previous)
+
+                for name, fn in (
+                    ('offset', lambda: offset_page(page)),
+                    ('keyset', lambda: keyset_page(Registration.query, Registration, cursor, PER_PAGE)),
+                ):
+                    with QueryCounter(db.engine) as counter:
+                        fn()
+                    seconds, _ = timed(fn, repeat=3)
+                    print(f"  page {page:<7} {name:<7} queries={counter.count} best={seconds * 1000:9.2f} ms")
+    finally:
+        remove_app(app)
+
+if __name__ == '__main__':
+    for rows in parse_sizes(sys.argv[1:], [10000, 100000, 1000000]):
+        print(f"{rows} registrations")
+        run(rows)
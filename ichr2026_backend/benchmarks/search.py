@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the admin search.
+Times the first page plus match count of a few search terms using the
+original ILIKE filters, then again through the FTS5 indexes created by
+migration v003.
+
+Usage: python benchmarks/search.py [rows ...]   (default: 10000 100000 1000000)
+"""
+
+import sys
+from common import make_app, remove_app, seed_registrations, seed_papers, seed_messages, timed, parse_sizes
+from src.models.user import db
+from src.models.conference import Registration, PaperSubmission, ContactMessage
+from src.services.search import SEARCH_INDEXES, apply_search
+from src.migrations import v003_fulltext_search
+
+PER_PAGE = 10
+
+def search_terms(rows):
+    return [
+        (Registration, f'Registrant {rows // 3}'),
+        (Registration, 'University 42'),
+        (PaperSubmission, f'harmony part {rows // 8}'),
+        (PaperSubmission, 'harmony'),
+        (ContactMessage, 'hotel'),
+    ]
+
+def first_page(query, model):
+    total = query.order_by(None).count()
+    items = query.order_by(model.created_at.desc()).limit(PER_PAGE).all()
+    return total, len(items)
+
+def report(label, rows):
+    print(f"  -- {label}")
+    for model, term in search_terms(rows):
+        seconds, (total, _) = timed(lambda: first_page(apply_search(model.query, model, term), model), repeat=3)
+        print(f"  {model.__tablename__:<18} {term!r:<22} matches={total:<8} best={seconds * 1000:9.2f} ms")
+
+def run(rows):
+    app = make_app()
+    try:
+        with app.app_context():
+            seed_registrations(rows)
+            seed_papers(rows // 4)
+            seed_messages(rows // 4)
+
+            report('ILIKE scan', rows)
+            seconds, _ = timed(lambda: _build_indexes(), repeat=1)
+            print(f"  migration v003 (index {rows + rows // 2} rows) {seconds * 1000:9.2f} ms")
+            report('FTS5 prefix match', rows)
+    finally:
+        remove_app(app)
+
+def _build_indexes():
+    with db.engine.begin() as connection:
+        v003_fulltext_search.upgrade(connection)
+
+if __name__ == '__main__':
+    for rows in parse_sizes(sys.argv[1:], [10000, 100000, 1000000]):
+        print(f"{rows} registrations ({rows // 4} papers, {rows // 4} messages)")
+        run(rows)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark for list serialization.
+For each model and profile, times building the response body from ORM
+instances with to_dict() and the standard library encoder against the
+compiled row serializers over plain column rows with orjson, and reports
+rows per second for fetching and serializing, encoding, and both together.
+Every run also checks that the compiled output equals to_dict().
+
+Usage: python benchmarks/serialization.py [rows ...]   (default: 10000 100000)
+"""
+
+import sys
+from common import (
+    make_app, remove_app, seed_registrations, seed_papers, seed_messages, timed, parse_sizes
+)
+from flask.json.provider import DefaultJSONProvider
+from src.models.user import db
+from src.models.conference import Registration, PaperSubmission, ContactMessage
+from src.services.serializers import row_serializer
+from src.services.json_provider import OrjsonProvider, orjson
+
+CASES = [
+    (Registration, 'detail', seed_registrations),
+    (PaperSubmission, 'summary', seed_papers),
+    (PaperSubmission, 'detail', seed_papers),
+    (ContactMessage, 'summary', seed_messages),
+    (ContactMessage, 'detail', seed_messages),
+]
+
+def orm_dicts(model, keys):
+    rows = model.query.options(db.undefer_group('detail')).order_by(model.id).all()
+    dicts = [row.to_dict() for row in rows]
+    db.session.expunge_all()
+    if keys is None:
+        return dicts
+    return [{key: item[key] for key in keys} for item in dicts]
+
+def compiled_dicts(model, profile):
+    serializer = row_serializer(model, profile)
+    return serializer.dump(serializer.select(model.query).order_by(model.id).all())
+
+def encode(provider, data):
+    return provider.response({'success': True, 'data': data}).get_data()
+
+def check(model, profile):
+    compiled = compiled_dicts(model, profile)
+    keys = list(compiled[0]) if profile != 'detail' else None
+    expected = orm_dicts(model, keys)
+    if compiled != expected:
+        raise AssertionError(f'{model.__tablename__}.{profile}: compiled output differs from to_dict()')
+    if profile == 'detail' and list(compiled[0]) != list(expected[0]):
+        raise AssertionError(f'{model.__tablename__}.{profile}: key order differs from to_dict()')
+    return keys
+
+def run(rows):
+    app = make_app()
+    stdlib = DefaultJSONProvider(app)
+    fast = OrjsonProvider(app) if orjson is not None else stdlib
+    if orjson is None:
+        print('  orjson is not installed; both columns use the standard library encoder')
+    try:
+        with app.app_context():
+            seeded = set()
+            for model, profile, seed in CASES:
+                if model not in seeded:
+                    seed(rows)
+                    seeded.add(model)
+                keys = check(model, profile)
+
+                before_build, before = timed(lambda: orm_dicts(model, keys), repeat=3)
+                after_build, after = timed(lambda: compiled_dicts(model, profile), repeat=3)
+                before_encode, body = timed(lambda: encode(stdlib, before), repeat=3)
+                after_encode, _ = timed(lambda: encode(fast, after), repeat=3)
+
+                name = f'{model.__tablename__}.{profile}'
+                for label, build, encoded in (
+                    ('to_dict+json', before_build, before_encode),
+                    ('compiled+orjson', after_build, after_encode),
+                ):
+                    print(
+                        f"  {name:<26} {label:<16} build={rows / build:10,.0f} rows/s"
+                        f"  encode={rows / encoded:10,.0f} rows/s  total={rows / (build + encoded):10,.0f} rows/s"
+                    )
+                print(f"  {name:<26} {'body':<16} {len(body) / rows:,.0f} bytes/row")
+    finally:
+        remove_app(app)
+
+if __name__ == '__main__':
+    for rows in parse_sizes(sys.argv[1:], [10000, 100000]):
+        print(f"{rows} rows per model")
+        run(rows)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark for application startup.
+Starts fresh interpreters against a prepared temporary database and
+reports the time to import src.main, to build the app with create_app(),
+to serve the first request and the total until that first response. The
+same is measured for the old eager startup, which imported the optional
+Parquet and PDF libraries and prepared the database (migrations, default
+admin, counters) before serving. Finally shows what
+the optional Parquet and PDF dependencies cost when they are first used
+instead of at import.
+
+Usage: python benchmarks/startup.py [runs]   (default: 5)
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from common import make_app, remove_app, parse_sizes
+from src.migrations.runner import prepare_database
+from src.services.passwords import passwords
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP = """
+import json, sys, time
+start = time.perf_counter()
+import src.main
+imported = time.perf_counter()
+app = src.main.create_app({'SQLALCHEMY_DATABASE_URI': sys.argv[1], 'JOB_AUTOSTART': False})
+if sys.argv[2] == 'eager':
+    # What the module-level app used to do before answering anything
+    from src.migrations.runner import prepare_database
+    from src.services import export, document_extract
+    if export.PYARROW_AVAILABLE:
+        export._pyarrow()
+    try:
+        document_extract._pymupdf()
+    except document_extract.UnsupportedDocument:
+        pass
+    with app.app_context():
+        prepare_database()
+created = time.perf_counter()
+status = app.test_client().get('/api/registration/stats').status_code
+served = time.perf_counter()
+heavy = sorted(name for name in ('pyarrow', 'pymupdf', 'fitz', 'numpy') if name in sys.modules)
+print(json.dumps({'import': imported - start, 'create_app': created - imported, 'first_request': served - created,
+                  'total': served - start, 'status': status, 'heavy': heavy}))
+"""
+
+OPTIONAL_IMPORTS = [
+    ('pyarrow (Parquet export)', 'import pyarrow, pyarrow.parquet'),
+    ('pymupdf (PDF processing)', 'import pymupdf'),
+]
+
+def run(code, *args):
+    output = subprocess.run([sys.executable, '-c', code, *args], cwd=BACKEND_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def startup(uri, mode, runs):
+    samples = [run(STARTUP, uri, mode) for _ in range(runs)]
+    assert all(sample['status'] == 200 for sample in samples), samples
+    median = {key: statistics.median(sample[key] for sample in samples)
+              for key in ('import', 'create_app', 'first_request', 'total')}
+    print(f'  {mode:<5} import={median["import"] * 1000:7.1f} ms  create_app={median["create_app"] * 1000:7.1f} ms'
+          f'  first request={median["first_request"] * 1000:7.1f} ms  total={median["total"] * 1000:7.1f} ms'
+          f'  heavy modules loaded: {", ".join(samples[0]["heavy"]) or "none"}')
+
+def optional_imports(runs):
+    for label, statement in OPTIONAL_IMPORTS:
+        code = f'import json, time\nstart = time.perf_counter()\n{statement}\nprint(json.dumps(time.perf_counter() - start))'
+        try:
+            seconds = statistics.median(run(code) for _ in range(runs))
+        except subprocess.CalledProcessError:
+            print(f'  {label:<26} not installed')
+            continue
+        print(f'  {label:<26} {seconds * 1000:7.1f} ms on first use')
+
+if __name__ == '__main__':
+    runs = parse_sizes(sys.argv[1:], [5])[0]
+    app = make_app()
+    passwords.init_app(app)
+    try:
+        with app.app_context():
+            prepare_database()
+        uri = app.config['SQLALCHEMY_DATABASE_URI']
+        print(f'startup to first response, median of {runs} runs')
+        startup(uri, 'lazy', runs)
+        startup(uri, 'eager', runs)
+        print('deferred optional imports')
+        optional_imports(runs)
+    finally:
+        remove_app(app)
@@ -0,0 +1,51 @@
+"""Gunicorn settings for serving the backend in production; each can be overridden with a GUNICORN_* variable"""
+
+import multiprocessing
+import os
+
+# Read by create_app() when the master loads the app; with one shared cache a write in any worker invalidates it for all
+os.environ.setdefault('CACHE_BACKEND', 'sqlite')
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5002')
+# Requests mostly wait on SQLite, the password hashing pool or the socket, so a few threads per
+# process serve more than extra processes, each of which keeps its own denylist, job workers and pool
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+# Built once in the master without opening a database connection; background threads start in each
+# worker with its first request
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# Exports and paper uploads can keep a request busy for a while
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+
+# Recycle workers now and then so slow leaks cannot build up; the jitter keeps them from restarting together
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 5000))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+def post_fork(server, worker):
+    """Give the worker its own connection pool instead of the master's"""
+    from src.models.user import db
+    from src.wsgi import app
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+def worker_exit(server, worker):
+    """Let running jobs finish while the worker shuts down"""
+    from src.services.auth import token_denylist
+    from src.services.jobs import job_queue
+    token_denylist.stop()
+    job_queue.stop(timeout=graceful_timeout)
+
+def when_ready(server):
+    """Warn when each worker would keep a response cache of its own"""
+    if os.environ['CACHE_BACKEND'] == 'memory' and server.cfg.workers > 1:
+        server.log.warning('CACHE_BACKEND=memory with %d workers: a write only invalidates the cache of the worker '
+                           'that handled it; the others serve stale responses for up to CACHE_DEFAULT_TTL seconds',
+                           server.cfg.workers)
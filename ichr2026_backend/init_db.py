@@ -13,12 +13,14 @@ from src.models.conference import (
     Registration, PaperSubmission, ContactMessage, 
     ConferenceSettings, AdminUser
 )
-from src.main import app
-from werkzeug.security import generate_password_hash
+from src.main import create_app
+from src.migrations.runner import upgrade_database
+from src.services.passwords import passwords
 from datetime import datetime
 
 def init_database():
     """Initialize the database with all tables and initial data"""
+    app = create_app()
     
     with app.app_context():
         print("Creating database tables...")
@@ -26,8 +28,8 @@ def init_database():
         # Drop all tables first (for clean initialization)
         db.drop_all()
         
-        # Create all tables
-        db.create_all()
+        # Create all tables through the versioned migrations
+        upgrade_database()
         
         print("Database tables created successfully!")
         
@@ -35,7 +37,7 @@ def init_database():
         admin_user = AdminUser(
             username='admin',
             email='admin@ichr2026.com',
-            password_hash=generate_password_hash('admin123'),
+            password_hash=passwords.hash_now('admin123'),
             role='admin'
         )
         db.session.add(admin_user)
@@ -3,61 +3,118 @@ import sys
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from flask import Flask, send_from_directory
-from flask_cors import CORS
-from flask_jwt_extended import JWTManager
 from datetime import timedelta
-from src.models.user import db
-from src.models.conference import Registration, PaperSubmission, ContactMessage, ConferenceSettings, AdminUser
-from src.routes.user import user_bp
-from src.routes.registration import registration_bp
-from src.routes.papers import papers_bp
-from src.routes.contact import contact_bp
-from src.routes.admin import admin_bp
-
-app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
-app.config['SECRET_KEY'] = 'ichr2026_conference_secret_key_2025'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-
-# JWT Configuration
-app.config['JWT_SECRET_KEY'] = 'ichr2026_jwt_secret_key_2025'
-app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(hours=1)
-app.config['JWT_REFRESH_TOKEN_EXPIRES'] = timedelta(days=30)
-jwt = JWTManager(app)
-
-# Enable CORS for frontend integration
-CORS(app, origins=['http://localhost:3000', 'http://localhost:5173'], supports_credentials=True)
-
-app.register_blueprint(user_bp, url_prefix='/api')
-app.register_blueprint(registration_bp, url_prefix='/api')
-app.register_blueprint(papers_bp, url_prefix='/api')
-app.register_blueprint(contact_bp, url_prefix='/api')
-app.register_blueprint(admin_bp, url_prefix='/api')
-
-# uncomment if you need to use database
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db.init_app(app)
-with app.app_context():
-    db.create_all()
-    
-    # Create default admin user if not exists
-    admin = AdminUser.query.filter_by(username='admin').first()
-    if not admin:
-        from werkzeug.security import generate_password_hash
-        default_admin = AdminUser(
-            username='admin',
-            email='admin@ichr2026.org',
-            password_hash=generate_password_hash('admin123'),
-            role='admin'
-        )
-        db.session.add(default_admin)
-        db.session.commit()
-
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
+from flask import Flask, current_app, send_from_directory
+
+DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'database', 'app.db')
+
+def create_app(config=None):
+    """Build the application without touching the database; `flask db upgrade` prepares the schema"""
+    # Imported here so that importing this module (e.g. by a process manager) stays cheap
+    from flask_cors import CORS
+    from flask_jwt_extended import JWTManager
+    from src.services.database import init_database
+    from src.services.counters import stats_cli
+    from src.services.cache import response_cache
+    from src.services.jobs import job_queue, jobs_cli
+    from src.services.mail import init_mail_config
+    from src.services.downloads import init_download_config
+    from src.services.documents import init_document_config
+    from src.services.json_provider import init_json_provider
+    from src.services.passwords import passwords
+    from src.services.ratelimit import login_limiter
+    from src.services.auth import token_denylist
+    from src.migrations.runner import db_cli
+
+    app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+    # Uploaded papers are stored under the root path (src/ unless APP_ROOT_PATH points elsewhere)
+    if os.environ.get('APP_ROOT_PATH'):
+        app.root_path = os.environ['APP_ROOT_PATH']
+    app.config['SECRET_KEY'] = 'ichr2026_conference_secret_key_2025'
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', f"sqlite:///{DATABASE_PATH}")
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    # JWT Configuration
+    app.config['JWT_SECRET_KEY'] = 'ichr2026_jwt_secret_key_2025'
+    app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(hours=1)
+    app.config['JWT_REFRESH_TOKEN_EXPIRES'] = timedelta(days=30)
+
+    # Revocation (deactivated admins, logouts) is checked against an in-memory denylist reloaded every few seconds
+    app.config['AUTH_DENYLIST_REFRESH'] = 5
+
+    # Admin passwords: 'scrypt' or 'argon2' (argon2-cffi), checked on a bounded pool of hashing threads
+    app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+
+    # Login attempts per client address and per username, refilled over LOGIN_RATE_WINDOW seconds
+    app.config['LOGIN_ATTEMPTS_PER_IP'] = 20
+    app.config['LOGIN_ATTEMPTS_PER_USERNAME'] = 5
+
+    # Response cache for read-heavy endpoints ('sqlite' shares entries across workers)
+    app.config['CACHE_BACKEND'] = os.environ.get('CACHE_BACKEND', 'memory')
+    app.config['CACHE_DEFAULT_TTL'] = 60
+    if os.environ.get('CACHE_SQLITE_PATH'):
+        app.config['CACHE_SQLITE_PATH'] = os.environ['CACHE_SQLITE_PATH']
+
+    # Background jobs (exports, bulk email) run on worker threads, started by the first request
+    app.config['JOB_WORKERS'] = 2
+    app.config['JOB_CONCURRENCY'] = 2
+
+    # Outgoing mail ('null' discards; 'smtp' sends through MAIL_SERVER:MAIL_PORT)
+    app.config['MAIL_BACKEND'] = os.environ.get('MAIL_BACKEND', 'null')
+    app.config['MAIL_SERVER'] = os.environ.get('MAIL_SERVER', 'localhost')
+    app.config['MAIL_PORT'] = int(os.environ.get('MAIL_PORT', 25))
+    app.config['MAIL_CONNECTIONS'] = 4
+    app.config['MAIL_RATE_LIMIT'] = 50  # messages per second
+
+    # Paper downloads: let the reverse proxy send the bytes ('x-accel-redirect' for nginx, 'x-sendfile' for Apache)
+    app.config['FILE_OFFLOAD'] = os.environ.get('FILE_OFFLOAD') or None
+
+    if config:
+        app.config.update(config)
+
+    # JSON responses are encoded with orjson when it is installed
+    init_json_provider(app)
+    jwt = JWTManager(app)
+    token_denylist.init_app(app, jwt)
+    passwords.init_app(app)
+    login_limiter.init_app(app)
+    response_cache.init_app(app)
+    job_queue.init_app(app)
+    init_mail_config(app)
+    init_download_config(app)
+    # Paper processing (page count, text, preview) runs in a process pool from the job workers
+    init_document_config(app)
+    # SQLite runs in WAL mode with a busy timeout, so concurrent writers queue instead of failing
+    init_database(app)
+
+    # Enable CORS for frontend integration
+    CORS(app, origins=['http://localhost:3000', 'http://localhost:5173'], supports_credentials=True,
+         expose_headers=['Location', 'Upload-Offset', 'Upload-Length', 'Upload-Chunk-Size',
+                         'Content-Range', 'Accept-Ranges', 'ETag', 'Content-Disposition'])
+
+    register_blueprints(app)
+    app.cli.add_command(stats_cli)
+    app.cli.add_command(db_cli)
+    app.cli.add_command(jobs_cli)
+
+    app.add_url_rule('/', 'serve', serve, defaults={'path': ''})
+    app.add_url_rule('/<path:path>', 'serve', serve)
+    return app
+
+def register_blueprints(app):
+    """Import the route modules and mount them under /api"""
+    from src.routes.user import user_bp
+    from src.routes.registration import registration_bp
+    from src.routes.papers import papers_bp
+    from src.routes.contact import contact_bp
+    from src.routes.admin import admin_bp
+
+    for blueprint in (user_bp, registration_bp, papers_bp, contact_bp, admin_bp):
+        app.register_blueprint(blueprint, url_prefix='/api')
+
 def serve(path):
-    static_folder_path = app.static_folder
+    static_folder_path = current_app.static_folder
     if static_folder_path is None:
             return "Static folder not configured", 404
 
@@ -72,4 +129,10 @@ def serve(path):
 
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5002, debug=True)
\ No newline at end of file
+    from src.migrations.runner import prepare_database
+    app = create_app()
+    # Development server only: production runs `gunicorn src.wsgi:app` (see gunicorn.conf.py)
+    # after `flask --app src.main db upgrade`; here the database is prepared on startup
+    with app.app_context():
+        prepare_database()
+    app.run(host='0.0.0.0', port=5002, debug=True)
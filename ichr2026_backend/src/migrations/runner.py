@@ -0,0 +1,103 @@
+"""Versioned schema migrations (vNNN_<name>.py modules, recorded in schema_migrations)"""
+
+import importlib
+import os
+import pkgutil
+import re
+from datetime import datetime
+import click
+from flask.cli import AppGroup
+from src.models.user import db
+
+MIGRATION_PATTERN = re.compile(r'^v(\d{3})_\w+$')
+
+schema_migrations = db.Table(
+    'schema_migrations',
+    db.Column('version', db.Integer, primary_key=True),
+    db.Column('name', db.String(100), nullable=False),
+    db.Column('applied_at', db.DateTime, nullable=False)
+)
+
+def available_migrations():
+    """(version, name, module) for every migration module, in version order"""
+    migrations = []
+    for module_info in pkgutil.iter_modules([os.path.dirname(__file__)]):
+        match = MIGRATION_PATTERN.match(module_info.name)
+        if match:
+            module = importlib.import_module(f'src.migrations.{module_info.name}')
+            migrations.append((int(match.group(1)), module_info.name, module))
+    return sorted(migrations, key=lambda migration: migration[0])
+
+def applied_versions(connection):
+    schema_migrations.create(connection, checkfirst=True)
+    return {row.version for row in connection.execute(db.select(schema_migrations.c.version))}
+
+def upgrade_database(target=None):
+    """Apply every pending migration up to target, each in its own transaction"""
+    applied = []
+    with db.engine.connect() as connection:
+        with connection.begin():
+            done = applied_versions(connection)
+        for version, name, module in available_migrations():
+            if version in done or (target is not None and version > target):
+                continue
+            with connection.begin():
+                module.upgrade(connection)
+                connection.execute(schema_migrations.insert().values(
+                    version=version, name=name, applied_at=datetime.utcnow()
+                ))
+            applied.append(name)
+    return applied
+
+def pending_migrations():
+    """Names of the migrations not applied yet"""
+    return [name for version, name, applied_at in migration_status() if applied_at is None]
+
+def prepare_database():
+    """Apply pending migrations and seed the default admin and statistics counters"""
+    from src.services.auth import ensure_default_admin
+    from src.services.counters import ensure_counters
+    applied = upgrade_database()
+    ensure_default_admin()
+    ensure_counters()
+    return applied
+
+def migration_status():
+    """(version, name, applied_at or None) for every known migration"""
+    with db.engine.connect() as connection:
+        with connection.begin():
+            applied_versions(connection)
+        applied = {
+            row.version: row.applied_at
+            for row in connection.execute(db.select(schema_migrations))
+        }
+    return [(version, name, applied.get(version)) for version, name, module in available_migrations()]
+
+db_cli = AppGroup('db', help='Manage the database schema.')
+
+@db_cli.command('upgrade')
+@click.option('--target', type=int, default=None, help='Stop after this migration version.')
+def upgrade_command(target):
+    """Apply pending schema migrations and seed a fresh database."""
+    applied = upgrade_database(target) if target is not None else prepare_database()
+    for name in applied:
+        click.echo(f'Applied {name}')
+    if not applied:
+        click.echo('Database schema is up to date')
+
+@db_cli.command('status')
+def status_command():
+    """List schema migrations and whether they are applied."""
+    for version, name, applied_at in migration_status():
+        state = applied_at.isoformat() if applied_at else 'pending'
+        click.echo(f'{name:<40} {state}')
+
+@db_cli.command('check')
+def check_command():
+    """Exit non-zero while schema migrations are pending."""
+    pending = pending_migrations()
+    for name in pending:
+        click.echo(f'Pending {name}')
+    if pending:
+        raise SystemExit(f'{len(pending)} migrations pending; run `flask db upgrade`')
+    click.echo('Database schema is up to date')
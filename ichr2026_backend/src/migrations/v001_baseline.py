@@ -0,0 +1,7 @@
+"""Create the tables declared by the models (no-op on existing databases)"""
+
+from src.models.user import db
+import src.models.conference  # noqa: F401  registers the conference tables
+
+def upgrade(connection):
+    db.metadata.create_all(connection, checkfirst=True)
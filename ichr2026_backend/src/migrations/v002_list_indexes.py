@@ -0,0 +1,26 @@
+"""Secondary indexes for the filtered and sorted list columns"""
+
+from src.models.conference import Registration, PaperSubmission, ContactMessage
+
+INDEX_NAMES = {
+    'ix_registrations_status_created_at',
+    'ix_registrations_category_created_at',
+    'ix_registrations_created_at_id',
+    'ix_registrations_email',
+    'ix_paper_submissions_status_created_at',
+    'ix_paper_submissions_category_created_at',
+    'ix_paper_submissions_created_at_id',
+    'ix_paper_submissions_author_email',
+    'ix_contact_messages_status_created_at',
+    'ix_contact_messages_created_at_id',
+    'ix_contact_messages_email',
+    'ix_contact_messages_subject',
+}
+
+def upgrade(connection):
+    for model in (Registration, PaperSubmission, ContactMessage):
+        for index in model.__table__.indexes:
+            if index.name in INDEX_NAMES:
+                index.create(connection, checkfirst=True)
+    # Refresh planner statistics so SQLite picks the new indexes
+    connection.exec_driver_sql('ANALYZE')
@@ -0,0 +1,28 @@
+"""FTS5 full-text indexes for the admin search over registrations, papers and messages"""
+
+from src.services.search import create_search_indexes
+
+# The indexes as they were at this version; later migrations rebuild them with more columns
+V003_INDEXES = {
+    'registrations': (
+        'registrations_fts',
+        ('full_name', 'email', 'affiliation'),
+        ('full_name', 'email', 'affiliation')
+    ),
+    'paper_submissions': (
+        'paper_submissions_fts',
+        ('title', 'abstract', 'keywords', 'authors', 'corresponding_author_email'),
+        ('title', 'authors', 'corresponding_author_email')
+    ),
+    'contact_messages': (
+        'contact_messages_fts',
+        ('name', 'email', 'subject', 'message'),
+        ('name', 'email', 'subject')
+    ),
+}
+
+def upgrade(connection):
+    # Virtual tables and triggers are SQLite-specific; other databases keep ILIKE search
+    if connection.dialect.name != 'sqlite':
+        return
+    create_search_indexes(connection, V003_INDEXES)
@@ -0,0 +1,41 @@
+"""Stored, indexed subject category for contact messages, backfilled from the subject keywords"""
+
+from src.models.user import db
+from src.models.conference import (
+    ContactMessage, StatsCounter, CONTACT_SUBJECT_KEYWORDS, OTHER_SUBJECT_CATEGORY
+)
+
+def upgrade(connection):
+    messages = ContactMessage.__table__
+    columns = {column['name'] for column in db.inspect(connection).get_columns('contact_messages')}
+    if 'subject_category' not in columns:
+        connection.exec_driver_sql('ALTER TABLE contact_messages ADD COLUMN subject_category VARCHAR(30)')
+    for index in messages.indexes:
+        if index.name == 'ix_contact_messages_subject_category_created_at':
+            index.create(connection, checkfirst=True)
+
+    # Backfill in category order so the first matching category wins, as in classify_subject()
+    pending = messages.c.subject_category.is_(None)
+    for category, keywords in CONTACT_SUBJECT_KEYWORDS.items():
+        matches = [db.func.lower(messages.c.subject).contains(keyword) for keyword in keywords]
+        connection.execute(
+            messages.update().where(pending, db.or_(*matches)).values(subject_category=category)
+        )
+    connection.execute(messages.update().where(pending).values(subject_category=OTHER_SUBJECT_CATEGORY))
+    connection.exec_driver_sql('ANALYZE contact_messages')
+
+    # Subject counters used to be one bucket per matching keyword group; regroup them by category
+    counters = StatsCounter.__table__
+    if connection.execute(db.select(counters.c.id).limit(1)).first() is None:
+        return
+    connection.execute(counters.delete().where(
+        counters.c.entity == 'message', counters.c.dimension == 'subject'
+    ))
+    day = db.func.date(messages.c.created_at)
+    connection.execute(counters.insert().from_select(
+        ['entity', 'dimension', 'value', 'day', 'count', 'amount'],
+        db.select(
+            db.literal('message'), db.literal('subject'), messages.c.subject_category,
+            day, db.func.count(), db.literal(0)
+        ).group_by(messages.c.subject_category, day)
+    ))
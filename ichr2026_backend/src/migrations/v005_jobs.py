@@ -0,0 +1,8 @@
+"""Jobs table for the background job queue"""
+
+from src.models.conference import Job
+
+def upgrade(connection):
+    Job.__table__.create(connection, checkfirst=True)
+    for index in Job.__table__.indexes:
+        index.create(connection, checkfirst=True)
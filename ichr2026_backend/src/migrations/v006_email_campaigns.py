@@ -0,0 +1,6 @@
+"""Email campaigns table holding bulk email content and resume checkpoints"""
+
+from src.models.conference import EmailCampaign
+
+def upgrade(connection):
+    EmailCampaign.__table__.create(connection, checkfirst=True)
@@ -0,0 +1,10 @@
+"""Content hash of paper files and the resumable paper uploads table"""
+
+from src.models.user import db
+from src.models.conference import PaperUpload
+
+def upgrade(connection):
+    columns = {column['name'] for column in db.inspect(connection).get_columns('paper_submissions')}
+    if 'file_sha256' not in columns:
+        connection.exec_driver_sql('ALTER TABLE paper_submissions ADD COLUMN file_sha256 VARCHAR(64)')
+    PaperUpload.__table__.create(connection, checkfirst=True)
@@ -0,0 +1,43 @@
+"""Content-addressed paper file storage: move existing files into the blob store and count references"""
+
+import os
+from datetime import datetime
+from src.models.user import db
+from src.models.conference import FileBlob, PaperSubmission
+from src.services.blobs import blob_path, blob_root, file_sha256
+
+def upgrade(connection):
+    blobs = FileBlob.__table__
+    papers = PaperSubmission.__table__
+    blobs.create(connection, checkfirst=True)
+
+    root = blob_root()
+    rows = connection.execute(
+        db.select(papers.c.id, papers.c.file_path, papers.c.file_sha256).where(papers.c.file_path.isnot(None))
+    ).all()
+    for row in rows:
+        if row.file_path.startswith(root + os.sep) or not os.path.exists(row.file_path):
+            continue
+        sha256 = row.file_sha256 or file_sha256(row.file_path)
+        path = blob_path(sha256, root)
+        if os.path.exists(path):
+            os.remove(row.file_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(row.file_path, path)
+        connection.execute(papers.update().where(papers.c.id == row.id).values(
+            file_path=path, file_sha256=sha256, file_size=os.path.getsize(path)
+        ))
+
+    # Reference counts from the submissions now pointing into the store
+    connection.execute(blobs.delete())
+    now = datetime.utcnow()
+    connection.execute(blobs.insert().from_select(
+        ['sha256', 'size', 'ref_count', 'created_at', 'updated_at'],
+        db.select(
+            papers.c.file_sha256, db.func.coalesce(db.func.max(papers.c.file_size), 0), db.func.count(),
+            db.literal(now), db.literal(now)
+        ).where(
+            papers.c.file_sha256.isnot(None), papers.c.file_path.startswith(root + os.sep, autoescape=True)
+        ).group_by(papers.c.file_sha256)
+    ))
@@ -0,0 +1,33 @@
+"""Document processing columns on paper submissions, with the extracted text added to paper search"""
+
+from src.models.user import db
+from src.models.conference import PaperSubmission
+from src.services.search import SEARCH_INDEXES, create_search_indexes, drop_search_index
+
+NEW_COLUMNS = {
+    'processing_status': "VARCHAR(20) NOT NULL DEFAULT 'pending'",
+    'processing_error': 'TEXT',
+    'page_count': 'INTEGER',
+    'document_text': 'TEXT',
+    'thumbnail_path': 'VARCHAR(500)',
+    'processed_at': 'DATETIME',
+}
+
+def upgrade(connection):
+    papers = PaperSubmission.__table__
+    columns = {column['name'] for column in db.inspect(connection).get_columns('paper_submissions')}
+    for name, definition in NEW_COLUMNS.items():
+        if name not in columns:
+            connection.exec_driver_sql(f'ALTER TABLE paper_submissions ADD COLUMN {name} {definition}')
+    for index in papers.indexes:
+        if index.name == 'ix_paper_submissions_processing_status_id':
+            index.create(connection, checkfirst=True)
+
+    # Submissions without a file have nothing to process
+    connection.execute(papers.update().where(
+        papers.c.file_path.is_(None), papers.c.processing_status == 'pending'
+    ).values(processing_status='unsupported'))
+
+    if connection.dialect.name == 'sqlite':
+        drop_search_index(connection, 'paper_submissions')
+        create_search_indexes(connection, {'paper_submissions': SEARCH_INDEXES['paper_submissions']})
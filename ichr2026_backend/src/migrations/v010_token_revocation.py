@@ -0,0 +1,12 @@
+"""Token version of admin users and the revoked tokens table"""
+
+from src.models.user import db
+from src.models.conference import RevokedToken
+
+def upgrade(connection):
+    columns = {column['name'] for column in db.inspect(connection).get_columns('admin_users')}
+    if 'token_version' not in columns:
+        connection.exec_driver_sql('ALTER TABLE admin_users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 1')
+    RevokedToken.__table__.create(connection, checkfirst=True)
+    for index in RevokedToken.__table__.indexes:
+        index.create(connection, checkfirst=True)
@@ -0,0 +1,20 @@
+"""Rebuild admin_users with AUTOINCREMENT so deleted admin ids are never handed out again"""
+
+from src.models.user import db
+from src.models.conference import AdminUser
+
+def upgrade(connection):
+    if connection.dialect.name != 'sqlite':
+        return
+    sql = connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'admin_users'"
+    ).scalar()
+    if sql is None or 'AUTOINCREMENT' in sql.upper():
+        return
+    connection.exec_driver_sql('ALTER TABLE admin_users RENAME TO admin_users_old')
+    for index in db.inspect(connection).get_indexes('admin_users_old'):
+        connection.exec_driver_sql(f'DROP INDEX "{index["name"]}"')
+    AdminUser.__table__.create(connection)
+    columns = ', '.join(column.name for column in AdminUser.__table__.columns)
+    connection.exec_driver_sql(f'INSERT INTO admin_users ({columns}) SELECT {columns} FROM admin_users_old')
+    connection.exec_driver_sql('DROP TABLE admin_users_old')
@@ -1,5 +1,7 @@
+import json
 from datetime import datetime
 from enum import Enum
+from sqlalchemy.orm import validates
 from src.models.user import db
 
 class RegistrationCategory(Enum):
@@ -27,8 +29,53 @@ class PaperStatus(Enum):
     REJECTED = 'rejected'
     REVISION_REQUIRED = 'revision_required'
 
+# Contact message workflow states
+MESSAGE_STATUSES = ['new', 'read', 'responded', 'closed']
+
+# Background job lifecycle states
+JOB_STATUSES = ['queued', 'running', 'succeeded', 'failed']
+
+# Bulk email campaign states
+CAMPAIGN_STATUSES = ['queued', 'sending', 'completed', 'failed']
+
+# Paper file processing states (page count, text and preview extraction)
+PROCESSING_STATUSES = ['pending', 'processing', 'done', 'failed', 'unsupported']
+
+# Keywords used to classify contact message subjects
+CONTACT_SUBJECT_KEYWORDS = {
+    'paper-submission': ['paper', 'submission', 'submit'],
+    'registration': ['registration', 'register', 'signup'],
+    'accommodation': ['accommodation', 'hotel', 'stay'],
+    'programme': ['programme', 'program', 'schedule'],
+    'sponsorship': ['sponsor', 'partnership', 'support'],
+    'general': ['general', 'inquiry', 'question']
+}
+OTHER_SUBJECT_CATEGORY = 'other'
+
+def classify_subject(subject):
+    """First subject category (in CONTACT_SUBJECT_KEYWORDS order) with a keyword in subject"""
+    text = (subject or '').lower()
+    for category, keywords in CONTACT_SUBJECT_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            return category
+    return OTHER_SUBJECT_CATEGORY
+
+def _default_subject_category(context):
+    # Covers Core inserts that bypass the ORM validator below
+    return classify_subject(context.get_current_parameters().get('subject'))
+
+def counted(column):
+    """A column the stats counters bucket on; assigning it loads the replaced value so it can be subtracted"""
+    return db.column_property(column, active_history=True)
+
 class Registration(db.Model):
     __tablename__ = 'registrations'
+    __table_args__ = (
+        db.Index('ix_registrations_status_created_at', 'status', 'created_at'),
+        db.Index('ix_registrations_category_created_at', 'category', 'created_at'),
+        db.Index('ix_registrations_created_at_id', 'created_at', 'id'),
+        db.Index('ix_registrations_email', 'email'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     registration_id = db.Column(db.String(50), unique=True, nullable=False)
@@ -41,19 +88,19 @@ class Registration(db.Model):
     country = db.Column(db.String(100), nullable=False)
     
     # Registration Details
-    category = db.Column(db.Enum(RegistrationCategory), nullable=False)
+    category = counted(db.Column(db.Enum(RegistrationCategory), nullable=False))
     paper_title = db.Column(db.String(300), nullable=True)
     special_requirements = db.Column(db.Text, nullable=True)
     
     # Status and Timestamps
-    status = db.Column(db.Enum(RegistrationStatus), default=RegistrationStatus.PENDING)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    status = counted(db.Column(db.Enum(RegistrationStatus), default=RegistrationStatus.PENDING))
+    created_at = counted(db.Column(db.DateTime, default=datetime.utcnow))
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Payment Information
-    payment_amount = db.Column(db.Float, nullable=True)
+    payment_amount = counted(db.Column(db.Float, nullable=True))
     payment_currency = db.Column(db.String(3), nullable=True)  # USD, LKR
-    payment_status = db.Column(db.String(20), default='pending')
+    payment_status = counted(db.Column(db.String(20), default='pending'))
     payment_reference = db.Column(db.String(100), nullable=True)
     
     def __repr__(self):
@@ -82,15 +129,22 @@ class Registration(db.Model):
 
 class PaperSubmission(db.Model):
     __tablename__ = 'paper_submissions'
+    __table_args__ = (
+        db.Index('ix_paper_submissions_status_created_at', 'status', 'created_at'),
+        db.Index('ix_paper_submissions_category_created_at', 'category', 'created_at'),
+        db.Index('ix_paper_submissions_created_at_id', 'created_at', 'id'),
+        db.Index('ix_paper_submissions_author_email', 'corresponding_author_email'),
+        db.Index('ix_paper_submissions_processing_status_id', 'processing_status', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     submission_id = db.Column(db.String(50), unique=True, nullable=False)
     
     # Paper Information
     title = db.Column(db.String(300), nullable=False)
-    abstract = db.Column(db.Text, nullable=False)
+    abstract = db.deferred(db.Column(db.Text, nullable=False), group='detail')
     keywords = db.Column(db.String(500), nullable=False)
-    category = db.Column(db.Enum(PaperCategory), nullable=False)
+    category = counted(db.Column(db.Enum(PaperCategory), nullable=False))
     
     # Author Information
     authors = db.Column(db.String(500), nullable=False)
@@ -103,14 +157,23 @@ class PaperSubmission(db.Model):
     file_path = db.Column(db.String(500), nullable=True)
     file_size = db.Column(db.Integer, nullable=True)
     file_type = db.Column(db.String(50), nullable=True)
+    file_sha256 = db.Column(db.String(64), nullable=True)
+    
+    # Document Processing (filled in by the background pipeline)
+    processing_status = db.Column(db.String(20), nullable=False, default='pending')
+    processing_error = db.deferred(db.Column(db.Text, nullable=True), group='detail')
+    page_count = db.Column(db.Integer, nullable=True)
+    document_text = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    thumbnail_path = db.Column(db.String(500), nullable=True)
+    processed_at = db.Column(db.DateTime, nullable=True)
     
     # Review Information
-    status = db.Column(db.Enum(PaperStatus), default=PaperStatus.SUBMITTED)
-    reviewer_comments = db.Column(db.Text, nullable=True)
-    review_score = db.Column(db.Float, nullable=True)
+    status = counted(db.Column(db.Enum(PaperStatus), default=PaperStatus.SUBMITTED))
+    reviewer_comments = db.deferred(db.Column(db.Text, nullable=True), group='detail')
+    review_score = counted(db.Column(db.Float, nullable=True))
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = counted(db.Column(db.DateTime, default=datetime.utcnow))
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     review_deadline = db.Column(db.DateTime, nullable=True)
     
@@ -133,6 +196,12 @@ class PaperSubmission(db.Model):
             'file_path': self.file_path,
             'file_size': self.file_size,
             'file_type': self.file_type,
+            'file_sha256': self.file_sha256,
+            'processing_status': self.processing_status,
+            'processing_error': self.processing_error,
+            'page_count': self.page_count,
+            'thumbnail_url': f'/api/admin/papers/{self.submission_id}/thumbnail' if self.thumbnail_path else None,
+            'processed_at': self.processed_at.isoformat() if self.processed_at else None,
             'status': self.status.value if self.status else None,
             'reviewer_comments': self.reviewer_comments,
             'review_score': self.review_score,
@@ -143,6 +212,13 @@ class PaperSubmission(db.Model):
 
 class ContactMessage(db.Model):
     __tablename__ = 'contact_messages'
+    __table_args__ = (
+        db.Index('ix_contact_messages_status_created_at', 'status', 'created_at'),
+        db.Index('ix_contact_messages_created_at_id', 'created_at', 'id'),
+        db.Index('ix_contact_messages_email', 'email'),
+        db.Index('ix_contact_messages_subject', 'subject'),
+        db.Index('ix_contact_messages_subject_category_created_at', 'subject_category', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     message_id = db.Column(db.String(50), unique=True, nullable=False)
@@ -151,21 +227,27 @@ class ContactMessage(db.Model):
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(120), nullable=False)
     subject = db.Column(db.String(200), nullable=False)
-    message = db.Column(db.Text, nullable=False)
+    subject_category = counted(db.Column(db.String(30), nullable=True, default=_default_subject_category))
+    message = db.deferred(db.Column(db.Text, nullable=False), group='detail')
     
     # Status and Response
-    status = db.Column(db.String(20), default='new')  # new, read, responded, closed
-    response = db.Column(db.Text, nullable=True)
+    status = counted(db.Column(db.String(20), default='new'))  # new, read, responded, closed
+    response = db.deferred(db.Column(db.Text, nullable=True), group='detail')
     responded_by = db.Column(db.String(100), nullable=True)
     responded_at = db.Column(db.DateTime, nullable=True)
     
     # Timestamps
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = counted(db.Column(db.DateTime, default=datetime.utcnow))
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def __repr__(self):
         return f'<ContactMessage {self.message_id}: {self.subject}>'
     
+    @validates('subject')
+    def _classify_subject(self, key, subject):
+        self.subject_category = classify_subject(subject)
+        return subject
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -173,6 +255,7 @@ class ContactMessage(db.Model):
             'name': self.name,
             'email': self.email,
             'subject': self.subject,
+            'subject_category': self.subject_category,
             'message': self.message,
             'status': self.status,
             'response': self.response,
@@ -207,6 +290,8 @@ class ConferenceSettings(db.Model):
 
 class AdminUser(db.Model):
     __tablename__ = 'admin_users'
+    # Ids are never reused, so tokens of a deleted admin cannot match a later account
+    __table_args__ = {'sqlite_autoincrement': True}
     
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -216,6 +301,7 @@ class AdminUser(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     last_login = db.Column(db.DateTime, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    token_version = db.Column(db.Integer, nullable=False, default=1)  # bumped to retire every issued token
     
     def __repr__(self):
         return f'<AdminUser {self.username}>'
@@ -230,3 +316,205 @@ class AdminUser(db.Model):
             'last_login': self.last_login.isoformat() if self.last_login else None,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+class StatsCounter(db.Model):
+    __tablename__ = 'stats_counters'
+    __table_args__ = (
+        db.UniqueConstraint('entity', 'dimension', 'value', 'day', name='uq_stats_counter_bucket'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(50), nullable=False)  # registration, paper, message
+    dimension = db.Column(db.String(50), nullable=False)  # total, status, category, ...
+    value = db.Column(db.String(100), nullable=False)
+    day = db.Column(db.Date, nullable=True)
+    
+    # Row count and summed amount (revenue, review score) for the bucket
+    count = db.Column(db.Integer, nullable=False, default=0)
+    amount = db.Column(db.Float, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<StatsCounter {self.entity}.{self.dimension}={self.value} {self.day}: {self.count}>'
+    
+    def to_dict(self):
+        return {
+            'entity': self.entity,
+            'dimension': self.dimension,
+            'value': self.value,
+            'day': self.day.isoformat() if self.day else None,
+            'count': self.count,
+            'amount': self.amount
+        }
+
+class Job(db.Model):
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        db.Index('ix_jobs_status_run_after', 'status', 'run_after'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.String(50), unique=True, nullable=False)
+    kind = db.Column(db.String(50), nullable=False)  # export, bulk-email, ...
+    params = db.Column(db.Text, nullable=False, default='{}')  # JSON
+    
+    # Scheduling
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, succeeded, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    run_after = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    worker = db.Column(db.String(100), nullable=True)
+    
+    # Outcome
+    result = db.Column(db.Text, nullable=True)  # JSON summary returned by the handler
+    result_path = db.Column(db.String(500), nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    
+    created_by = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<Job {self.job_id}: {self.kind} {self.status}>'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'params': json.loads(self.params) if self.params else {},
+            'status': self.status,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'run_after': self.run_after.isoformat() if self.run_after else None,
+            'result': json.loads(self.result) if self.result else None,
+            'has_result_file': bool(self.result_path),
+            'error': self.error,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class EmailCampaign(db.Model):
+    __tablename__ = 'email_campaigns'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    campaign_id = db.Column(db.String(50), unique=True, nullable=False)
+    
+    # Content ($full_name, $email and $registration_id are substituted per recipient)
+    subject = db.Column(db.String(200), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    recipient_type = db.Column(db.String(20), nullable=False, default='all')  # all, confirmed, pending
+    
+    # Progress; recipients are sent in id order and last_recipient_id is the resume checkpoint
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, sending, completed, failed
+    total_recipients = db.Column(db.Integer, nullable=False, default=0)
+    sent_count = db.Column(db.Integer, nullable=False, default=0)
+    failed_count = db.Column(db.Integer, nullable=False, default=0)
+    last_recipient_id = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    job_id = db.Column(db.String(50), nullable=True)
+    
+    created_by = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<EmailCampaign {self.campaign_id}: {self.status} {self.sent_count}/{self.total_recipients}>'
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'campaign_id': self.campaign_id,
+            'subject': self.subject,
+            'message': self.message,
+            'recipient_type': self.recipient_type,
+            'status': self.status,
+            'total_recipients': self.total_recipients,
+            'sent_count': self.sent_count,
+            'failed_count': self.failed_count,
+            'last_recipient_id': self.last_recipient_id,
+            'last_error': self.last_error,
+            'job_id': self.job_id,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class PaperUpload(db.Model):
+    __tablename__ = 'paper_uploads'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    upload_id = db.Column(db.String(50), unique=True, nullable=False)
+    
+    # Resumable upload of a paper file; received_size is the offset the next piece starts at
+    filename = db.Column(db.String(255), nullable=False)
+    total_size = db.Column(db.Integer, nullable=False)
+    received_size = db.Column(db.Integer, nullable=False, default=0)
+    part_path = db.Column(db.String(500), nullable=False)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f'<PaperUpload {self.upload_id}: {self.received_size}/{self.total_size}>'
+    
+    def to_dict(self):
+        return {
+            'upload_id': self.upload_id,
+            'filename': self.filename,
+            'total_size': self.total_size,
+            'offset': self.received_size,
+            'complete': self.received_size == self.total_size,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None
+        }
+
+class FileBlob(db.Model):
+    __tablename__ = 'file_blobs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    sha256 = db.Column(db.String(64), unique=True, nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)  # paper submissions using this file
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<FileBlob {self.sha256[:12]}: {self.ref_count} refs>'
+    
+    def to_dict(self):
+        return {
+            'sha256': self.sha256,
+            'size': self.size,
+            'ref_count': self.ref_count,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class RevokedToken(db.Model):
+    __tablename__ = 'revoked_tokens'
+    __table_args__ = (
+        db.Index('ix_revoked_tokens_expires_at', 'expires_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(64), unique=True, nullable=False)
+    user_id = db.Column(db.Integer, nullable=True)
+    token_type = db.Column(db.String(10), nullable=False)  # access, refresh
+    expires_at = db.Column(db.DateTime, nullable=False)  # the row can go once the token has expired anyway
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<RevokedToken {self.jti} ({self.token_type})>'
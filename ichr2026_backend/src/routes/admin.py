@@ -1,16 +1,31 @@
-from flask import Blueprint, request, jsonify
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import Blueprint, request, jsonify, send_file
 from datetime import datetime, timedelta
+import math
+import os
 import uuid
 from flask_jwt_extended import (
     create_access_token, create_refresh_token, 
-    jwt_required, get_jwt_identity, get_jwt
+    jwt_required, get_jwt_identity, get_jwt, decode_token
 )
 from src.models.user import db
 from src.models.conference import (
     AdminUser, Registration, PaperSubmission, ContactMessage, 
-    ConferenceSettings, RegistrationStatus, PaperStatus
+    ConferenceSettings, RegistrationStatus, PaperStatus, Job, EmailCampaign
 )
+from src.services.stats import dashboard_stats, summary_report
+from src.services.cache import response_cache, cached, invalidates
+from src.services.etag import query_fingerprint, row_etag, instance_etag, is_fresh, not_modified, with_etag
+from src.services.pagination import wants_cursor, keyset_response
+from src.services.profiles import requested_profile, apply_profile, serialize_rows
+from src.services.search import apply_search
+from src.services.export import export_response, streamed_export
+from src.services.archive import paper_archive_chunks
+from src.services.documents import schedule_processing
+from src.services.bulk_email import create_campaign, queue_campaign
+from src.services.jobs import job_queue
+from src.services.passwords import passwords, PasswordHashingBusy
+from src.services.ratelimit import login_limiter
+from src.services.auth import require_role, token_claims, retire_tokens, token_denylist, TOKEN_CLAIMS
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -19,33 +34,54 @@ def admin_login():
     """Admin login endpoint"""
     try:
         data = request.get_json()
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Username and password are required'}), 400
         
         username = data.get('username')
         password = data.get('password')
         
         if not username or not password:
             return jsonify({'error': 'Username and password are required'}), 400
+        if not isinstance(username, str) or not isinstance(password, str):
+            return jsonify({'error': 'Username and password must be strings'}), 400
+        
+        # Token buckets per client address and per username throttle guessing
+        wait = login_limiter.attempt(request.remote_addr, username)
+        if wait:
+            response = jsonify({'error': 'Too many login attempts, try again later'})
+            response.headers['Retry-After'] = str(math.ceil(wait))
+            return response, 429
         
         # Find admin user
         admin = AdminUser.query.filter_by(username=username, is_active=True).first()
         
-        if not admin or not check_password_hash(admin.password_hash, password):
+        # Checked on the bounded hashing pool; unknown users cost the same as a wrong password
+        try:
+            valid = passwords.verify(admin.password_hash if admin else None, password)
+        except PasswordHashingBusy:
+            response = jsonify({'error': 'Login service is busy, try again shortly'})
+            response.headers['Retry-After'] = '1'
+            return response, 503
+        
+        if not admin or not valid:
             return jsonify({'error': 'Invalid credentials'}), 401
         
+        login_limiter.succeeded(username)
+        
+        # Upgrade the stored hash while the plain password is at hand
+        if passwords.needs_rehash(admin.password_hash):
+            try:
+                admin.password_hash = passwords.hash(password)
+            except PasswordHashingBusy:
+                pass  # the next login tries again
+        
         # Update last login
         admin.last_login = datetime.utcnow()
         db.session.commit()
         
-        # Generate JWT tokens
-        access_token = create_access_token(
-            identity=admin.id,
-            additional_claims={
-                'username': admin.username,
-                'role': admin.role,
-                'email': admin.email
-            }
-        )
-        refresh_token = create_refresh_token(identity=admin.id)
+        # Generate JWT tokens; both carry the claims authorization needs
+        access_token = create_access_token(identity=str(admin.id), additional_claims=token_claims(admin))
+        refresh_token = create_refresh_token(identity=str(admin.id), additional_claims=token_claims(admin))
         
         return jsonify({
             'success': True,
@@ -64,23 +100,18 @@ def admin_login():
         return jsonify({'error': f'Login failed: {str(e)}'}), 500
 
 @admin_bp.route('/admin/refresh', methods=['POST'])
-@jwt_required(refresh=True)
+@require_role(refresh=True)
 def refresh_token():
     """Refresh JWT token"""
     try:
-        current_user_id = get_jwt_identity()
-        admin = AdminUser.query.get(current_user_id)
-        
-        if not admin or not admin.is_active:
-            return jsonify({'error': 'User not found or inactive'}), 401
+        # The denylist already rejected refresh tokens of deactivated or changed accounts
+        claims = get_jwt()
+        if any(claim not in claims for claim in TOKEN_CLAIMS):
+            return jsonify({'error': 'Please sign in again'}), 401
         
         access_token = create_access_token(
-            identity=admin.id,
-            additional_claims={
-                'username': admin.username,
-                'role': admin.role,
-                'email': admin.email
-            }
+            identity=get_jwt_identity(),
+            additional_claims={claim: claims[claim] for claim in TOKEN_CLAIMS}
         )
         
         return jsonify({
@@ -91,106 +122,51 @@ def refresh_token():
     except Exception as e:
         return jsonify({'error': f'Token refresh failed: {str(e)}'}), 500
 
+@admin_bp.route('/admin/logout', methods=['POST'])
+@jwt_required(verify_type=False)
+def admin_logout():
+    """Revoke the presented token and, if given, the refresh token"""
+    try:
+        tokens = [get_jwt()]
+        
+        # Checked before anything is revoked, so a rejected logout changes nothing
+        data = request.get_json(silent=True) or {}
+        if data.get('refresh_token'):
+            refresh = decode_token(data['refresh_token'], allow_expired=True)
+            if refresh['sub'] != get_jwt_identity():
+                return jsonify({'error': 'Refresh token belongs to another user'}), 400
+            tokens.append(refresh)
+        
+        token_denylist.revoke(*tokens)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Logged out successfully'
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Logout failed: {str(e)}'}), 500
+
 @admin_bp.route('/admin/dashboard', methods=['GET'])
 @jwt_required()
+@cached('registrations', 'papers', 'messages')
 def get_dashboard_stats():
     """Get comprehensive dashboard statistics"""
     try:
-        # Registration statistics
-        total_registrations = Registration.query.count()
-        pending_registrations = Registration.query.filter_by(status=RegistrationStatus.PENDING).count()
-        confirmed_registrations = Registration.query.filter_by(status=RegistrationStatus.CONFIRMED).count()
-        
-        # Paper submission statistics
-        total_papers = PaperSubmission.query.count()
-        pending_papers = PaperSubmission.query.filter_by(status=PaperStatus.SUBMITTED).count()
-        accepted_papers = PaperSubmission.query.filter_by(status=PaperStatus.ACCEPTED).count()
-        
-        # Contact message statistics
-        total_messages = ContactMessage.query.count()
-        unread_messages = ContactMessage.query.filter_by(status='new').count()
-        
-        # Recent activity (last 7 days)
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_registrations = Registration.query.filter(Registration.created_at >= week_ago).count()
-        recent_papers = PaperSubmission.query.filter(PaperSubmission.created_at >= week_ago).count()
-        recent_messages = ContactMessage.query.filter(ContactMessage.created_at >= week_ago).count()
-        
-        # Revenue calculation (basic)
-        total_revenue = db.session.query(db.func.sum(Registration.payment_amount)).filter(
-            Registration.payment_status == 'paid'
-        ).scalar() or 0
-        
-        # Registration by category
-        from src.models.conference import RegistrationCategory
-        registration_by_category = {}
-        for category in RegistrationCategory:
-            count = Registration.query.filter_by(category=category).count()
-            registration_by_category[category.value] = count
-        
-        # Papers by category
-        from src.models.conference import PaperCategory
-        papers_by_category = {}
-        for category in PaperCategory:
-            count = PaperSubmission.query.filter_by(category=category).count()
-            papers_by_category[category.value] = count
-        
-        # Monthly registration trend (last 6 months)
-        monthly_registrations = []
-        for i in range(6):
-            month_start = datetime.utcnow().replace(day=1) - timedelta(days=30*i)
-            month_end = month_start + timedelta(days=30)
-            count = Registration.query.filter(
-                Registration.created_at >= month_start,
-                Registration.created_at < month_end
-            ).count()
-            monthly_registrations.append({
-                'month': month_start.strftime('%Y-%m'),
-                'count': count
-            })
-        
         return jsonify({
             'success': True,
-            'data': {
-                'overview': {
-                    'total_registrations': total_registrations,
-                    'pending_registrations': pending_registrations,
-                    'confirmed_registrations': confirmed_registrations,
-                    'total_papers': total_papers,
-                    'pending_papers': pending_papers,
-                    'accepted_papers': accepted_papers,
-                    'total_messages': total_messages,
-                    'unread_messages': unread_messages,
-                    'total_revenue': total_revenue
-                },
-                'recent_activity': {
-                    'recent_registrations': recent_registrations,
-                    'recent_papers': recent_papers,
-                    'recent_messages': recent_messages
-                },
-                'breakdowns': {
-                    'registration_by_category': registration_by_category,
-                    'papers_by_category': papers_by_category
-                },
-                'trends': {
-                    'monthly_registrations': monthly_registrations
-                }
-            }
+            'data': dashboard_stats()
         }), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve dashboard data: {str(e)}'}), 500
 
 @admin_bp.route('/admin/users', methods=['GET'])
-@jwt_required()
+@require_role('admin')
 def get_admin_users():
     """Get all admin users"""
     try:
-        # Check if user has admin role
-        claims = get_jwt()
-        if claims.get('role') != 'admin':
-            return jsonify({'error': 'Unauthorized access'}), 403
-            
         users = AdminUser.query.all()
         users_list = [user.to_dict() for user in users]
         
@@ -203,15 +179,10 @@ def get_admin_users():
         return jsonify({'error': f'Failed to retrieve users: {str(e)}'}), 500
 
 @admin_bp.route('/admin/users', methods=['POST'])
-@jwt_required()
+@require_role('admin')
 def create_admin_user():
     """Create a new admin user"""
     try:
-        # Check if user has admin role
-        claims = get_jwt()
-        if claims.get('role') != 'admin':
-            return jsonify({'error': 'Unauthorized access'}), 403
-            
         data = request.get_json()
         
         required_fields = ['username', 'email', 'password', 'role']
@@ -237,12 +208,13 @@ def create_admin_user():
         admin_user = AdminUser(
             username=data['username'],
             email=data['email'],
-            password_hash=generate_password_hash(data['password']),
+            password_hash=passwords.hash_now(data['password']),
             role=data['role']
         )
         
         db.session.add(admin_user)
         db.session.commit()
+        token_denylist.user_changed(admin_user)
         
         return jsonify({
             'success': True,
@@ -255,15 +227,10 @@ def create_admin_user():
         return jsonify({'error': f'Failed to create admin user: {str(e)}'}), 500
 
 @admin_bp.route('/admin/users/<int:user_id>', methods=['PUT'])
-@jwt_required()
+@require_role('admin')
 def update_admin_user(user_id):
     """Update an admin user"""
     try:
-        # Check if user has admin role
-        claims = get_jwt()
-        if claims.get('role') != 'admin':
-            return jsonify({'error': 'Unauthorized access'}), 403
-            
         data = request.get_json()
         user = AdminUser.query.get(user_id)
         
@@ -292,7 +259,7 @@ def update_admin_user(user_id):
             user.email = data['email']
             
         if 'password' in data and data['password']:
-            user.password_hash = generate_password_hash(data['password'])
+            user.password_hash = passwords.hash_now(data['password'])
             
         if 'role' in data:
             valid_roles = ['admin', 'reviewer', 'organizer']
@@ -303,7 +270,13 @@ def update_admin_user(user_id):
         if 'is_active' in data:
             user.is_active = bool(data['is_active'])
         
+        # Tokens carry these fields, so any change to them retires the user's tokens
+        state = db.inspect(user).attrs
+        if any(state[field].history.has_changes() for field in ('username', 'email', 'password_hash', 'role', 'is_active')):
+            retire_tokens(user)
+        
         db.session.commit()
+        token_denylist.user_changed(user)
         
         return jsonify({
             'success': True,
@@ -316,27 +289,23 @@ def update_admin_user(user_id):
         return jsonify({'error': f'Failed to update user: {str(e)}'}), 500
 
 @admin_bp.route('/admin/users/<int:user_id>', methods=['DELETE'])
-@jwt_required()
+@require_role('admin')
 def delete_admin_user(user_id):
     """Delete an admin user"""
     try:
-        # Check if user has admin role
-        claims = get_jwt()
-        if claims.get('role') != 'admin':
-            return jsonify({'error': 'Unauthorized access'}), 403
-            
         user = AdminUser.query.get(user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
         # Prevent deleting yourself
-        current_user_id = get_jwt_identity()
+        current_user_id = int(get_jwt_identity())
         if user_id == current_user_id:
             return jsonify({'error': 'Cannot delete your own account'}), 400
         
         db.session.delete(user)
         db.session.commit()
+        token_denylist.user_deleted(user_id)
         
         return jsonify({
             'success': True,
@@ -364,15 +333,10 @@ def get_conference_settings():
         return jsonify({'error': f'Failed to retrieve settings: {str(e)}'}), 500
 
 @admin_bp.route('/admin/settings', methods=['POST'])
-@jwt_required()
+@require_role('admin')
 def update_conference_settings():
     """Update conference settings"""
     try:
-        # Check if user has admin role
-        claims = get_jwt()
-        if claims.get('role') != 'admin':
-            return jsonify({'error': 'Unauthorized access'}), 403
-            
         data = request.get_json()
         
         for key, value in data.items():
@@ -430,20 +394,27 @@ def get_registrations():
                 pass
                 
         if search:
-            query = query.filter(
-                (Registration.full_name.ilike(f'%{search}%')) |
-                (Registration.email.ilike(f'%{search}%')) |
-                (Registration.affiliation.ilike(f'%{search}%'))
-            )
+            # Ranked full-text match, best hits first
+            query = apply_search(query, Registration, search)
             
+        # Opt-in keyset pagination seeks on (created_at, id) instead of OFFSET
+        if wants_cursor():
+            return keyset_response(query, Registration)
+        
+        # The fingerprint query doubles as the pagination count
+        etag, total = query_fingerprint(query, Registration)
+        if is_fresh(etag):
+            return not_modified(etag)
+        
         # Pagination
-        paginated = query.order_by(Registration.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        paginated = apply_profile(query, Registration, 'detail').order_by(Registration.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
+        paginated.total = total
         
-        registrations = [reg.to_dict() for reg in paginated.items]
+        registrations = serialize_rows(paginated.items, Registration, 'detail')
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'data': registrations,
             'pagination': {
@@ -454,13 +425,14 @@ def get_registrations():
                 'has_next': paginated.has_next,
                 'has_prev': paginated.has_prev
             }
-        }), 200
+        }), etag), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve registrations: {str(e)}'}), 500
 
 @admin_bp.route('/admin/registrations/<string:registration_id>', methods=['PUT'])
 @jwt_required()
+@invalidates('registrations')
 def update_registration(registration_id):
     """Update a registration"""
     try:
@@ -541,20 +513,30 @@ def get_papers():
                 pass
                 
         if search:
-            query = query.filter(
-                (PaperSubmission.title.ilike(f'%{search}%')) |
-                (PaperSubmission.authors.ilike(f'%{search}%')) |
-                (PaperSubmission.corresponding_author_email.ilike(f'%{search}%'))
-            )
+            # Ranked full-text match, best hits first
+            query = apply_search(query, PaperSubmission, search)
             
+        # Table rows by default; ?view=detail adds abstracts and reviewer comments
+        profile = requested_profile()
+        
+        # Opt-in keyset pagination seeks on (created_at, id) instead of OFFSET
+        if wants_cursor():
+            return keyset_response(query, PaperSubmission, profile)
+        
+        # The fingerprint query doubles as the pagination count
+        etag, total = query_fingerprint(query, PaperSubmission)
+        if is_fresh(etag):
+            return not_modified(etag)
+        
         # Pagination
-        paginated = query.order_by(PaperSubmission.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        paginated = apply_profile(query, PaperSubmission, profile).order_by(PaperSubmission.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
+        paginated.total = total
         
-        papers = [paper.to_dict() for paper in paginated.items]
+        papers = serialize_rows(paginated.items, PaperSubmission, profile)
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'data': papers,
             'pagination': {
@@ -565,13 +547,108 @@ def get_papers():
                 'has_next': paginated.has_next,
                 'has_prev': paginated.has_prev
             }
-        }), 200
+        }), etag), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve papers: {str(e)}'}), 500
 
+@admin_bp.route('/admin/papers/archive', methods=['GET'])
+@jwt_required()
+def download_papers_archive():
+    """Download every matching paper file as one streamed ZIP with a manifest"""
+    try:
+        from src.models.conference import PaperCategory
+        status = request.args.get('status')
+        category = request.args.get('category')
+        
+        try:
+            status_enum = PaperStatus(status) if status else None
+        except ValueError:
+            return jsonify({'error': 'Invalid paper status'}), 400
+        try:
+            category_enum = PaperCategory(category) if category else None
+        except ValueError:
+            return jsonify({'error': 'Invalid paper category'}), 400
+        
+        # Built while it is sent; PDFs are stored, not recompressed
+        filename = f"papers_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        return streamed_export(
+            paper_archive_chunks(status_enum, category_enum), filename, 'application/zip', compress=False
+        )
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to build paper archive: {str(e)}'}), 500
+
+@admin_bp.route('/admin/papers/<string:submission_id>/thumbnail', methods=['GET'])
+@jwt_required()
+def get_paper_thumbnail(submission_id):
+    """First-page preview image of a processed paper"""
+    try:
+        paper = PaperSubmission.query.filter_by(submission_id=submission_id).first()
+        if not paper:
+            return jsonify({'error': 'Paper submission not found'}), 404
+        if not paper.thumbnail_path or not os.path.exists(paper.thumbnail_path):
+            return jsonify({'error': 'No preview available', 'processing_status': paper.processing_status}), 404
+        
+        response = send_file(paper.thumbnail_path, mimetype='image/png', etag=paper.file_sha256 or True)
+        response.cache_control.private = True
+        return response
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to retrieve thumbnail: {str(e)}'}), 500
+
+@admin_bp.route('/admin/papers/process', methods=['POST'])
+@jwt_required()
+@invalidates('papers')
+def process_papers():
+    """Queue processing of pending papers, optionally retrying failed ones"""
+    try:
+        data = request.get_json(silent=True) or {}
+        requeued = 0
+        if data.get('retry_failed'):
+            requeued = PaperSubmission.query.filter_by(processing_status='failed').update(
+                {'processing_status': 'pending'}, synchronize_session=False
+            )
+            db.session.commit()
+        
+        job = schedule_processing()
+        return jsonify({
+            'success': True,
+            'requeued': requeued,
+            'pending': PaperSubmission.query.filter_by(processing_status='pending').count(),
+            'job': job.to_dict() if job else None
+        }), 202
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Failed to queue paper processing: {str(e)}'}), 500
+
+@admin_bp.route('/admin/papers/<string:submission_id>', methods=['GET'])
+@jwt_required()
+def get_paper(submission_id):
+    """Get the full paper submission, including the fields list views leave out"""
+    try:
+        # Revalidation only needs the row's version
+        if request.if_none_match:
+            etag = row_etag(PaperSubmission, submission_id=submission_id)
+            if is_fresh(etag):
+                return not_modified(etag)
+        
+        paper = PaperSubmission.query.options(db.undefer_group('detail')).filter_by(submission_id=submission_id).first()
+        if not paper:
+            return jsonify({'error': 'Paper submission not found'}), 404
+        
+        return with_etag(jsonify({
+            'success': True,
+            'data': paper.to_dict()
+        }), instance_etag(paper)), 200
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to retrieve paper submission: {str(e)}'}), 500
+
 @admin_bp.route('/admin/papers/<string:submission_id>', methods=['PUT'])
 @jwt_required()
+@invalidates('papers')
 def update_paper(submission_id):
     """Update a paper submission"""
     try:
@@ -629,20 +706,30 @@ def get_messages():
             query = query.filter_by(status=status)
                 
         if search:
-            query = query.filter(
-                (ContactMessage.name.ilike(f'%{search}%')) |
-                (ContactMessage.email.ilike(f'%{search}%')) |
-                (ContactMessage.subject.ilike(f'%{search}%'))
-            )
+            # Ranked full-text match, best hits first
+            query = apply_search(query, ContactMessage, search)
             
+        # Table rows by default; ?view=detail adds the message and response bodies
+        profile = requested_profile()
+        
+        # Opt-in keyset pagination seeks on (created_at, id) instead of OFFSET
+        if wants_cursor():
+            return keyset_response(query, ContactMessage, profile)
+        
+        # The fingerprint query doubles as the pagination count
+        etag, total = query_fingerprint(query, ContactMessage)
+        if is_fresh(etag):
+            return not_modified(etag)
+        
         # Pagination
-        paginated = query.order_by(ContactMessage.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        paginated = apply_profile(query, ContactMessage, profile).order_by(ContactMessage.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
+        paginated.total = total
         
-        messages = [msg.to_dict() for msg in paginated.items]
+        messages = serialize_rows(paginated.items, ContactMessage, profile)
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'data': messages,
             'pagination': {
@@ -653,13 +740,37 @@ def get_messages():
                 'has_next': paginated.has_next,
                 'has_prev': paginated.has_prev
             }
-        }), 200
+        }), etag), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve messages: {str(e)}'}), 500
 
+@admin_bp.route('/admin/messages/<string:message_id>', methods=['GET'])
+@jwt_required()
+def get_message(message_id):
+    """Get the full message, including the fields list views leave out"""
+    try:
+        # Revalidation only needs the row's version
+        if request.if_none_match:
+            etag = row_etag(ContactMessage, message_id=message_id)
+            if is_fresh(etag):
+                return not_modified(etag)
+        
+        message = ContactMessage.query.options(db.undefer_group('detail')).filter_by(message_id=message_id).first()
+        if not message:
+            return jsonify({'error': 'Message not found'}), 404
+        
+        return with_etag(jsonify({
+            'success': True,
+            'data': message.to_dict()
+        }), instance_etag(message)), 200
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to retrieve message: {str(e)}'}), 500
+
 @admin_bp.route('/admin/messages/<string:message_id>', methods=['PUT'])
 @jwt_required()
+@invalidates('messages')
 def update_message(message_id):
     """Update a contact message"""
     try:
@@ -704,48 +815,10 @@ def update_message(message_id):
 @admin_bp.route('/admin/export/registrations', methods=['GET'])
 @jwt_required()
 def export_registrations():
-    """Export registrations data as CSV"""
-    try:
-        import csv
-        import io
-        
-        registrations = Registration.query.all()
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'Registration ID', 'Full Name', 'Email', 'Phone', 'Affiliation', 
-            'Country', 'Category', 'Paper Title', 'Status', 'Payment Status',
-            'Payment Amount', 'Created At'
-        ])
-        
-        # Write data
-        for reg in registrations:
-            writer.writerow([
-                reg.registration_id,
-                reg.full_name,
-                reg.email,
-                reg.phone,
-                reg.affiliation,
-                reg.country,
-                reg.category.value if reg.category else '',
-                reg.paper_title or '',
-                reg.status.value if reg.status else '',
-                reg.payment_status or '',
-                reg.payment_amount or '',
-                reg.created_at.strftime('%Y-%m-%d %H:%M:%S') if reg.created_at else ''
-            ])
-        
-        output.seek(0)
-        
-        from flask import Response
-        return Response(
-            output.getvalue(),
-            mimetype='text/csv',
-            headers={'Content-Disposition': 'attachment; filename=registrations.csv'}
-        )
+    """Export registrations data as CSV, JSON Lines or Parquet"""
+    try:
+        # Streamed in batches; nothing is buffered beyond one batch of rows
+        return export_response('registrations')
         
     except Exception as e:
         return jsonify({'error': f'Failed to export registrations: {str(e)}'}), 500
@@ -753,45 +826,10 @@ def export_registrations():
 @admin_bp.route('/admin/export/papers', methods=['GET'])
 @jwt_required()
 def export_papers():
-    """Export paper submissions data as CSV"""
-    try:
-        import csv
-        import io
-        
-        papers = PaperSubmission.query.all()
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'Submission ID', 'Title', 'Authors', 'Email', 'Affiliation',
-            'Category', 'Status', 'Review Score', 'File Name', 'Created At'
-        ])
-        
-        # Write data
-        for paper in papers:
-            writer.writerow([
-                paper.submission_id,
-                paper.title,
-                paper.authors,
-                paper.corresponding_author_email,
-                paper.affiliation,
-                paper.category.value if paper.category else '',
-                paper.status.value if paper.status else '',
-                paper.review_score or '',
-                paper.file_name or '',
-                paper.created_at.strftime('%Y-%m-%d %H:%M:%S') if paper.created_at else ''
-            ])
-        
-        output.seek(0)
-        
-        from flask import Response
-        return Response(
-            output.getvalue(),
-            mimetype='text/csv',
-            headers={'Content-Disposition': 'attachment; filename=papers.csv'}
-        )
+    """Export paper submissions data as CSV, JSON Lines or Parquet"""
+    try:
+        # Streamed in batches; nothing is buffered beyond one batch of rows
+        return export_response('papers')
         
     except Exception as e:
         return jsonify({'error': f'Failed to export papers: {str(e)}'}), 500
@@ -799,7 +837,7 @@ def export_papers():
 @admin_bp.route('/admin/bulk-email', methods=['POST'])
 @jwt_required()
 def send_bulk_email():
-    """Send bulk email to registrants (placeholder)"""
+    """Queue a bulk email to registrants as a background job"""
     try:
         data = request.get_json()
         
@@ -810,27 +848,175 @@ def send_bulk_email():
         if not subject or not message:
             return jsonify({'error': 'Subject and message are required'}), 400
         
-        # Get recipients based on type
-        query = Registration.query
-        if recipient_type == 'confirmed':
-            query = query.filter_by(status=RegistrationStatus.CONFIRMED)
-        elif recipient_type == 'pending':
-            query = query.filter_by(status=RegistrationStatus.PENDING)
+        # Recipients are streamed and sent by a background job
+        campaign, job = create_campaign(subject, message, recipient_type, created_by=get_jwt().get('username'))
         
-        recipients = query.all()
-        email_list = [reg.email for reg in recipients]
+        return jsonify({
+            'success': True,
+            'message': f'Bulk email queued for {campaign.total_recipients} recipients',
+            'recipient_count': campaign.total_recipients,
+            'campaign': campaign.to_dict(),
+            'job': job.to_dict()
+        }), 202
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Failed to send bulk email: {str(e)}'}), 500
+
+@admin_bp.route('/admin/bulk-email/<campaign_id>', methods=['GET'])
+@jwt_required()
+def get_bulk_email(campaign_id):
+    """Get the progress of a bulk email campaign"""
+    try:
+        campaign = EmailCampaign.query.filter_by(campaign_id=campaign_id).first()
         
-        # In a real application, you would integrate with an email service here
-        # For now, we'll just return the count of emails that would be sent
+        if not campaign:
+            return jsonify({'error': 'Campaign not found'}), 404
         
         return jsonify({
             'success': True,
-            'message': f'Bulk email queued for {len(email_list)} recipients',
-            'recipient_count': len(email_list)
+            'data': campaign.to_dict()
         }), 200
         
     except Exception as e:
-        return jsonify({'error': f'Failed to send bulk email: {str(e)}'}), 500
+        return jsonify({'error': f'Failed to retrieve campaign: {str(e)}'}), 500
+
+@admin_bp.route('/admin/bulk-email/<campaign_id>/resume', methods=['POST'])
+@jwt_required()
+def resume_bulk_email(campaign_id):
+    """Resume a failed bulk email campaign from its checkpoint"""
+    try:
+        campaign = EmailCampaign.query.filter_by(campaign_id=campaign_id).first()
+        
+        if not campaign:
+            return jsonify({'error': 'Campaign not found'}), 404
+        
+        if campaign.status != 'failed':
+            return jsonify({'error': f'Campaign is {campaign.status}'}), 409
+        
+        job = queue_campaign(campaign, created_by=get_jwt().get('username'))
+        
+        return jsonify({
+            'success': True,
+            'message': f'Campaign resumed after recipient {campaign.last_recipient_id}',
+            'campaign': campaign.to_dict(),
+            'job': job.to_dict()
+        }), 202
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Failed to resume campaign: {str(e)}'}), 500
+
+@admin_bp.route('/admin/jobs', methods=['POST'])
+@jwt_required()
+def create_job():
+    """Queue a background job (export, bulk-email)"""
+    try:
+        data = request.get_json() or {}
+        
+        kind = data.get('kind')
+        if not kind:
+            return jsonify({'error': 'Job kind is required'}), 400
+        
+        try:
+            job = job_queue.enqueue(
+                kind,
+                data.get('params') or {},
+                created_by=get_jwt().get('username'),
+                max_attempts=data.get('max_attempts')
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return jsonify({
+            'success': True,
+            'message': 'Job queued successfully',
+            'data': job.to_dict()
+        }), 202
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Failed to queue job: {str(e)}'}), 500
+
+@admin_bp.route('/admin/jobs', methods=['GET'])
+@jwt_required()
+def get_jobs():
+    """Get background jobs with pagination and filtering"""
+    try:
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        status = request.args.get('status')
+        kind = request.args.get('kind')
+        
+        query = Job.query
+        
+        if status:
+            query = query.filter_by(status=status)
+        if kind:
+            query = query.filter_by(kind=kind)
+        
+        paginated = query.order_by(Job.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        
+        return jsonify({
+            'success': True,
+            'data': [job.to_dict() for job in paginated.items],
+            'pagination': {
+                'page': page,
+                'per_page': per_page,
+                'total': paginated.total,
+                'pages': paginated.pages,
+                'has_next': paginated.has_next,
+                'has_prev': paginated.has_prev
+            }
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to retrieve jobs: {str(e)}'}), 500
+
+@admin_bp.route('/admin/jobs/<job_id>', methods=['GET'])
+@jwt_required()
+def get_job(job_id):
+    """Get the status of a background job"""
+    try:
+        job = Job.query.filter_by(job_id=job_id).first()
+        
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'data': job.to_dict()
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to retrieve job: {str(e)}'}), 500
+
+@admin_bp.route('/admin/jobs/<job_id>/result', methods=['GET'])
+@jwt_required()
+def download_job_result(job_id):
+    """Download the result file of a finished job"""
+    try:
+        job = Job.query.filter_by(job_id=job_id).first()
+        
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        if job.status != 'succeeded':
+            return jsonify({'error': f'Job is {job.status}', 'data': job.to_dict()}), 409
+        
+        if not job.result_path or not os.path.exists(job.result_path):
+            return jsonify({'error': 'Job has no result file'}), 404
+        
+        return send_file(
+            job.result_path,
+            as_attachment=True,
+            download_name=os.path.basename(job.result_path)
+        )
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to download job result: {str(e)}'}), 500
 
 @admin_bp.route('/admin/reports/summary', methods=['GET'])
 @jwt_required()
@@ -851,84 +1037,38 @@ def get_summary_report():
         else:
             end_date = datetime.utcnow()
         
-        # Registrations in date range
-        registrations_query = Registration.query.filter(
-            Registration.created_at >= start_date,
-            Registration.created_at <= end_date
-        )
-        
-        # Papers in date range
-        papers_query = PaperSubmission.query.filter(
-            PaperSubmission.created_at >= start_date,
-            PaperSubmission.created_at <= end_date
-        )
-        
-        # Messages in date range
-        messages_query = ContactMessage.query.filter(
-            ContactMessage.created_at >= start_date,
-            ContactMessage.created_at <= end_date
-        )
-        
-        report = {
-            'period': {
-                'start_date': start_date.isoformat(),
-                'end_date': end_date.isoformat()
-            },
-            'registrations': {
-                'total': registrations_query.count(),
-                'by_status': {},
-                'by_category': {},
-                'revenue': 0
-            },
-            'papers': {
-                'total': papers_query.count(),
-                'by_status': {},
-                'by_category': {}
-            },
-            'messages': {
-                'total': messages_query.count(),
-                'by_status': {}
-            }
-        }
-        
-        # Registration breakdown
-        for status in RegistrationStatus:
-            count = registrations_query.filter_by(status=status).count()
-            report['registrations']['by_status'][status.value] = count
-        
-        from src.models.conference import RegistrationCategory
-        for category in RegistrationCategory:
-            count = registrations_query.filter_by(category=category).count()
-            report['registrations']['by_category'][category.value] = count
-        
-        # Calculate revenue
-        revenue = db.session.query(db.func.sum(Registration.payment_amount)).filter(
-            Registration.created_at >= start_date,
-            Registration.created_at <= end_date,
-            Registration.payment_status == 'paid'
-        ).scalar() or 0
-        report['registrations']['revenue'] = revenue
-        
-        # Paper breakdown
-        for status in PaperStatus:
-            count = papers_query.filter_by(status=status).count()
-            report['papers']['by_status'][status.value] = count
+        return jsonify({
+            'success': True,
+            'data': summary_report(start_date, end_date)
+        }), 200
         
-        from src.models.conference import PaperCategory
-        for category in PaperCategory:
-            count = papers_query.filter_by(category=category).count()
-            report['papers']['by_category'][category.value] = count
+    except Exception as e:
+        return jsonify({'error': f'Failed to generate report: {str(e)}'}), 500
+
+@admin_bp.route('/admin/cache/stats', methods=['GET'])
+@jwt_required()
+def get_cache_stats():
+    """Get response cache hit/miss counters"""
+    try:
+        return jsonify({
+            'success': True,
+            'data': response_cache.stats()
+        }), 200
         
-        # Message breakdown
-        message_statuses = ['new', 'read', 'responded', 'closed']
-        for status in message_statuses:
-            count = messages_query.filter_by(status=status).count()
-            report['messages']['by_status'][status] = count
+    except Exception as e:
+        return jsonify({'error': f'Failed to retrieve cache statistics: {str(e)}'}), 500
+
+@admin_bp.route('/admin/cache/clear', methods=['POST'])
+@require_role('admin')
+def clear_cache():
+    """Drop every cached response"""
+    try:
+        response_cache.clear()
         
         return jsonify({
             'success': True,
-            'data': report
+            'message': 'Cache cleared successfully'
         }), 200
         
     except Exception as e:
-        return jsonify({'error': f'Failed to generate report: {str(e)}'}), 500
\ No newline at end of file
+        return jsonify({'error': f'Failed to clear cache: {str(e)}'}), 500
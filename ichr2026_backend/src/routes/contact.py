@@ -2,11 +2,17 @@ from flask import Blueprint, request, jsonify
 from datetime import datetime
 import uuid
 from src.models.user import db
-from src.models.conference import ContactMessage
+from src.models.conference import ContactMessage, CONTACT_SUBJECT_KEYWORDS
+from src.services.stats import contact_stats
+from src.services.cache import cached, invalidates
+from src.services.etag import query_fingerprint, row_etag, instance_etag, is_fresh, not_modified, with_etag
+from src.services.pagination import wants_cursor, keyset_response
+from src.services.profiles import requested_profile, apply_profile, serialize_rows
 
 contact_bp = Blueprint('contact', __name__)
 
 @contact_bp.route('/contact', methods=['POST'])
+@invalidates('messages')
 def create_contact_message():
     """Create a new contact message"""
     try:
@@ -54,15 +60,21 @@ def create_contact_message():
 def get_contact_message(message_id):
     """Get contact message details by ID"""
     try:
-        message = ContactMessage.query.filter_by(message_id=message_id).first()
+        # Revalidation only needs the row's version
+        if request.if_none_match:
+            etag = row_etag(ContactMessage, message_id=message_id)
+            if is_fresh(etag):
+                return not_modified(etag)
+        
+        message = ContactMessage.query.options(db.undefer_group('detail')).filter_by(message_id=message_id).first()
         
         if not message:
             return jsonify({'error': 'Message not found'}), 404
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'data': message.to_dict()
-        }), 200
+        }), instance_etag(message)), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve message: {str(e)}'}), 500
@@ -83,29 +95,31 @@ def get_all_contact_messages():
             query = query.filter_by(status=status)
         
         if subject_filter:
-            # Filter by subject categories
-            subject_keywords = {
-                'paper-submission': ['paper', 'submission', 'submit'],
-                'registration': ['registration', 'register', 'signup'],
-                'accommodation': ['accommodation', 'hotel', 'stay'],
-                'programme': ['programme', 'program', 'schedule'],
-                'sponsorship': ['sponsor', 'partnership', 'support'],
-                'general': ['general', 'inquiry', 'question']
-            }
-            
-            if subject_filter in subject_keywords:
-                keywords = subject_keywords[subject_filter]
-                conditions = [ContactMessage.subject.contains(keyword) for keyword in keywords]
-                query = query.filter(db.or_(*conditions))
+            # Filter by the subject category stored at insert time
+            if subject_filter in CONTACT_SUBJECT_KEYWORDS:
+                query = query.filter_by(subject_category=subject_filter)
+        
+        # Table rows by default; ?view=detail returns full records
+        profile = requested_profile()
+        
+        # Opt-in keyset pagination seeks on (created_at, id) instead of OFFSET
+        if wants_cursor():
+            return keyset_response(query, ContactMessage, profile)
+        
+        # The fingerprint query doubles as the pagination count
+        etag, total = query_fingerprint(query, ContactMessage)
+        if is_fresh(etag):
+            return not_modified(etag)
         
         # Paginate results
-        messages = query.order_by(ContactMessage.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        messages = apply_profile(query, ContactMessage, profile).order_by(ContactMessage.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
+        messages.total = total
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
-            'data': [msg.to_dict() for msg in messages.items],
+            'data': serialize_rows(messages.items, ContactMessage, profile),
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -114,12 +128,13 @@ def get_all_contact_messages():
                 'has_next': messages.has_next,
                 'has_prev': messages.has_prev
             }
-        }), 200
+        }), etag), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve messages: {str(e)}'}), 500
 
 @contact_bp.route('/contact/<message_id>/respond', methods=['PUT'])
+@invalidates('messages')
 def respond_to_message(message_id):
     """Respond to a contact message (admin endpoint)"""
     try:
@@ -156,6 +171,7 @@ def respond_to_message(message_id):
         return jsonify({'error': f'Failed to add response: {str(e)}'}), 500
 
 @contact_bp.route('/contact/<message_id>/status', methods=['PUT'])
+@invalidates('messages')
 def update_message_status(message_id):
     """Update contact message status"""
     try:
@@ -190,6 +206,7 @@ def update_message_status(message_id):
         return jsonify({'error': f'Failed to update status: {str(e)}'}), 500
 
 @contact_bp.route('/contact/<message_id>', methods=['DELETE'])
+@invalidates('messages')
 def delete_contact_message(message_id):
     """Delete a contact message (admin only)"""
     try:
@@ -211,64 +228,20 @@ def delete_contact_message(message_id):
         return jsonify({'error': f'Failed to delete message: {str(e)}'}), 500
 
 @contact_bp.route('/contact/stats', methods=['GET'])
+@cached('messages')
 def get_contact_stats():
     """Get contact message statistics"""
     try:
-        total_messages = ContactMessage.query.count()
-        
-        # Count by status
-        status_stats = {}
-        valid_statuses = ['new', 'read', 'responded', 'closed']
-        for status in valid_statuses:
-            count = ContactMessage.query.filter_by(status=status).count()
-            status_stats[status] = count
-        
-        # Recent messages (last 7 days)
-        from datetime import timedelta
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_messages = ContactMessage.query.filter(
-            ContactMessage.created_at >= week_ago
-        ).count()
-        
-        # Unread messages
-        unread_messages = ContactMessage.query.filter_by(status='new').count()
-        
-        # Response rate
-        responded_messages = ContactMessage.query.filter_by(status='responded').count()
-        response_rate = (responded_messages / total_messages * 100) if total_messages > 0 else 0
-        
-        # Subject breakdown
-        subject_stats = {}
-        subject_keywords = {
-            'paper-submission': ['paper', 'submission', 'submit'],
-            'registration': ['registration', 'register', 'signup'],
-            'accommodation': ['accommodation', 'hotel', 'stay'],
-            'programme': ['programme', 'program', 'schedule'],
-            'sponsorship': ['sponsor', 'partnership', 'support'],
-            'general': ['general', 'inquiry', 'question']
-        }
-        
-        for category, keywords in subject_keywords.items():
-            conditions = [ContactMessage.subject.contains(keyword) for keyword in keywords]
-            count = ContactMessage.query.filter(db.or_(*conditions)).count()
-            subject_stats[category] = count
-        
         return jsonify({
             'success': True,
-            'data': {
-                'total_messages': total_messages,
-                'status_breakdown': status_stats,
-                'recent_messages': recent_messages,
-                'unread_messages': unread_messages,
-                'response_rate': round(response_rate, 2),
-                'subject_breakdown': subject_stats
-            }
+            'data': contact_stats()
         }), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve statistics: {str(e)}'}), 500
 
 @contact_bp.route('/contact/subjects', methods=['GET'])
+@cached('contact-subjects', ttl=3600)
 def get_contact_subjects():
     """Get available contact subjects for the form"""
     subjects = [
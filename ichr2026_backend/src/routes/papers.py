@@ -4,7 +4,22 @@ from datetime import datetime, timedelta
 import uuid
 import os
 from src.models.user import db
-from src.models.conference import PaperSubmission, PaperCategory, PaperStatus
+from src.models.conference import PaperSubmission, PaperCategory, PaperStatus, PaperUpload
+from src.services.stats import paper_stats
+from src.services.cache import cached, invalidates
+from src.services.etag import query_fingerprint, row_etag, instance_etag, is_fresh, not_modified, with_etag
+from src.services.pagination import wants_cursor, keyset_response
+from src.services.profiles import requested_profile, apply_profile, serialize_rows
+from src.services.blobs import (
+    BlobMissing, blob_path, blob_root, blob_stored, incoming_folder, acquire_blob, release_blob, remove_unreferenced_blob
+)
+from src.services.documents import schedule_processing, discard_thumbnail
+from src.services.downloads import send_stored_file
+from src.services.uploads import (
+    PIECE_SIZE, MULTIPART_OVERHEAD, UploadError, UploadTooLarge, UploadConflict,
+    max_upload_bytes, receive_multipart, discard_upload, create_upload_session, append_upload_chunk,
+    check_upload_complete, complete_upload, cancel_upload
+)
 
 papers_bp = Blueprint('papers', __name__)
 
@@ -25,29 +40,66 @@ def ensure_upload_folder():
     return upload_path
 
 @papers_bp.route('/papers/submit', methods=['POST'])
+@invalidates('papers')
 def submit_paper():
     """Submit a new paper for review"""
+    upload = None
     try:
-        # Handle file upload
-        if 'file' not in request.files:
+        boundary = request.mimetype_params.get('boundary')
+        if request.mimetype != 'multipart/form-data' or not boundary:
             return jsonify({'error': 'No file uploaded'}), 400
         
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
+        # Refuse bodies that cannot fit before reading any of them
+        limit = max_upload_bytes()
+        if request.content_length and request.content_length > limit + MULTIPART_OVERHEAD:
+            return jsonify({'error': str(UploadTooLarge(limit))}), 413
         
-        if not allowed_file(file.filename):
-            return jsonify({'error': 'Invalid file type. Only PDF, DOC, and DOCX files are allowed'}), 400
+        # Generate unique submission ID
+        submission_id = f"ICHR2026-SUB-{uuid.uuid4().hex[:8].upper()}"
+        
+        def destination(filename, fields):
+            if not allowed_file(filename):
+                raise UploadError('Invalid file type. Only PDF, DOC, and DOCX files are allowed')
+            # Content that is already stored only needs its hash checked
+            if blob_stored(fields.get('file_sha256', '').lower()):
+                return None
+            return os.path.join(incoming_folder(), f"{submission_id}_{secure_filename(filename)}")
+        
+        # The file is written to disk while the body is read
+        try:
+            form, upload = receive_multipart(request.stream, boundary, 'file', destination, limit)
+        except UploadTooLarge as e:
+            return jsonify({'error': str(e)}), 413
+        except UploadError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        declared_sha256 = form.get('file_sha256', '').lower()
+        if upload is not None and declared_sha256 and upload.sha256 != declared_sha256:
+            discard_upload(upload)
+            return jsonify({'error': 'Uploaded file does not match file_sha256'}), 400
+        
+        # ...or was sent earlier through a resumable upload
+        resumable = None
+        if upload is None:
+            if not form.get('upload_id'):
+                return jsonify({'error': 'No file uploaded'}), 400
+            resumable = PaperUpload.query.filter_by(upload_id=form['upload_id']).first()
+            if not resumable:
+                return jsonify({'error': 'Upload not found'}), 404
+            try:
+                check_upload_complete(resumable)
+            except UploadError as e:
+                return jsonify({'error': str(e), 'offset': resumable.received_size}), 409
         
         # Get form data
-        title = request.form.get('title')
-        abstract = request.form.get('abstract')
-        keywords = request.form.get('keywords')
-        category = request.form.get('category')
-        authors = request.form.get('authors')
-        email = request.form.get('email')
-        affiliation = request.form.get('affiliation')
-        phone = request.form.get('phone')
+        title = form.get('title')
+        abstract = form.get('abstract')
+        keywords = form.get('keywords')
+        category = form.get('category')
+        authors = form.get('authors')
+        email = form.get('email')
+        affiliation = form.get('affiliation')
+        phone = form.get('phone')
         
         # Validate required fields
         required_fields = {
@@ -63,28 +115,30 @@ def submit_paper():
         
         for field_name, field_value in required_fields.items():
             if not field_value:
+                discard_upload(upload)
                 return jsonify({'error': f'Missing required field: {field_name}'}), 400
         
         # Validate category
         try:
             paper_category = PaperCategory(category)
         except ValueError:
+            discard_upload(upload)
             return jsonify({'error': 'Invalid paper category'}), 400
         
-        # Generate unique submission ID
-        submission_id = f"ICHR2026-SUB-{uuid.uuid4().hex[:8].upper()}"
+        if resumable is not None:
+            upload = complete_upload(resumable)
+        
+        # Identical files share one blob
+        try:
+            acquire_blob(upload)
+        except BlobMissing as e:
+            db.session.rollback()
+            return jsonify({'error': str(e)}), 409
+        stored, upload = upload, None
         
-        # Save file
-        upload_path = ensure_upload_folder()
-        filename = secure_filename(file.filename)
         # Add timestamp to filename to avoid conflicts
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{submission_id}_{timestamp}_{filename}"
-        file_path = os.path.join(upload_path, filename)
-        file.save(file_path)
-        
-        # Get file info
-        file_size = os.path.getsize(file_path)
+        filename = f"{submission_id}_{timestamp}_{secure_filename(stored.filename)}"
         file_type = filename.rsplit('.', 1)[1].lower()
         
         # Create paper submission record
@@ -99,14 +153,17 @@ def submit_paper():
             affiliation=affiliation,
             phone=phone,
             file_name=filename,
-            file_path=file_path,
-            file_size=file_size,
+            file_path=stored.path,
+            file_size=stored.size,
             file_type=file_type,
+            file_sha256=stored.sha256,
             status=PaperStatus.SUBMITTED,
             review_deadline=datetime.utcnow() + timedelta(days=30)  # 30 days for review
         )
         
         db.session.add(paper)
+        # Page count, text and preview are extracted later by a background job
+        schedule_processing()
         db.session.commit()
         
         return jsonify({
@@ -118,21 +175,119 @@ def submit_paper():
         
     except Exception as e:
         db.session.rollback()
+        discard_upload(upload)
         return jsonify({'error': f'Paper submission failed: {str(e)}'}), 500
 
+def upload_offset_response(upload, status=200):
+    response = jsonify({'success': True, 'data': upload.to_dict()})
+    response.headers['Upload-Offset'] = str(upload.received_size)
+    response.headers['Upload-Length'] = str(upload.total_size)
+    response.headers['Cache-Control'] = 'no-store'
+    return response, status
+
+@papers_bp.route('/papers/uploads', methods=['POST'])
+def create_paper_upload():
+    """Start a resumable paper file upload"""
+    try:
+        data = request.get_json() or {}
+        filename = data.get('filename')
+        if not filename:
+            return jsonify({'error': 'Missing required field: filename'}), 400
+        if not allowed_file(filename):
+            return jsonify({'error': 'Invalid file type. Only PDF, DOC, and DOCX files are allowed'}), 400
+        try:
+            size = int(data.get('size'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Missing required field: size'}), 400
+        
+        try:
+            upload = create_upload_session(filename, size, ensure_upload_folder(), max_upload_bytes())
+        except UploadTooLarge as e:
+            return jsonify({'error': str(e)}), 413
+        except UploadError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        response, status = upload_offset_response(upload, 201)
+        response.headers['Location'] = f'/api/papers/uploads/{upload.upload_id}'
+        response.headers['Upload-Chunk-Size'] = str(PIECE_SIZE)
+        return response, status
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Failed to start upload: {str(e)}'}), 500
+
+@papers_bp.route('/papers/uploads/<upload_id>', methods=['GET'])
+def get_paper_upload(upload_id):
+    """Get the offset a resumable upload continues from"""
+    try:
+        upload = PaperUpload.query.filter_by(upload_id=upload_id).first()
+        if not upload:
+            return jsonify({'error': 'Upload not found'}), 404
+        return upload_offset_response(upload)
+        
+    except Exception as e:
+        return jsonify({'error': f'Failed to get upload: {str(e)}'}), 500
+
+@papers_bp.route('/papers/uploads/<upload_id>', methods=['PATCH'])
+def append_paper_upload(upload_id):
+    """Append the next piece of a resumable upload at the Upload-Offset header"""
+    try:
+        upload = PaperUpload.query.filter_by(upload_id=upload_id).first()
+        if not upload:
+            return jsonify({'error': 'Upload not found'}), 404
+        try:
+            offset = int(request.headers['Upload-Offset'])
+        except (KeyError, ValueError):
+            return jsonify({'error': 'Missing or invalid Upload-Offset header'}), 400
+        
+        try:
+            append_upload_chunk(upload, offset, request.stream)
+        except UploadConflict as e:
+            response = jsonify({'error': str(e), 'offset': e.offset})
+            response.headers['Upload-Offset'] = str(e.offset)
+            return response, 409
+        except UploadError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return upload_offset_response(upload)
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Upload failed: {str(e)}'}), 500
+
+@papers_bp.route('/papers/uploads/<upload_id>', methods=['DELETE'])
+def delete_paper_upload(upload_id):
+    """Abandon a resumable upload"""
+    try:
+        upload = PaperUpload.query.filter_by(upload_id=upload_id).first()
+        if not upload:
+            return jsonify({'error': 'Upload not found'}), 404
+        cancel_upload(upload)
+        return jsonify({'success': True, 'message': 'Upload cancelled'})
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Failed to cancel upload: {str(e)}'}), 500
+
 @papers_bp.route('/papers/<submission_id>', methods=['GET'])
 def get_paper(submission_id):
     """Get paper details by submission ID"""
     try:
-        paper = PaperSubmission.query.filter_by(submission_id=submission_id).first()
+        # Revalidation only needs the row's version
+        if request.if_none_match:
+            etag = row_etag(PaperSubmission, submission_id=submission_id)
+            if is_fresh(etag):
+                return not_modified(etag)
+        
+        paper = PaperSubmission.query.options(db.undefer_group('detail')).filter_by(submission_id=submission_id).first()
         
         if not paper:
             return jsonify({'error': 'Paper submission not found'}), 404
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'data': paper.to_dict()
-        }), 200
+        }), instance_etag(paper)), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve paper: {str(e)}'}), 500
@@ -167,14 +322,27 @@ def get_all_papers():
         if author_email:
             query = query.filter_by(corresponding_author_email=author_email)
         
+        # Table rows by default; ?view=detail returns full records
+        profile = requested_profile()
+        
+        # Opt-in keyset pagination seeks on (created_at, id) instead of OFFSET
+        if wants_cursor():
+            return keyset_response(query, PaperSubmission, profile)
+        
+        # The fingerprint query doubles as the pagination count
+        etag, total = query_fingerprint(query, PaperSubmission)
+        if is_fresh(etag):
+            return not_modified(etag)
+        
         # Paginate results
-        papers = query.order_by(PaperSubmission.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        papers = apply_profile(query, PaperSubmission, profile).order_by(PaperSubmission.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
+        papers.total = total
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
-            'data': [paper.to_dict() for paper in papers.items],
+            'data': serialize_rows(papers.items, PaperSubmission, profile),
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -183,12 +351,13 @@ def get_all_papers():
                 'has_next': papers.has_next,
                 'has_prev': papers.has_prev
             }
-        }), 200
+        }), etag), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve papers: {str(e)}'}), 500
 
 @papers_bp.route('/papers/<submission_id>/review', methods=['PUT'])
+@invalidates('papers')
 def update_paper_review(submission_id):
     """Update paper review status and comments"""
     try:
@@ -230,6 +399,7 @@ def update_paper_review(submission_id):
         return jsonify({'error': f'Failed to update paper review: {str(e)}'}), 500
 
 @papers_bp.route('/papers/<submission_id>', methods=['DELETE'])
+@invalidates('papers')
 def delete_paper(submission_id):
     """Delete a paper submission (admin only)"""
     try:
@@ -238,13 +408,24 @@ def delete_paper(submission_id):
         if not paper:
             return jsonify({'error': 'Paper submission not found'}), 404
         
-        # Delete file if it exists
-        if paper.file_path and os.path.exists(paper.file_path):
-            os.remove(paper.file_path)
+        # Drop the paper's reference to its file; the blob goes with the last one
+        unreferenced = None
+        if paper.file_sha256 and paper.file_path == blob_path(paper.file_sha256):
+            if release_blob(paper.file_sha256):
+                unreferenced = paper.file_sha256
+            file_path = None
+        else:
+            file_path = paper.file_path
         
         db.session.delete(paper)
         db.session.commit()
         
+        # Files go only once the deletion is committed, so a failed commit leaves them in place
+        if unreferenced and remove_unreferenced_blob(unreferenced):
+            discard_thumbnail(unreferenced)
+        elif file_path and os.path.exists(file_path):
+            os.remove(file_path)
+        
         return jsonify({
             'success': True,
             'message': 'Paper submission deleted successfully'
@@ -255,6 +436,7 @@ def delete_paper(submission_id):
         return jsonify({'error': f'Failed to delete paper: {str(e)}'}), 500
 
 @papers_bp.route('/papers/categories', methods=['GET'])
+@cached('paper-categories', ttl=3600)
 def get_paper_categories():
     """Get available paper categories"""
     categories = [
@@ -268,50 +450,13 @@ def get_paper_categories():
     }), 200
 
 @papers_bp.route('/papers/stats', methods=['GET'])
+@cached('papers')
 def get_paper_stats():
     """Get paper submission statistics"""
     try:
-        total_submissions = PaperSubmission.query.count()
-        
-        # Count by category
-        category_stats = {}
-        for category in PaperCategory:
-            count = PaperSubmission.query.filter_by(category=category).count()
-            category_stats[category.value] = count
-        
-        # Count by status
-        status_stats = {}
-        for status in PaperStatus:
-            count = PaperSubmission.query.filter_by(status=status).count()
-            status_stats[status.value] = count
-        
-        # Recent submissions (last 7 days)
-        from datetime import timedelta
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_submissions = PaperSubmission.query.filter(
-            PaperSubmission.created_at >= week_ago
-        ).count()
-        
-        # Papers pending review
-        pending_review = PaperSubmission.query.filter_by(
-            status=PaperStatus.SUBMITTED
-        ).count()
-        
-        # Average review score
-        avg_score = db.session.query(db.func.avg(PaperSubmission.review_score)).filter(
-            PaperSubmission.review_score.isnot(None)
-        ).scalar()
-        
         return jsonify({
             'success': True,
-            'data': {
-                'total_submissions': total_submissions,
-                'category_breakdown': category_stats,
-                'status_breakdown': status_stats,
-                'recent_submissions': recent_submissions,
-                'pending_review': pending_review,
-                'average_review_score': round(avg_score, 2) if avg_score else None
-            }
+            'data': paper_stats()
         }), 200
         
     except Exception as e:
@@ -329,11 +474,12 @@ def download_paper(submission_id):
         if not paper.file_path or not os.path.exists(paper.file_path):
             return jsonify({'error': 'Paper file not found'}), 404
         
-        from flask import send_file
-        return send_file(
+        # Identical content shares a blob, so its hash is a strong validator for If-Range
+        return send_stored_file(
             paper.file_path,
-            as_attachment=True,
-            download_name=f"{paper.submission_id}_{paper.file_name}"
+            f"{paper.submission_id}_{paper.file_name}",
+            etag=paper.file_sha256,
+            accel_root=blob_root()
         )
         
     except Exception as e:
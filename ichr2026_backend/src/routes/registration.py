@@ -3,6 +3,11 @@ from datetime import datetime
 import uuid
 from src.models.user import db
 from src.models.conference import Registration, RegistrationCategory, RegistrationStatus
+from src.services.stats import registration_stats
+from src.services.cache import cached, invalidates
+from src.services.etag import query_fingerprint, row_etag, instance_etag, is_fresh, not_modified, with_etag
+from src.services.pagination import wants_cursor, keyset_response
+from src.services.profiles import apply_profile, serialize_rows
 
 registration_bp = Blueprint('registration', __name__)
 
@@ -15,6 +20,7 @@ REGISTRATION_FEES = {
 }
 
 @registration_bp.route('/registration', methods=['POST'])
+@invalidates('registrations')
 def create_registration():
     """Create a new conference registration"""
     try:
@@ -72,15 +78,21 @@ def create_registration():
 def get_registration(registration_id):
     """Get registration details by ID"""
     try:
+        # Revalidation only needs the row's version
+        if request.if_none_match:
+            etag = row_etag(Registration, registration_id=registration_id)
+            if is_fresh(etag):
+                return not_modified(etag)
+        
         registration = Registration.query.filter_by(registration_id=registration_id).first()
         
         if not registration:
             return jsonify({'error': 'Registration not found'}), 404
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
             'data': registration.to_dict()
-        }), 200
+        }), instance_etag(registration)), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve registration: {str(e)}'}), 500
@@ -111,14 +123,24 @@ def get_all_registrations():
             except ValueError:
                 return jsonify({'error': 'Invalid category filter'}), 400
         
+        # Opt-in keyset pagination seeks on (created_at, id) instead of OFFSET
+        if wants_cursor():
+            return keyset_response(query, Registration)
+        
+        # The fingerprint query doubles as the pagination count
+        etag, total = query_fingerprint(query, Registration)
+        if is_fresh(etag):
+            return not_modified(etag)
+        
         # Paginate results
-        registrations = query.order_by(Registration.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        registrations = apply_profile(query, Registration, 'detail').order_by(Registration.created_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False, count=False
         )
+        registrations.total = total
         
-        return jsonify({
+        return with_etag(jsonify({
             'success': True,
-            'data': [reg.to_dict() for reg in registrations.items],
+            'data': serialize_rows(registrations.items, Registration, 'detail'),
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -127,12 +149,13 @@ def get_all_registrations():
                 'has_next': registrations.has_next,
                 'has_prev': registrations.has_prev
             }
-        }), 200
+        }), etag), 200
         
     except Exception as e:
         return jsonify({'error': f'Failed to retrieve registrations: {str(e)}'}), 500
 
 @registration_bp.route('/registration/<registration_id>', methods=['PUT'])
+@invalidates('registrations')
 def update_registration(registration_id):
     """Update registration status or details"""
     try:
@@ -174,6 +197,7 @@ def update_registration(registration_id):
         return jsonify({'error': f'Failed to update registration: {str(e)}'}), 500
 
 @registration_bp.route('/registration/<registration_id>', methods=['DELETE'])
+@invalidates('registrations')
 def delete_registration(registration_id):
     """Delete a registration (admin only)"""
     try:
@@ -195,6 +219,7 @@ def delete_registration(registration_id):
         return jsonify({'error': f'Failed to delete registration: {str(e)}'}), 500
 
 @registration_bp.route('/registration/fees', methods=['GET'])
+@cached('registration-fees', ttl=3600)
 def get_registration_fees():
     """Get current registration fee structure"""
     return jsonify({
@@ -203,38 +228,13 @@ def get_registration_fees():
     }), 200
 
 @registration_bp.route('/registration/stats', methods=['GET'])
+@cached('registrations')
 def get_registration_stats():
     """Get registration statistics"""
     try:
-        total_registrations = Registration.query.count()
-        
-        # Count by category
-        category_stats = {}
-        for category in RegistrationCategory:
-            count = Registration.query.filter_by(category=category).count()
-            category_stats[category.value] = count
-        
-        # Count by status
-        status_stats = {}
-        for status in RegistrationStatus:
-            count = Registration.query.filter_by(status=status).count()
-            status_stats[status.value] = count
-        
-        # Recent registrations (last 7 days)
-        from datetime import timedelta
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_registrations = Registration.query.filter(
-            Registration.created_at >= week_ago
-        ).count()
-        
         return jsonify({
             'success': True,
-            'data': {
-                'total_registrations': total_registrations,
-                'category_breakdown': category_stats,
-                'status_breakdown': status_stats,
-                'recent_registrations': recent_registrations
-            }
+            'data': registration_stats()
         }), 200
         
     except Exception as e:
@@ -0,0 +1,192 @@
+"""Authorization for admin endpoints from JWT claims, with revocation checked against an in-memory denylist"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+from flask import jsonify
+from flask_jwt_extended import jwt_required, get_jwt
+from sqlalchemy.exc import IntegrityError
+from src.models.user import db
+from src.models.conference import AdminUser, RevokedToken
+from src.services.passwords import passwords
+
+logger = logging.getLogger(__name__)
+
+TOKEN_CLAIMS = ('username', 'email', 'role', 'ver')
+
+def token_claims(admin):
+    """Claims identifying admin in both of its tokens"""
+    return {'username': admin.username, 'email': admin.email, 'role': admin.role, 'ver': admin.token_version or 1}
+
+def ensure_default_admin():
+    """Create the default admin account on a database that has none"""
+    if AdminUser.query.filter_by(username='admin').first() is None:
+        db.session.add(AdminUser(
+            username='admin',
+            email='admin@ichr2026.org',
+            password_hash=passwords.hash_now('admin123'),
+            role='admin'
+        ))
+        db.session.commit()
+
+def retire_tokens(admin):
+    """Invalidate every token issued to admin so far, from the next commit on"""
+    admin.token_version = (admin.token_version or 1) + 1
+
+def require_role(*roles, refresh=False):
+    """jwt_required that also wants one of roles in the token's role claim (any role when none are given)"""
+    def decorator(view):
+        @wraps(view)
+        @jwt_required(refresh=refresh)
+        def wrapper(*args, **kwargs):
+            if roles and get_jwt().get('role') not in roles:
+                return jsonify({'error': 'Unauthorized access'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def _highest_admin_id():
+    # AUTOINCREMENT keeps the highest id ever issued in sqlite_sequence, deleted rows included
+    if db.engine.dialect.name != 'sqlite':
+        return 0
+    return db.session.execute(
+        db.text("SELECT seq FROM sqlite_sequence WHERE name = 'admin_users'")
+    ).scalar() or 0
+
+class TokenDenylist:
+    """Flask extension keeping the revocation state of this process in memory"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.versions = {}  # admin id -> token version, None when it may not sign in
+        self.max_user_id = 0
+        self.revoked_jtis = frozenset()
+        self.loaded_at = None
+        self.pid = None
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, jwt=None):
+        app.config.setdefault('AUTH_DENYLIST_REFRESH', 5)  # seconds between reloads, so how long other workers take to see a revocation
+        app.config.setdefault('AUTH_REVOKED_PURGE_INTERVAL', 3600)  # seconds between deletions of expired revocations
+        self.app = app
+        self.pid = None
+        self.versions = {}
+        self.max_user_id = 0
+        self.revoked_jtis = frozenset()
+        if jwt is not None:
+            jwt.token_in_blocklist_loader(self.is_revoked)
+        app.extensions['token_denylist'] = self
+
+    def refresh(self):
+        """Reload admin token versions and revoked jtis from the database"""
+        with self.app.app_context():
+            # Read before the rows: an account created in between is then either listed or above the mark
+            highest_id = _highest_admin_id()
+            users = db.session.execute(db.select(AdminUser.id, AdminUser.token_version, AdminUser.is_active)).all()
+            jtis = db.session.execute(
+                db.select(RevokedToken.jti).where(RevokedToken.expires_at > datetime.utcnow())
+            ).scalars().all()
+            db.session.remove()
+        # Swapped in whole, so readers never see a half-built snapshot
+        self.versions = {row.id: (row.token_version or 1) if row.is_active else None for row in users}
+        # A high-water mark: deleting the newest admin must not make its id look unissued again
+        self.max_user_id = max(self.max_user_id, highest_id, max(self.versions, default=0))
+        self.revoked_jtis = frozenset(jtis)
+        self.loaded_at = datetime.utcnow()
+
+    def purge_expired(self):
+        """Delete the revocations of tokens that have expired on their own"""
+        with self.app.app_context():
+            deleted = RevokedToken.query.filter(RevokedToken.expires_at <= datetime.utcnow()).delete()
+            db.session.commit()
+            db.session.remove()
+        return deleted
+
+    def _refresh_loop(self):
+        interval = self.app.config['AUTH_DENYLIST_REFRESH']
+        purge_interval = self.app.config['AUTH_REVOKED_PURGE_INTERVAL']
+        purge_at = time.monotonic() + purge_interval
+        while not self.stopping.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('Reloading the token denylist failed')
+            if time.monotonic() >= purge_at:
+                purge_at = time.monotonic() + purge_interval
+                try:
+                    self.purge_expired()
+                except Exception:
+                    logger.exception('Purging expired token revocations failed')
+
+    def _ensure_loaded(self):
+        # The reload thread does not survive a fork; each process starts its own
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.refresh()
+            self.stopping.clear()
+            threading.Thread(target=self._refresh_loop, name='token-denylist', daemon=True).start()
+            self.pid = os.getpid()
+
+    def is_revoked(self, jwt_header, jwt_payload):
+        """flask_jwt_extended blocklist callback, answered from memory"""
+        self._ensure_loaded()
+        if jwt_payload['jti'] in self.revoked_jtis:
+            return True
+        user_id = int(jwt_payload['sub'])
+        if user_id in self.versions:
+            return self.versions[user_id] != jwt_payload.get('ver', 1)
+        # Ids up to the highest ever issued belong to deleted accounts; higher ones were created since the reload
+        return user_id <= self.max_user_id
+
+    def user_changed(self, admin):
+        """Apply a committed change to admin in this process without waiting for the reload"""
+        versions = dict(self.versions)
+        versions[admin.id] = (admin.token_version or 1) if admin.is_active else None
+        self.versions = versions
+        self.max_user_id = max(self.max_user_id, admin.id)
+
+    def user_deleted(self, user_id):
+        versions = dict(self.versions)
+        versions[user_id] = None
+        self.versions = versions
+
+    def revoke(self, *payloads):
+        """Record tokens as revoked and commit; tokens that are already revoked are skipped"""
+        jtis = {payload['jti'] for payload in payloads}
+        for attempt in range(2):
+            # Another worker may have revoked some already without this process having reloaded
+            stored = set(db.session.execute(
+                db.select(RevokedToken.jti).where(RevokedToken.jti.in_(jtis))
+            ).scalars())
+            for payload in payloads:
+                if payload['jti'] not in stored:
+                    db.session.add(RevokedToken(
+                        jti=payload['jti'],
+                        user_id=int(payload['sub']),
+                        token_type=payload.get('type', 'access'),
+                        expires_at=datetime.utcfromtimestamp(payload['exp']) if 'exp' in payload else datetime.max
+                    ))
+            try:
+                db.session.commit()
+                break
+            except IntegrityError:
+                # Revoked elsewhere between the check and the commit; the second pass finds it stored
+                db.session.rollback()
+                if attempt:
+                    raise
+        self.revoked_jtis = self.revoked_jtis | jtis
+
+    def stop(self):
+        self.stopping.set()
+        self.pid = None
+
+token_denylist = TokenDenylist()
@@ -0,0 +1,93 @@
+"""Content-addressed storage for paper files: one blob per SHA-256, reference counted in file_blobs"""
+
+import hashlib
+import os
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import select
+from src.models.user import db
+from src.models.conference import FileBlob
+
+BLOB_FOLDER = 'uploads/papers/blobs'
+INCOMING_FOLDER = 'uploads/papers/.incoming'
+
+class BlobMissing(Exception):
+    """A hash-only upload referenced content that is no longer stored"""
+
+def blob_root():
+    return os.path.join(current_app.root_path, BLOB_FOLDER)
+
+def incoming_folder():
+    path = os.path.join(current_app.root_path, INCOMING_FOLDER)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def blob_path(sha256, root=None):
+    return os.path.join(root or blob_root(), sha256[:2], sha256[2:4], sha256)
+
+def blob_stored(sha256):
+    return bool(sha256) and len(sha256) == 64 and os.path.exists(blob_path(sha256))
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def acquire_blob(stored):
+    """Add a reference to the blob of stored and move its content into place
+
+    Runs in the caller's transaction: the reference is only kept if the caller
+    commits. stored.path is the incoming file, or None when nothing was written
+    because the blob already existed; afterwards it is the blob path.
+    """
+    table = FileBlob.__table__
+    # Taking the row (and the write lock) first keeps remove_unreferenced_blob() from unlinking under us
+    referenced = db.session.execute(table.update().where(table.c.sha256 == stored.sha256).values(
+        ref_count=table.c.ref_count + 1, updated_at=datetime.utcnow()
+    )).rowcount
+    if not referenced:
+        db.session.execute(table.insert().values(
+            sha256=stored.sha256, size=stored.size, ref_count=1,
+            created_at=datetime.utcnow(), updated_at=datetime.utcnow()
+        ))
+
+    path = blob_path(stored.sha256)
+    if os.path.exists(path):
+        if stored.path is not None:
+            os.remove(stored.path)
+    elif stored.path is None:
+        raise BlobMissing('The stored copy of this file was removed; upload the file again')
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(stored.path, path)
+    stored.path = path
+    return path
+
+def release_blob(sha256):
+    """Drop a reference, returning whether it was the last one (caller commits)
+
+    Nothing is unlinked here, so a rollback leaves the blob in place; once the
+    caller has committed it passes the hash to remove_unreferenced_blob().
+    """
+    table = FileBlob.__table__
+    db.session.execute(table.update().where(table.c.sha256 == sha256, table.c.ref_count > 0).values(
+        ref_count=table.c.ref_count - 1, updated_at=datetime.utcnow()
+    ))
+    unreferenced = db.session.execute(
+        table.delete().where(table.c.sha256 == sha256, table.c.ref_count <= 0)
+    ).rowcount
+    return bool(unreferenced)
+
+def remove_unreferenced_blob(sha256):
+    """Unlink the blob of sha256 unless a reference to it was added since it was released"""
+    table = FileBlob.__table__
+    # A write statement takes the lock acquire_blob() needs, so no reference can appear while we unlink
+    db.session.execute(table.delete().where(table.c.sha256 == sha256, table.c.ref_count <= 0))
+    removed = db.session.execute(select(table.c.sha256).where(table.c.sha256 == sha256)).first() is None
+    path = blob_path(sha256)
+    if removed and os.path.exists(path):
+        os.remove(path)
+    db.session.commit()
+    return removed
@@ -0,0 +1,152 @@
+"""Bulk email campaigns to registrants, run as resumable background jobs"""
+
+import uuid
+from datetime import datetime
+from email.message import EmailMessage
+from string import Template
+from flask import current_app
+from src.models.user import db
+from src.models.conference import Registration, RegistrationStatus, EmailCampaign
+from src.services.jobs import job_handler, job_queue
+from src.services.mail import MailDispatcher
+
+# recipient_type -> registration status filter (anything else means all registrants)
+RECIPIENT_STATUSES = {
+    'confirmed': RegistrationStatus.CONFIRMED,
+    'pending': RegistrationStatus.PENDING
+}
+
+def _recipient_filter(statement, recipient_type):
+    if recipient_type in RECIPIENT_STATUSES:
+        statement = statement.where(Registration.__table__.c.status == RECIPIENT_STATUSES[recipient_type])
+    return statement
+
+def recipient_query(recipient_type):
+    """Core select of the recipients of a campaign, in id order"""
+    table = Registration.__table__
+    statement = db.select(
+        table.c.id, table.c.email, table.c.full_name, table.c.registration_id
+    ).order_by(table.c.id)
+    return _recipient_filter(statement, recipient_type)
+
+def recipient_count(recipient_type):
+    statement = db.select(db.func.count()).select_from(Registration.__table__)
+    return db.session.execute(_recipient_filter(statement, recipient_type)).scalar()
+
+def recipient_batches(recipient_type, after_id=0, batch_size=1000):
+    """Recipients with id > after_id in batches, each one a keyset query on the primary key"""
+    table = Registration.__table__
+    query = recipient_query(recipient_type)
+    while True:
+        batch = db.session.execute(query.where(table.c.id > after_id).limit(batch_size)).all()
+        if not batch:
+            return
+        yield batch
+        after_id = batch[-1].id
+
+class CampaignTemplate:
+    """Subject and body templates compiled once per campaign"""
+
+    def __init__(self, subject, body):
+        self.subject = Template(subject)
+        self.body = Template(body)
+        # Templates without placeholders render to the same text for everyone
+        personalised = self.subject.get_identifiers() or self.body.get_identifiers()
+        self.static = None if personalised else (subject, body)
+
+    def render(self, recipient):
+        if self.static is not None:
+            return self.static
+        values = {
+            'full_name': recipient.full_name,
+            'email': recipient.email,
+            'registration_id': recipient.registration_id
+        }
+        return self.subject.safe_substitute(values), self.body.safe_substitute(values)
+
+def render_batch(template, recipients, sender):
+    """One EmailMessage per recipient of a batch"""
+    messages = []
+    for recipient in recipients:
+        subject, body = template.render(recipient)
+        message = EmailMessage()
+        message['From'] = sender
+        message['To'] = recipient.email
+        message['Subject'] = subject
+        message.set_content(body)
+        messages.append(message)
+    return messages
+
+def create_campaign(subject, message, recipient_type='all', created_by=None):
+    """Store a campaign and queue the job sending it"""
+    campaign = EmailCampaign(
+        campaign_id=f"ICHR2026-MAIL-{uuid.uuid4().hex[:8].upper()}",
+        subject=subject,
+        message=message,
+        recipient_type=recipient_type,
+        total_recipients=recipient_count(recipient_type),
+        created_by=created_by
+    )
+    db.session.add(campaign)
+    db.session.commit()
+    return campaign, queue_campaign(campaign, created_by)
+
+def queue_campaign(campaign, created_by=None):
+    """Queue a job sending (or resuming) a campaign"""
+    job = job_queue.enqueue('bulk-email', {'campaign_id': campaign.campaign_id}, created_by=created_by)
+    campaign.job_id = job.job_id
+    db.session.commit()
+    return job
+
+def run_campaign(campaign_id, batch_size=None):
+    """Send a campaign from its checkpoint to the last recipient"""
+    config = current_app.config
+    campaign = EmailCampaign.query.filter_by(campaign_id=campaign_id).first()
+    if campaign is None:
+        raise LookupError(f'Unknown campaign: {campaign_id}')
+    if campaign.status == 'completed':
+        return campaign
+
+    template = CampaignTemplate(campaign.subject, campaign.message)
+    campaign.status = 'sending'
+    campaign.started_at = campaign.started_at or datetime.utcnow()
+    campaign.total_recipients = recipient_count(campaign.recipient_type)
+    db.session.commit()
+
+    try:
+        with MailDispatcher(config) as dispatcher:
+            for batch in recipient_batches(
+                campaign.recipient_type, campaign.last_recipient_id, batch_size or config['MAIL_BATCH_SIZE']
+            ):
+                failures = dispatcher.send_batch(render_batch(template, batch, config['MAIL_DEFAULT_SENDER']))
+                campaign.sent_count += len(batch) - len(failures)
+                campaign.failed_count += len(failures)
+                campaign.last_recipient_id = batch[-1].id
+                if failures:
+                    campaign.last_error = next(iter(failures.values()))
+                db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        campaign.status = 'failed'
+        campaign.last_error = f'{type(e).__name__}: {e}'
+        db.session.commit()
+        raise
+
+    campaign.status = 'completed'
+    campaign.finished_at = datetime.utcnow()
+    db.session.commit()
+    return campaign
+
+def validate_bulk_email(params):
+    if not EmailCampaign.query.filter_by(campaign_id=params.get('campaign_id')).first():
+        raise ValueError(f"Unknown campaign: {params.get('campaign_id')}")
+
+@job_handler('bulk-email', validate=validate_bulk_email)
+def run_bulk_email_job(params, workdir):
+    campaign = run_campaign(params['campaign_id'])
+    return {
+        'campaign_id': campaign.campaign_id,
+        'total_recipients': campaign.total_recipients,
+        'sent_count': campaign.sent_count,
+        'failed_count': campaign.failed_count
+    }, None
@@ -0,0 +1,239 @@
+"""Response cache for read-heavy views: @cached stores tagged responses, @invalidates drops them"""
+
+from collections import OrderedDict
+from functools import wraps
+import os
+import sqlite3
+import threading
+import time
+from flask import current_app, request, make_response, Response
+
+class MemoryCache:
+    """In-process LRU cache with per-entry TTL"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (expires_at, value, tags)
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl, tags=()):
+        with self.lock:
+            self.entries[key] = (time.time() + ttl, value, frozenset(tags))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate_tags(self, tags):
+        tags = set(tags)
+        with self.lock:
+            stale = [key for key, entry in self.entries.items() if entry[2] & tags]
+            for key in stale:
+                del self.entries[key]
+        return len(stale)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def size(self):
+        with self.lock:
+            return len(self.entries)
+
+class SQLiteCache:
+    """Cache stored in a SQLite file so every worker process shares hits"""
+
+    def __init__(self, path, max_entries=4096):
+        self.path = path
+        self.max_entries = max_entries
+        self.local = threading.local()
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with self._connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache_entries ('
+                'key TEXT PRIMARY KEY, expires_at REAL NOT NULL, '
+                'status INTEGER NOT NULL, mimetype TEXT, body BLOB NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache_tags ('
+                'tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key))'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS ix_cache_tags_key ON cache_tags (key)')
+
+    def _connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or getattr(self.local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def get(self, key):
+        row = self._connection().execute(
+            'SELECT expires_at, status, mimetype, body FROM cache_entries WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None or row[0] <= time.time():
+            return None
+        return bytes(row[3]), row[1], row[2]
+
+    def set(self, key, value, ttl, tags=()):
+        body, status, mimetype = value
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute(
+                'INSERT OR REPLACE INTO cache_entries (key, expires_at, status, mimetype, body) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, time.time() + ttl, status, mimetype, body)
+            )
+            conn.execute('DELETE FROM cache_tags WHERE key = ?', (key,))
+            conn.executemany('INSERT INTO cache_tags (tag, key) VALUES (?, ?)', [(tag, key) for tag in tags])
+            # Expired entries go first, then the soonest to expire beyond the size limit
+            conn.execute('DELETE FROM cache_entries WHERE expires_at <= ?', (time.time(),))
+            conn.execute(
+                'DELETE FROM cache_entries WHERE key IN ('
+                'SELECT key FROM cache_entries ORDER BY expires_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            conn.execute('DELETE FROM cache_tags WHERE key NOT IN (SELECT key FROM cache_entries)')
+
+    def invalidate_tags(self, tags):
+        tags = list(tags)
+        if not tags:
+            return 0
+        placeholders = ', '.join('?' for _ in tags)
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            removed = conn.execute(
+                f'DELETE FROM cache_entries WHERE key IN '
+                f'(SELECT key FROM cache_tags WHERE tag IN ({placeholders}))', tags
+            ).rowcount
+            conn.execute(f'DELETE FROM cache_tags WHERE tag IN ({placeholders})', tags)
+        return removed
+
+    def clear(self):
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM cache_entries')
+            conn.execute('DELETE FROM cache_tags')
+
+    def size(self):
+        return self._connection().execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+
+class ResponseCache:
+    """Flask extension holding the configured backend and hit/miss counters"""
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.invalidations = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('CACHE_ENABLED', True)
+        app.config.setdefault('CACHE_BACKEND', 'memory')  # memory, sqlite
+        app.config.setdefault('CACHE_DEFAULT_TTL', 60)
+        app.config.setdefault('CACHE_MAX_ENTRIES', 1024)
+        app.config.setdefault('CACHE_SQLITE_PATH', os.path.join(app.instance_path, 'response_cache.db'))
+
+        if app.config['CACHE_BACKEND'] == 'sqlite':
+            self.backend = SQLiteCache(app.config['CACHE_SQLITE_PATH'], app.config['CACHE_MAX_ENTRIES'])
+        elif app.config['CACHE_BACKEND'] == 'memory':
+            self.backend = MemoryCache(app.config['CACHE_MAX_ENTRIES'])
+        else:
+            raise ValueError(f"Unknown CACHE_BACKEND: {app.config['CACHE_BACKEND']}")
+        app.extensions['response_cache'] = self
+
+    def _count(self, endpoint, outcome):
+        with self.lock:
+            counts = self.counters.setdefault(endpoint, {'hits': 0, 'misses': 0})
+            counts[outcome] += 1
+
+    def invalidate(self, *tags):
+        """Drop every cached response carrying one of the tags"""
+        with self.lock:
+            for tag in tags:
+                self.invalidations[tag] = self.invalidations.get(tag, 0) + 1
+        return self.backend.invalidate_tags(tags)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        with self.lock:
+            endpoints = {name: dict(counts) for name, counts in self.counters.items()}
+            invalidations = dict(self.invalidations)
+        hits = sum(counts['hits'] for counts in endpoints.values())
+        misses = sum(counts['misses'] for counts in endpoints.values())
+        return {
+            'backend': current_app.config['CACHE_BACKEND'],
+            'entries': self.backend.size(),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses) * 100, 2) if hits + misses else 0,
+            'endpoints': endpoints,
+            'invalidations': invalidations
+        }
+
+response_cache = ResponseCache()
+
+def cached(*tags, ttl=None):
+    """Cache a view's successful responses, keyed by path and query string"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not current_app.config.get('CACHE_ENABLED') or request.method != 'GET':
+                return view(*args, **kwargs)
+
+            key = f'{request.endpoint}:{request.full_path}'
+            entry = response_cache.backend.get(key)
+            if entry is not None:
+                response_cache._count(request.endpoint, 'hits')
+                body, status, mimetype = entry
+                response = Response(body, status=status, mimetype=mimetype)
+                response.headers['X-Cache'] = 'HIT'
+                return response
+
+            response_cache._count(request.endpoint, 'misses')
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.direct_passthrough:
+                response_cache.backend.set(
+                    key,
+                    (response.get_data(), response.status_code, response.mimetype),
+                    ttl or current_app.config['CACHE_DEFAULT_TTL'],
+                    tags
+                )
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+def invalidates(*tags):
+    """Invalidate cached responses with these tags after a successful write"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = make_response(view(*args, **kwargs))
+            if current_app.config.get('CACHE_ENABLED') and 200 <= response.status_code < 300:
+                response_cache.invalidate(*tags)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,284 @@
+"""Materialized statistics counters, kept current by mapper events so stats read O(buckets) rows"""
+
+from collections import defaultdict
+from enum import Enum
+from types import SimpleNamespace
+import click
+from flask.cli import AppGroup
+from sqlalchemy import event, inspect
+from src.models.user import db
+from src.models.conference import (
+    Registration, PaperSubmission, ContactMessage, StatsCounter
+)
+
+def _value(value):
+    if isinstance(value, Enum):
+        return value.value
+    return value if value is not None else ''
+
+def _day(created_at):
+    return created_at.date() if created_at else None
+
+def registration_counters(row):
+    """Counter buckets a registration contributes to, as (dimension, value, amount)"""
+    yield 'total', 'all', 0
+    yield 'status', _value(row.status), 0
+    yield 'category', _value(row.category), 0
+    yield 'payment_status', _value(row.payment_status), row.payment_amount or 0
+
+def paper_counters(row):
+    """Counter buckets a paper submission contributes to"""
+    yield 'total', 'all', 0
+    yield 'status', _value(row.status), 0
+    yield 'category', _value(row.category), 0
+    if row.review_score is not None:
+        yield 'review_score', 'scored', row.review_score
+
+def message_counters(row):
+    """Counter buckets a contact message contributes to"""
+    yield 'total', 'all', 0
+    yield 'status', _value(row.status), 0
+    yield 'subject', _value(row.subject_category), 0
+
+# entity name -> (model, tracked attributes, contribution function)
+COUNTED_MODELS = {
+    'registration': (
+        Registration,
+        ('created_at', 'status', 'category', 'payment_status', 'payment_amount'),
+        registration_counters
+    ),
+    'paper': (
+        PaperSubmission,
+        ('created_at', 'status', 'category', 'review_score'),
+        paper_counters
+    ),
+    'message': (
+        ContactMessage,
+        ('created_at', 'status', 'subject_category'),
+        message_counters
+    ),
+}
+
+def _contributions(entity, row, sign):
+    model, attributes, counters = COUNTED_MODELS[entity]
+    day = _day(row.created_at)
+    for dimension, value, amount in counters(row):
+        yield (dimension, str(value), day), (sign, sign * amount)
+
+def _apply_deltas(connection, entity, deltas):
+    """Add count/amount deltas to their buckets, creating missing buckets"""
+    table = StatsCounter.__table__
+    for (dimension, value, day), (count, amount) in deltas.items():
+        if count == 0 and amount == 0:
+            continue
+        match = db.and_(
+            table.c.entity == entity,
+            table.c.dimension == dimension,
+            table.c.value == value,
+            table.c.day == day
+        )
+        result = connection.execute(
+            table.update().where(match).values(
+                count=table.c.count + count,
+                amount=table.c.amount + amount
+            )
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(
+                entity=entity, dimension=dimension, value=value, day=day,
+                count=count, amount=amount
+            ))
+
+def _committed_values(target, attributes):
+    """Attribute values as they were before the pending flush"""
+    state = inspect(target)
+    values = {}
+    for name in attributes:
+        history = state.attrs[name].history
+        if history.deleted:
+            values[name] = history.deleted[0]
+        elif history.unchanged:
+            values[name] = history.unchanged[0]
+        else:
+            values[name] = None
+    return SimpleNamespace(**values)
+
+def _accumulate(deltas, contributions):
+    for key, (count, amount) in contributions:
+        current = deltas[key]
+        deltas[key] = (current[0] + count, current[1] + amount)
+
+def _listeners(entity):
+    model, attributes, counters = COUNTED_MODELS[entity]
+
+    def after_insert(mapper, connection, target):
+        deltas = defaultdict(lambda: (0, 0))
+        _accumulate(deltas, _contributions(entity, target, 1))
+        _apply_deltas(connection, entity, deltas)
+
+    def after_update(mapper, connection, target):
+        state = inspect(target)
+        if not any(state.attrs[name].history.has_changes() for name in attributes):
+            return
+        deltas = defaultdict(lambda: (0, 0))
+        _accumulate(deltas, _contributions(entity, _committed_values(target, attributes), -1))
+        _accumulate(deltas, _contributions(entity, target, 1))
+        _apply_deltas(connection, entity, deltas)
+
+    def after_delete(mapper, connection, target):
+        deltas = defaultdict(lambda: (0, 0))
+        _accumulate(deltas, _contributions(entity, _committed_values(target, attributes), -1))
+        _apply_deltas(connection, entity, deltas)
+
+    return after_insert, after_update, after_delete
+
+def register_counter_listeners():
+    """Attach the counter maintenance events to the counted models"""
+    for entity, (model, attributes, counters) in COUNTED_MODELS.items():
+        after_insert, after_update, after_delete = _listeners(entity)
+        event.listen(model, 'after_insert', after_insert)
+        event.listen(model, 'after_update', after_update)
+        event.listen(model, 'after_delete', after_delete)
+
+register_counter_listeners()
+
+class CounterResult:
+    """Summed buckets per (entity, dimension, value)"""
+
+    def __init__(self, rows):
+        self.buckets = {}
+        for entity, dimension, value, count, amount in rows:
+            self.buckets[(entity, dimension, value)] = {'count': count or 0, 'amount': amount or 0}
+
+    def get(self, entity, dimension, value, measure='count'):
+        bucket = self.buckets.get((entity, dimension, value))
+        return bucket[measure] if bucket else 0
+
+    def total(self, entity, measure='count'):
+        return self.get(entity, 'total', 'all', measure)
+
+    def breakdown(self, entity, dimension, members, measure='count'):
+        """Per-value sums for a dimension, with zero buckets for missing members"""
+        return {
+            _value(member): self.get(entity, dimension, _value(member), measure)
+            for member in members
+        }
+
+def read_counters(start_day=None, end_day=None):
+    """Sum every bucket over [start_day, end_day] in one grouped query"""
+    query = db.session.query(
+        StatsCounter.entity, StatsCounter.dimension, StatsCounter.value,
+        db.func.sum(StatsCounter.count), db.func.sum(StatsCounter.amount)
+    )
+    if start_day is not None:
+        query = query.filter(StatsCounter.day >= start_day)
+    if end_day is not None:
+        query = query.filter(StatsCounter.day <= end_day)
+    query = query.group_by(StatsCounter.entity, StatsCounter.dimension, StatsCounter.value)
+    return CounterResult(query.all())
+
+def daily_totals(start_day):
+    """Row counts per (entity, day) from start_day onwards"""
+    rows = db.session.query(
+        StatsCounter.entity, StatsCounter.day, StatsCounter.count
+    ).filter(
+        StatsCounter.dimension == 'total',
+        StatsCounter.day >= start_day
+    ).all()
+    totals = defaultdict(int)
+    for entity, day, count in rows:
+        totals[(entity, day)] += count
+    return totals
+
+def expected_counters(entity, batch_size=1000):
+    """Recompute an entity's buckets from the live table"""
+    model, attributes, counters = COUNTED_MODELS[entity]
+    columns = [getattr(model.__table__.c, name) for name in attributes]
+    deltas = defaultdict(lambda: (0, 0))
+    rows = db.session.execute(
+        db.select(*columns).execution_options(yield_per=batch_size)
+    )
+    for row in rows:
+        _accumulate(deltas, _contributions(entity, row, 1))
+    return {key: value for key, value in deltas.items() if value != (0, 0)}
+
+def stored_counters(entity):
+    """Current buckets of an entity as stored in stats_counters"""
+    rows = db.session.query(
+        StatsCounter.dimension, StatsCounter.value, StatsCounter.day,
+        StatsCounter.count, StatsCounter.amount
+    ).filter(StatsCounter.entity == entity).all()
+    return {
+        (dimension, value, day): (count, amount)
+        for dimension, value, day, count, amount in rows
+        if (count, amount) != (0, 0)
+    }
+
+def rebuild_counters(entities=None):
+    """Replace the stored buckets with ones recomputed from the live tables"""
+    table = StatsCounter.__table__
+    totals = {}
+    for entity in entities or COUNTED_MODELS:
+        expected = expected_counters(entity)
+        db.session.execute(table.delete().where(table.c.entity == entity))
+        if expected:
+            db.session.execute(table.insert(), [
+                {
+                    'entity': entity, 'dimension': dimension, 'value': value, 'day': day,
+                    'count': count, 'amount': amount
+                }
+                for (dimension, value, day), (count, amount) in expected.items()
+            ])
+        totals[entity] = len(expected)
+    db.session.commit()
+    return totals
+
+def check_counters(entities=None, tolerance=1e-6):
+    """Compare stored buckets with live counts and list every mismatch"""
+    mismatches = []
+    for entity in entities or COUNTED_MODELS:
+        expected = expected_counters(entity)
+        stored = stored_counters(entity)
+        for key in sorted(set(expected) | set(stored), key=str):
+            live_count, live_amount = expected.get(key, (0, 0))
+            stored_count, stored_amount = stored.get(key, (0, 0))
+            if live_count != stored_count or abs(live_amount - stored_amount) > tolerance:
+                dimension, value, day = key
+                mismatches.append({
+                    'entity': entity,
+                    'dimension': dimension,
+                    'value': value,
+                    'day': day.isoformat() if day else None,
+                    'live': {'count': live_count, 'amount': live_amount},
+                    'stored': {'count': stored_count, 'amount': stored_amount}
+                })
+    return mismatches
+
+def ensure_counters():
+    """Seed the counters table on first start against an existing database"""
+    if StatsCounter.query.first() is None:
+        rebuild_counters()
+
+stats_cli = AppGroup('stats', help='Maintain the materialized statistics counters.')
+
+@stats_cli.command('rebuild')
+@click.option('--entity', 'entities', multiple=True, type=click.Choice(list(COUNTED_MODELS)))
+def rebuild_command(entities):
+    """Recompute stats_counters from the live tables."""
+    totals = rebuild_counters(entities or None)
+    for entity, buckets in totals.items():
+        click.echo(f'{entity}: {buckets} buckets')
+
+@stats_cli.command('check')
+@click.option('--entity', 'entities', multiple=True, type=click.Choice(list(COUNTED_MODELS)))
+def check_command(entities):
+    """Compare stats_counters with live counts; exits non-zero on drift."""
+    mismatches = check_counters(entities or None)
+    for mismatch in mismatches:
+        click.echo(
+            f"{mismatch['entity']}.{mismatch['dimension']}={mismatch['value']} "
+            f"day={mismatch['day']}: live={mismatch['live']} stored={mismatch['stored']}"
+        )
+    if mismatches:
+        raise SystemExit(f'{len(mismatches)} counter buckets drifted; run `flask stats rebuild`')
+    click.echo('Counters are consistent with live data')
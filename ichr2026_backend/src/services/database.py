@@ -0,0 +1,54 @@
+"""SQLite connection settings (WAL, busy timeout, page cache) and pool sizing for the application's engine"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from src.models.user import db
+
+def is_sqlite_file(uri):
+    url = make_url(uri)
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+def init_database(app):
+    """Bind db to app, tuning the pool and every connection of a file-based SQLite database"""
+    # SQLite's own defaults are 'delete', 'full', 5000, 0 and -2000; in-memory databases keep them
+    # WAL: readers keep reading while one writer commits; the mode is stored in the database file
+    app.config.setdefault('SQLITE_JOURNAL_MODE', 'wal')
+    # With WAL, fsync only at checkpoints: an application crash loses nothing, a power failure the last commits
+    app.config.setdefault('SQLITE_SYNCHRONOUS', 'normal')
+    app.config.setdefault('SQLITE_BUSY_TIMEOUT', 15000)  # milliseconds a writer queues for the lock before failing
+    app.config.setdefault('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)  # bytes
+    app.config.setdefault('SQLITE_CACHE_SIZE', -16 * 1024)  # negative: KiB per connection
+    # Pooled connections keep their cache and mmap; sized for the threads of one process so overflow stays rare
+    app.config.setdefault('SQLITE_POOL_SIZE', 10)
+    app.config.setdefault('SQLITE_MAX_OVERFLOW', 10)
+
+    sqlite_file = is_sqlite_file(app.config['SQLALCHEMY_DATABASE_URI'])
+    if sqlite_file:
+        options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+        options.setdefault('pool_size', app.config['SQLITE_POOL_SIZE'])
+        options.setdefault('max_overflow', app.config['SQLITE_MAX_OVERFLOW'])
+        # A local file has no server to drop idle connections, so they are neither pinged nor recycled
+        options.setdefault('pool_pre_ping', False)
+        options.setdefault('pool_recycle', -1)
+
+    db.init_app(app)
+
+    if sqlite_file:
+        pragmas = [
+            f"PRAGMA journal_mode={app.config['SQLITE_JOURNAL_MODE']}",
+            f"PRAGMA synchronous={app.config['SQLITE_SYNCHRONOUS']}",
+            f"PRAGMA busy_timeout={int(app.config['SQLITE_BUSY_TIMEOUT'])}",
+            f"PRAGMA mmap_size={int(app.config['SQLITE_MMAP_SIZE'])}",
+            f"PRAGMA cache_size={int(app.config['SQLITE_CACHE_SIZE'])}",
+        ]
+
+        def configure_connection(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+        with app.app_context():
+            event.listen(db.engine, 'connect', configure_connection)
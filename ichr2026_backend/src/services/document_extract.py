@@ -0,0 +1,67 @@
+"""Page count, text and preview extraction for paper files; runs in the processing pool, so no Flask or database here"""
+
+import os
+import zipfile
+from xml.etree import ElementTree
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+APP_NAMESPACE = '{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}'
+
+class UnsupportedDocument(Exception):
+    """The file type cannot be processed in this installation"""
+
+def _pymupdf():
+    try:
+        import pymupdf
+    except ImportError:  # optional, only needed to process PDFs
+        try:
+            import fitz as pymupdf  # PyMuPDF releases before 1.24
+        except ImportError:
+            raise UnsupportedDocument('PDF processing requires the PyMuPDF package')
+    return pymupdf
+
+def _extract_pdf(path, thumbnail_path, thumbnail_width, text_limit):
+    pymupdf = _pymupdf()
+    with pymupdf.open(path) as document:
+        parts, length = [], 0
+        for page in document:
+            if length >= text_limit:
+                break
+            text = page.get_text()
+            parts.append(text)
+            length += len(text)
+
+        thumbnail = None
+        if document.page_count and thumbnail_path:
+            first = document[0]
+            zoom = thumbnail_width / first.rect.width
+            os.makedirs(os.path.dirname(thumbnail_path), exist_ok=True)
+            first.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False).save(thumbnail_path)
+            thumbnail = thumbnail_path
+        return document.page_count, ''.join(parts)[:text_limit], thumbnail
+
+def _extract_docx(path, text_limit):
+    with zipfile.ZipFile(path) as document:
+        body = ElementTree.fromstring(document.read('word/document.xml'))
+        paragraphs, length = [], 0
+        for paragraph in body.iter(f'{WORD_NAMESPACE}p'):
+            text = ''.join(node.text or '' for node in paragraph.iter(f'{WORD_NAMESPACE}t'))
+            paragraphs.append(text)
+            length += len(text) + 1
+            if length >= text_limit:
+                break
+
+        page_count = None
+        if 'docProps/app.xml' in document.namelist():
+            pages = ElementTree.fromstring(document.read('docProps/app.xml')).find(f'{APP_NAMESPACE}Pages')
+            if pages is not None and (pages.text or '').isdigit():
+                page_count = int(pages.text)
+    return page_count, '\n'.join(paragraphs)[:text_limit], None
+
+def extract_document(path, file_type, thumbnail_path=None, thumbnail_width=320, text_limit=200000):
+    """(page count, text, thumbnail path or None) of a paper file; runs in a pool process"""
+    if file_type == 'pdf':
+        return _extract_pdf(path, thumbnail_path, thumbnail_width, text_limit)
+    if file_type == 'docx':
+        return _extract_docx(path, text_limit)
+    raise UnsupportedDocument(f'No extractor for .{file_type} files')
@@ -0,0 +1,161 @@
+"""Background processing of submitted paper files: page count, search text and first-page preview"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from flask import current_app
+from src.models.user import db
+from src.models.conference import PaperSubmission, Job
+from src.services.document_extract import extract_document, UnsupportedDocument
+from src.services.jobs import job_handler, job_queue
+
+THUMBNAIL_FOLDER = 'uploads/papers/thumbnails'
+
+def init_document_config(app):
+    app.config.setdefault('PAPER_PROCESS_WORKERS', max(1, (os.cpu_count() or 2) // 2))
+    app.config.setdefault('PAPER_PROCESS_BATCH', 0)  # papers claimed at a time, 0 for two per worker
+    app.config.setdefault('PAPER_PROCESS_TIMEOUT', 600)  # seconds before an unfinished claim is retried
+    app.config.setdefault('PAPER_TEXT_LIMIT', 200000)  # characters of text kept per paper
+    app.config.setdefault('PAPER_THUMBNAIL_WIDTH', 320)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def processing_pool():
+    """The process pool shared by every processing job of this process"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned, not forked: forking a process that runs request and job threads is unsafe
+            context = multiprocessing.get_context('spawn')
+            _pool = ProcessPoolExecutor(max_workers=current_app.config['PAPER_PROCESS_WORKERS'], mp_context=context)
+        return _pool
+
+def _discard_pool():
+    # A crashed child breaks the whole pool; the next batch gets a fresh one
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+def thumbnail_path(sha256):
+    return os.path.join(current_app.root_path, THUMBNAIL_FOLDER, sha256[:2], f'{sha256}.png')
+
+def discard_thumbnail(sha256):
+    path = thumbnail_path(sha256)
+    if os.path.exists(path):
+        os.remove(path)
+
+def schedule_processing():
+    """Queue a processing job unless one is already waiting to start"""
+    if Job.query.filter_by(kind='process-papers', status='queued').first() is None:
+        return job_queue.enqueue('process-papers')
+    return None
+
+def claim_pending(limit):
+    """Mark up to limit pending (or abandoned) papers as processing, returning their ids"""
+    table = PaperSubmission.__table__
+    now = datetime.utcnow()
+    claimable = db.or_(
+        table.c.processing_status == 'pending',
+        db.and_(
+            table.c.processing_status == 'processing',
+            table.c.updated_at < now - timedelta(seconds=current_app.config['PAPER_PROCESS_TIMEOUT'])
+        )
+    )
+    candidates = db.select(table.c.id).where(claimable).order_by(table.c.id).limit(limit)
+    ids = [row.id for row in db.session.execute(candidates)]
+    if not ids:
+        return []
+    # The claim timestamp tells our rows apart from those another worker claimed meanwhile
+    db.session.execute(table.update().where(table.c.id.in_(ids), claimable).values(
+        processing_status='processing', updated_at=now
+    ))
+    db.session.commit()
+    return [row.id for row in db.session.execute(db.select(table.c.id).where(
+        table.c.id.in_(ids), table.c.processing_status == 'processing', table.c.updated_at == now
+    ))]
+
+def _copy_results(paper, source):
+    paper.processing_status = source.processing_status
+    paper.processing_error = source.processing_error
+    paper.page_count = source.page_count
+    paper.document_text = source.document_text
+    paper.thumbnail_path = source.thumbnail_path
+
+def process_batch(papers):
+    """Extract every paper of a claimed batch in the pool and store the results"""
+    config = current_app.config
+    futures = {}
+    for paper in papers:
+        key = paper.file_sha256 or paper.id
+        if key in futures or not paper.file_path:
+            continue
+        futures[key] = processing_pool().submit(
+            extract_document, paper.file_path, paper.file_type,
+            thumbnail_path(paper.file_sha256) if paper.file_sha256 else None,
+            config['PAPER_THUMBNAIL_WIDTH'], config['PAPER_TEXT_LIMIT']
+        )
+
+    for paper in papers:
+        paper.processed_at = datetime.utcnow()
+        paper.processing_error = None
+        if not paper.file_path:
+            paper.processing_status = 'unsupported'
+            paper.processing_error = 'No file uploaded'
+            continue
+        try:
+            page_count, text, thumbnail = futures[paper.file_sha256 or paper.id].result()
+        except UnsupportedDocument as e:
+            paper.processing_status = 'unsupported'
+            paper.processing_error = str(e)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                _discard_pool()
+            paper.processing_status = 'failed'
+            paper.processing_error = f'{type(e).__name__}: {e}'
+        else:
+            paper.processing_status = 'done'
+            paper.page_count = page_count
+            paper.document_text = text
+            paper.thumbnail_path = thumbnail
+    db.session.commit()
+
+def process_pending_papers():
+    """Process pending papers batch by batch until none are left, returning counts per outcome"""
+    config = current_app.config
+    batch_size = config['PAPER_PROCESS_BATCH'] or 2 * config['PAPER_PROCESS_WORKERS']
+    counts = {}
+    while True:
+        ids = claim_pending(batch_size)
+        if not ids:
+            return counts
+        papers = PaperSubmission.query.filter(PaperSubmission.id.in_(ids)).all()
+
+        # A file already processed for another submission is not extracted again
+        pending = []
+        for paper in papers:
+            source = None
+            if paper.file_sha256:
+                source = PaperSubmission.query.filter(
+                    PaperSubmission.file_sha256 == paper.file_sha256,
+                    PaperSubmission.processing_status == 'done',
+                    PaperSubmission.id != paper.id
+                ).first()
+            if source is not None:
+                _copy_results(paper, source)
+                paper.processed_at = datetime.utcnow()
+            else:
+                pending.append(paper)
+        process_batch(pending)
+
+        for paper in papers:
+            counts[paper.processing_status] = counts.get(paper.processing_status, 0) + 1
+
+@job_handler('process-papers')
+def run_process_papers_job(params, workdir):
+    return process_pending_papers(), None
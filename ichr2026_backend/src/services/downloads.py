@@ -0,0 +1,49 @@
+"""Resumable file downloads (ETag, Range) that the reverse proxy can serve through FILE_OFFLOAD"""
+
+import os
+from flask import current_app, request
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
+from werkzeug.utils import send_file
+
+FILE_OFFLOAD_MODES = (None, 'x-sendfile', 'x-accel-redirect')
+
+def init_download_config(app):
+    app.config.setdefault('FILE_OFFLOAD', None)  # None, x-sendfile, x-accel-redirect
+    app.config.setdefault('FILE_ACCEL_PREFIX', '/_protected/papers/')
+    app.config.setdefault('FILE_ACCEL_ROOT', None)  # directory behind FILE_ACCEL_PREFIX
+    if app.config['FILE_OFFLOAD'] not in FILE_OFFLOAD_MODES:
+        raise ValueError(f"Unknown FILE_OFFLOAD: {app.config['FILE_OFFLOAD']}")
+
+def send_stored_file(path, download_name, etag=None, accel_root=None):
+    """Attachment response for a file on disk, conditional and ranged, offloaded when configured"""
+    config = current_app.config
+    offload = config['FILE_OFFLOAD']
+    try:
+        response = send_file(
+            path,
+            request.environ,
+            as_attachment=True,
+            download_name=download_name,
+            etag=etag or True,
+            use_x_sendfile=offload is not None,
+            # With offload the web server serves the ranges; only 304s are answered here
+            conditional=offload is None,
+            response_class=current_app.response_class
+        )
+    except RequestedRangeNotSatisfiable as e:
+        return e.get_response(request.environ)
+
+    response.cache_control.private = True
+    response.accept_ranges = 'bytes'
+    if offload is None:
+        return response
+
+    response = response.make_conditional(request.environ)
+    if response.status_code == 304:
+        response.headers.pop('X-Sendfile', None)
+    elif offload == 'x-accel-redirect':
+        root = config['FILE_ACCEL_ROOT'] or accel_root or os.path.dirname(path)
+        relative = os.path.relpath(path, root).replace(os.sep, '/')
+        response.headers.pop('X-Sendfile', None)
+        response.headers['X-Accel-Redirect'] = config['FILE_ACCEL_PREFIX'].rstrip('/') + '/' + relative
+    return response
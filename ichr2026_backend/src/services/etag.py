@@ -0,0 +1,49 @@
+"""Conditional GET support (ETag / If-None-Match) for JSON API responses"""
+
+import hashlib
+from flask import request, make_response
+from src.models.user import db
+
+def _digest(*parts):
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def query_fingerprint(query, model):
+    """One aggregate query returning (etag, total rows) for a filtered list query"""
+    latest, total = query.order_by(None).with_entities(
+        db.func.max(model.updated_at), db.func.count()
+    ).one()
+    return _digest(request.full_path, latest.isoformat() if latest else None, total), total
+
+def row_etag(model, **filters):
+    """ETag of a single row looked up by filters, or None if there is no such row"""
+    row = db.session.query(model.id, model.updated_at).filter_by(**filters).first()
+    if row is None:
+        return None
+    return _digest(model.__tablename__, row.id, row.updated_at.isoformat() if row.updated_at else None)
+
+def instance_etag(instance):
+    """ETag of an already loaded row, matching row_etag"""
+    updated_at = instance.updated_at.isoformat() if instance.updated_at else None
+    return _digest(instance.__tablename__, instance.id, updated_at)
+
+def rows_etag(rows, *extra):
+    """ETag of an already fetched page from its rows' ids and versions"""
+    versions = [(row.id, row.updated_at.isoformat() if row.updated_at else None) for row in rows]
+    return _digest(request.full_path, versions, *extra)
+
+def is_fresh(etag):
+    """True when the client already holds the representation identified by etag"""
+    return etag is not None and request.if_none_match.contains(etag)
+
+def not_modified(etag):
+    response = make_response('', 304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+def with_etag(response, etag):
+    """Attach a strong ETag and ask clients to revalidate on every use"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
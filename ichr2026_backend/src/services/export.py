@@ -0,0 +1,281 @@
+"""Streamed CSV, JSON Lines and Parquet exports for the admin area"""
+
+import csv
+import importlib.util
+import io
+import json
+import os
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from flask import Response, jsonify, request, stream_with_context
+from src.models.user import db
+from src.models.conference import Registration, PaperSubmission
+from src.services.jobs import job_handler
+
+# Optional, only needed for ?format=parquet; imported by the first Parquet export, not at startup
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+def _pyarrow():
+    import pyarrow
+    import pyarrow.parquet
+    return pyarrow
+
+EXPORT_BATCH_SIZE = 2000
+PARQUET_BATCH_SIZE = 10000
+
+# format -> (file extension, mimetype)
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'jsonl': ('jsonl', 'application/x-ndjson'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+def _plain(value):
+    return value
+
+def _blank(value):
+    return value or ''
+
+def _enum(value):
+    return value.value if value else ''
+
+def _timestamp(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else ''
+
+def _csv_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return _timestamp(value)
+    return value
+
+def _json_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def _arrow_value(value):
+    return value.value if isinstance(value, Enum) else value
+
+# export name -> (model, [(header, column, formatter)])
+EXPORTS = {
+    'registrations': (Registration, [
+        ('Registration ID', 'registration_id', _plain),
+        ('Full Name', 'full_name', _plain),
+        ('Email', 'email', _plain),
+        ('Phone', 'phone', _plain),
+        ('Affiliation', 'affiliation', _plain),
+        ('Country', 'country', _plain),
+        ('Category', 'category', _enum),
+        ('Paper Title', 'paper_title', _blank),
+        ('Status', 'status', _enum),
+        ('Payment Status', 'payment_status', _blank),
+        ('Payment Amount', 'payment_amount', _blank),
+        ('Created At', 'created_at', _timestamp),
+    ]),
+    'papers': (PaperSubmission, [
+        ('Submission ID', 'submission_id', _plain),
+        ('Title', 'title', _plain),
+        ('Authors', 'authors', _plain),
+        ('Email', 'corresponding_author_email', _plain),
+        ('Affiliation', 'affiliation', _plain),
+        ('Category', 'category', _enum),
+        ('Status', 'status', _enum),
+        ('Review Score', 'review_score', _blank),
+        ('File Name', 'file_name', _blank),
+        ('Created At', 'created_at', _timestamp),
+    ]),
+}
+
+def parse_columns(columns):
+    """Column names from a comma-separated string or a list, without duplicates; None for all"""
+    if not columns:
+        return None
+    if isinstance(columns, str):
+        columns = columns.split(',')
+    return list(dict.fromkeys(column.strip() for column in columns if column.strip())) or None
+
+def export_fields(name, columns=None):
+    """(model, [(header, column, formatter)]) of an export, projected onto columns when given"""
+    model, fields = EXPORTS[name]
+    if not columns:
+        return model, fields
+
+    formatters = {column: formatter for header, column, formatter in fields}
+    projected = []
+    for column in columns:
+        if column not in model.__table__.c:
+            raise ValueError(f'Unknown column: {column}')
+        projected.append((column, column, formatters.get(column, _csv_value)))
+    return model, projected
+
+def row_batches(model, fields, batch_size=EXPORT_BATCH_SIZE):
+    """Raw Core rows of the selected columns in batches, read with yield_per in id order"""
+    table = model.__table__
+    statement = db.select(*[table.c[column] for header, column, formatter in fields]).order_by(table.c.id)
+    result = db.session.execute(statement.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield partition
+
+def csv_chunks(name, columns=None, batch_size=EXPORT_BATCH_SIZE):
+    """CSV text of an export, one chunk per batch of rows"""
+    model, fields = export_fields(name, columns)
+    formatters = [formatter for header, column, formatter in fields]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow([header for header, column, formatter in fields])
+    for rows in row_batches(model, fields, batch_size):
+        writer.writerows(
+            [format_value(value) for format_value, value in zip(formatters, row)] for row in rows
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def jsonl_chunks(name, columns=None, batch_size=EXPORT_BATCH_SIZE):
+    """JSON Lines of an export keyed by column name, one chunk per batch of rows"""
+    model, fields = export_fields(name, columns)
+    names = [column for header, column, formatter in fields]
+    for rows in row_batches(model, fields, batch_size):
+        yield ''.join(
+            json.dumps(dict(zip(names, map(_json_value, row))), ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
+def _arrow_type(column_type):
+    pyarrow = _pyarrow()
+    if isinstance(column_type, db.Enum):
+        return pyarrow.string()
+    if isinstance(column_type, db.Boolean):
+        return pyarrow.bool_()
+    if isinstance(column_type, db.Integer):
+        return pyarrow.int64()
+    if isinstance(column_type, db.Float):
+        return pyarrow.float64()
+    if isinstance(column_type, db.DateTime):
+        return pyarrow.timestamp('us')
+    if isinstance(column_type, db.Date):
+        return pyarrow.date32()
+    return pyarrow.string()
+
+class ChunkSink(io.RawIOBase):
+    """Write-only file collecting what the Parquet writer emits until it is drained"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def parquet_chunks(name, columns=None, batch_size=PARQUET_BATCH_SIZE):
+    """Parquet file of an export, one row group per batch, streamed as bytes"""
+    pyarrow = _pyarrow()
+    model, fields = export_fields(name, columns)
+    table = model.__table__
+    schema = pyarrow.schema([
+        pyarrow.field(column, _arrow_type(table.c[column].type)) for header, column, formatter in fields
+    ])
+    sink = ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema, compression='snappy')
+    try:
+        for rows in row_batches(model, fields, batch_size):
+            arrays = [
+                pyarrow.array([_arrow_value(row[index]) for row in rows], type=field.type)
+                for index, field in enumerate(schema)
+            ]
+            writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+def gzip_chunks(chunks, level=6):
+    """Compress a stream of text or byte chunks into one gzip member, chunk by chunk"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def streamed_export(chunks, filename, mimetype, compress=True):
+    """Streaming attachment response, gzip-encoded when the client accepts it"""
+    headers = {
+        'Content-Disposition': f'attachment; filename={filename}',
+        # Stop reverse proxies from buffering the whole download
+        'X-Accel-Buffering': 'no',
+        'Vary': 'Accept-Encoding'
+    }
+    if compress and request.accept_encodings['gzip'] > 0:
+        chunks = gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
+def export_response(name):
+    """Streamed export in the requested ?format=, projected onto ?columns="""
+    export_format = request.args.get('format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f'Unsupported export format: {export_format}'}), 400
+    if export_format == 'parquet' and not PYARROW_AVAILABLE:
+        return jsonify({'error': 'Parquet export requires the pyarrow package'}), 501
+
+    columns = parse_columns(request.args.get('columns'))
+    try:
+        # Validate the projection before the response starts streaming
+        export_fields(name, columns)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    extension, mimetype = EXPORT_FORMATS[export_format]
+    if export_format == 'parquet':
+        # Parquet pages are already compressed
+        return streamed_export(parquet_chunks(name, columns), f'{name}.{extension}', mimetype, compress=False)
+    chunks = jsonl_chunks(name, columns) if export_format == 'jsonl' else csv_chunks(name, columns)
+    return streamed_export(chunks, f'{name}.{extension}', mimetype)
+
+def validate_export_job(params):
+    if params.get('name') not in EXPORTS:
+        raise ValueError(f"Unknown export: {params.get('name')}")
+    export_format = params.setdefault('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f'Unsupported export format: {export_format}')
+    if export_format == 'parquet' and not PYARROW_AVAILABLE:
+        raise ValueError('Parquet export requires the pyarrow package')
+    params['columns'] = parse_columns(params.get('columns'))
+    export_fields(params['name'], params['columns'])
+
+@job_handler('export', validate=validate_export_job)
+def run_export_job(params, workdir):
+    """Write an export to a result file in the job's directory"""
+    name, export_format, columns = params['name'], params['format'], params['columns']
+    writers = {'csv': csv_chunks, 'jsonl': jsonl_chunks, 'parquet': parquet_chunks}
+    extension, mimetype = EXPORT_FORMATS[export_format]
+    path = os.path.join(workdir, f'{name}.{extension}')
+
+    size = 0
+    with open(path, 'wb') as output:
+        for chunk in writers[export_format](name, columns):
+            data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+            output.write(data)
+            size += len(data)
+    return {'name': name, 'format': export_format, 'columns': columns, 'bytes': size}, path
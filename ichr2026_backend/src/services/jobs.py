@@ -0,0 +1,225 @@
+"""Background jobs: rows in the jobs table claimed with leases by worker threads, retried with backoff"""
+
+import json
+import logging
+import os
+import shutil
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from src.models.user import db
+from src.models.conference import Job
+
+logger = logging.getLogger(__name__)
+
+# job kind -> (handler, params validator)
+JOB_HANDLERS = {}
+
+def job_handler(kind, validate=None):
+    """Register handler(params, workdir) -> (summary dict, result file path or None) for a job kind
+
+    validate(params) runs at enqueue time and raises ValueError for bad parameters.
+    """
+    def decorator(handler):
+        JOB_HANDLERS[kind] = (handler, validate)
+        return handler
+    return decorator
+
+class JobQueue:
+    """Flask extension enqueueing jobs and running the worker threads"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.threads = []
+        self.pid = None
+        self.start_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('JOB_WORKERS', 2)  # worker threads in this process, 0 for none
+        app.config.setdefault('JOB_CONCURRENCY', 2)  # running jobs across all processes
+        app.config.setdefault('JOB_MAX_ATTEMPTS', 3)
+        app.config.setdefault('JOB_RETRY_DELAY', 30)  # seconds, doubled after every failed attempt
+        app.config.setdefault('JOB_LEASE_SECONDS', 3600)
+        app.config.setdefault('JOB_POLL_INTERVAL', 2)
+        app.config.setdefault('JOB_RESULTS_DIR', os.path.join(app.instance_path, 'job_results'))
+        app.config.setdefault('JOB_AUTOSTART', True)  # start the workers with the first request
+        self.app = app
+        if app.config['JOB_AUTOSTART']:
+            app.before_request(self._start_once)
+        app.extensions['job_queue'] = self
+
+    def enqueue(self, kind, params=None, created_by=None, max_attempts=None):
+        """Validate parameters and queue a job, returning its row"""
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f'Unknown job kind: {kind}')
+        params = params or {}
+        handler, validate = JOB_HANDLERS[kind]
+        if validate is not None:
+            validate(params)
+
+        job = Job(
+            job_id=f"ICHR2026-JOB-{uuid.uuid4().hex[:8].upper()}",
+            kind=kind,
+            params=json.dumps(params),
+            max_attempts=max_attempts or current_app.config['JOB_MAX_ATTEMPTS'],
+            created_by=created_by
+        )
+        db.session.add(job)
+        db.session.commit()
+        self.wakeup.set()
+        return job
+
+    def claim(self):
+        """Lease the next runnable job, returning (id, attempt) or None"""
+        config = current_app.config
+        table = Job.__table__
+        now = datetime.utcnow()
+        expired = db.and_(table.c.status == 'running', table.c.lease_expires_at <= now)
+
+        with db.engine.begin() as connection:
+            # Jobs whose worker died on their last attempt are not retried again
+            connection.execute(table.update().where(
+                expired, table.c.attempts >= table.c.max_attempts
+            ).values(status='failed', error='Worker lease expired', finished_at=now, updated_at=now))
+
+            candidate = connection.execute(
+                db.select(table.c.id, table.c.status, table.c.attempts).where(db.or_(
+                    db.and_(table.c.status == 'queued', table.c.run_after <= now),
+                    expired
+                )).order_by(table.c.run_after, table.c.id).limit(1)
+            ).first()
+            if candidate is None:
+                return None
+
+            running = db.select(db.func.count()).select_from(table).where(
+                table.c.status == 'running', table.c.lease_expires_at > now
+            ).scalar_subquery()
+            claimed = connection.execute(table.update().where(
+                # attempts doubles as a version number, so only one claimant wins
+                table.c.id == candidate.id,
+                table.c.status == candidate.status,
+                table.c.attempts == candidate.attempts,
+                running < config['JOB_CONCURRENCY']
+            ).values(
+                status='running',
+                attempts=candidate.attempts + 1,
+                started_at=now,
+                lease_expires_at=now + timedelta(seconds=config['JOB_LEASE_SECONDS']),
+                worker=f'{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}',
+                updated_at=now
+            ))
+        return (candidate.id, candidate.attempts + 1) if claimed.rowcount == 1 else None
+
+    def run_next(self):
+        """Claim and run one job; False when nothing could be claimed"""
+        claim = self.claim()
+        if claim is None:
+            return False
+        job_id, attempt = claim
+        job = db.session.get(Job, job_id)
+        handler, validate = JOB_HANDLERS.get(job.kind, (None, None))
+        workdir = os.path.join(current_app.config['JOB_RESULTS_DIR'], job.job_id)
+
+        try:
+            if handler is None:
+                raise LookupError(f'No handler registered for job kind {job.kind}')
+            os.makedirs(workdir, exist_ok=True)
+            summary, result_path = handler(json.loads(job.params), workdir)
+        except Exception as e:
+            db.session.rollback()
+            logger.exception('Job %s failed on attempt %s', job.job_id, attempt)
+            shutil.rmtree(workdir, ignore_errors=True)
+            if self._still_owned(job, attempt):
+                self._record_failure(job, e)
+            return True
+
+        if self._still_owned(job, attempt):
+            job.status = 'succeeded'
+            job.result = json.dumps(summary)
+            job.result_path = result_path
+            job.error = None
+            job.finished_at = datetime.utcnow()
+            job.lease_expires_at = None
+            db.session.commit()
+        return True
+
+    def _still_owned(self, job, attempt):
+        # Another worker may have taken over after our lease expired
+        db.session.refresh(job)
+        return job.status == 'running' and job.attempts == attempt
+
+    def _record_failure(self, job, error):
+        now = datetime.utcnow()
+        job.error = f'{type(error).__name__}: {error}'
+        job.lease_expires_at = None
+        if job.attempts < job.max_attempts:
+            delay = current_app.config['JOB_RETRY_DELAY'] * 2 ** (job.attempts - 1)
+            job.status = 'queued'
+            job.run_after = now + timedelta(seconds=delay)
+        else:
+            job.status = 'failed'
+            job.finished_at = now
+        db.session.commit()
+
+    def _work(self):
+        while not self.stopping.is_set():
+            try:
+                with self.app.app_context():
+                    ran = self.run_next()
+            except Exception:
+                logger.exception('Job worker iteration failed')
+                ran = False
+            if not ran:
+                self.wakeup.wait(self.app.config['JOB_POLL_INTERVAL'])
+                self.wakeup.clear()
+
+    def _start_once(self):
+        # Threads do not survive a fork, so every process starts its own
+        if self.pid == os.getpid():
+            return
+        with self.start_lock:
+            if self.pid != os.getpid():
+                self.threads = [thread for thread in self.threads if thread.is_alive()]
+                self.start()
+                self.pid = os.getpid()
+
+    def start(self, workers=None):
+        """Start the worker threads of this process"""
+        workers = self.app.config['JOB_WORKERS'] if workers is None else workers
+        for index in range(len(self.threads), workers):
+            thread = threading.Thread(target=self._work, name=f'job-worker-{index}', daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self, timeout=None):
+        """Let running jobs finish and stop the worker threads"""
+        self.stopping.set()
+        self.wakeup.set()
+        for thread in self.threads:
+            thread.join(timeout)
+        self.threads = []
+        self.stopping.clear()
+
+job_queue = JobQueue()
+
+jobs_cli = AppGroup('jobs', help='Run and inspect background jobs.')
+
+@jobs_cli.command('work')
+@click.option('--workers', type=int, default=None, help='Worker threads (default: JOB_WORKERS).')
+def work_command(workers):
+    """Run job workers in the foreground until interrupted."""
+    job_queue.start(workers if workers is not None else max(1, current_app.config['JOB_WORKERS']))
+    click.echo(f'{len(job_queue.threads)} job workers running; press Ctrl+C to stop')
+    try:
+        while True:
+            job_queue.stopping.wait(3600)
+    except KeyboardInterrupt:
+        job_queue.stop()
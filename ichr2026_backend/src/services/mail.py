@@ -0,0 +1,147 @@
+"""Outgoing mail transports and the rate-limited MailDispatcher for campaigns"""
+
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+def init_mail_config(app):
+    app.config.setdefault('MAIL_BACKEND', 'null')  # smtp (persistent connections to MAIL_SERVER), null (discard)
+    app.config.setdefault('MAIL_SERVER', 'localhost')
+    app.config.setdefault('MAIL_PORT', 25)
+    app.config.setdefault('MAIL_USE_TLS', False)
+    app.config.setdefault('MAIL_USERNAME', None)
+    app.config.setdefault('MAIL_PASSWORD', None)
+    app.config.setdefault('MAIL_TIMEOUT', 30)
+    app.config.setdefault('MAIL_DEFAULT_SENDER', 'ichr2026@vau.ac.lk')
+    app.config.setdefault('MAIL_CONNECTIONS', 4)  # parallel SMTP connections kept open for a whole campaign
+    app.config.setdefault('MAIL_RATE_LIMIT', 0)  # messages per second, 0 for unlimited
+    app.config.setdefault('MAIL_BATCH_SIZE', 500)
+
+class SMTPTransport:
+    """One persistent SMTP connection, reopened when the server drops it"""
+
+    def __init__(self, config):
+        self.config = config
+        self.connection = None
+
+    def _connect(self):
+        connection = smtplib.SMTP(self.config['MAIL_SERVER'], self.config['MAIL_PORT'],
+                                  timeout=self.config['MAIL_TIMEOUT'])
+        if self.config['MAIL_USE_TLS']:
+            connection.starttls()
+        if self.config['MAIL_USERNAME']:
+            connection.login(self.config['MAIL_USERNAME'], self.config['MAIL_PASSWORD'])
+        self.connection = connection
+
+    def send(self, message):
+        if self.connection is None:
+            self._connect()
+        try:
+            self.connection.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # Idle connections get closed by the server; retry once on a fresh one
+            self._connect()
+            self.connection.send_message(message)
+
+    def close(self):
+        if self.connection is not None:
+            try:
+                self.connection.quit()
+            except smtplib.SMTPException:
+                self.connection.close()
+            self.connection = None
+
+class NullTransport:
+    """Discards messages; keeps a count for tests and dry runs"""
+
+    def __init__(self, config):
+        self.sent = 0
+
+    def send(self, message):
+        self.sent += 1
+
+    def close(self):
+        pass
+
+TRANSPORTS = {
+    'smtp': SMTPTransport,
+    'null': NullTransport,
+}
+
+class RateLimiter:
+    """Token bucket shared by every connection of a dispatcher"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class MailDispatcher:
+    """Sends message batches over a pool of persistent connections"""
+
+    def __init__(self, config):
+        if config['MAIL_BACKEND'] not in TRANSPORTS:
+            raise ValueError(f"Unknown MAIL_BACKEND: {config['MAIL_BACKEND']}")
+        self.config = config
+        self.transport_class = TRANSPORTS[config['MAIL_BACKEND']]
+        self.limiter = RateLimiter(config['MAIL_RATE_LIMIT'])
+        self.executor = ThreadPoolExecutor(max_workers=max(1, config['MAIL_CONNECTIONS']),
+                                           thread_name_prefix='mail')
+        self.local = threading.local()
+        self.transports = []
+        self.lock = threading.Lock()
+
+    def _transport(self):
+        # One connection per pool thread, reused for every message it sends
+        transport = getattr(self.local, 'transport', None)
+        if transport is None:
+            transport = self.transport_class(self.config)
+            self.local.transport = transport
+            with self.lock:
+                self.transports.append(transport)
+        return transport
+
+    def _send(self, message):
+        self.limiter.acquire()
+        try:
+            self._transport().send(message)
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+            # The server rejected this message; the connection itself is fine
+            return str(e)
+        return None
+
+    def send_batch(self, messages):
+        """Send every message and return {index: error} for the rejected ones
+
+        Connection failures propagate, so the caller can stop at its last checkpoint.
+        """
+        results = self.executor.map(self._send, messages)
+        return {index: error for index, error in enumerate(results) if error is not None}
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        for transport in self.transports:
+            transport.close()
+        self.transports = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
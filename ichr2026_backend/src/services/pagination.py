@@ -0,0 +1,68 @@
+"""Keyset (cursor) pagination on (created_at, id) for list endpoints"""
+
+import base64
+from datetime import datetime
+from flask import request, jsonify
+from src.models.user import db
+from src.services.etag import rows_etag, is_fresh, not_modified, with_etag
+from src.services.profiles import apply_profile, serialize_rows
+
+MAX_PER_PAGE = 100
+
+def encode_cursor(row):
+    """Opaque cursor pointing just past row"""
+    raw = f'{row.created_at.isoformat()}|{row.id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """(created_at, id) from a cursor, raising ValueError when it is malformed"""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    created_at, row_id = base64.urlsafe_b64decode(padded).decode('utf-8').split('|')
+    return datetime.fromisoformat(created_at), int(row_id)
+
+def keyset_page(query, model, cursor, per_page):
+    """Rows after cursor in (created_at, id) descending order, plus the next cursor"""
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    query = query.order_by(None).order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(db.tuple_(model.created_at, model.id) < db.tuple_(created_at, row_id))
+
+    rows = query.limit(per_page + 1).all()
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    return rows, (encode_cursor(rows[-1]) if has_next else None), per_page
+
+def wants_cursor():
+    """True when the request opted into cursor pagination"""
+    return 'cursor' in request.args
+
+def keyset_response(query, model, profile='detail'):
+    """Complete JSON list response for a cursor-paginated request, serialized with profile"""
+    cursor = request.args.get('cursor', '')
+    per_page = request.args.get('per_page', 20, type=int)
+    include_total = request.args.get('include_total', '').lower() in ('1', 'true', 'yes')
+
+    try:
+        rows, next_cursor, per_page = keyset_page(apply_profile(query, model, profile), model, cursor, per_page)
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+
+    etag = rows_etag(rows, next_cursor)
+    if not include_total and is_fresh(etag):
+        return not_modified(etag)
+
+    pagination = {
+        'cursor': cursor or None,
+        'next_cursor': next_cursor,
+        'per_page': per_page,
+        'has_next': next_cursor is not None
+    }
+    if include_total:
+        pagination['total'] = query.order_by(None).count()
+
+    return with_etag(jsonify({
+        'success': True,
+        'data': serialize_rows(rows, model, profile),
+        'pagination': pagination
+    }), etag), 200
@@ -0,0 +1,129 @@
+"""Password hashing for admin accounts (scrypt or argon2id) on a bounded pool of hashing threads"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.security import generate_password_hash, check_password_hash
+
+try:
+    import argon2
+except ImportError:  # optional, only needed for PASSWORD_HASH_METHOD = 'argon2'
+    argon2 = None
+
+HASH_METHODS = ('scrypt', 'argon2')
+
+class PasswordHashingBusy(Exception):
+    """Every hashing worker is busy and the wait queue is full"""
+
+class PasswordHashing:
+    """Flask extension hashing and verifying passwords on a bounded thread pool"""
+
+    def __init__(self, app=None):
+        self.config = None
+        self.pool = None
+        self.pid = None
+        self.slots = None
+        self.lock = threading.Lock()
+        self.argon2_hasher = None
+        self.dummy_hash = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PASSWORD_HASH_METHOD', 'scrypt')  # scrypt, argon2 (argon2-cffi); older hashes keep verifying
+        app.config.setdefault('PASSWORD_SCRYPT_N', 2 ** 15)
+        app.config.setdefault('PASSWORD_SCRYPT_R', 8)
+        app.config.setdefault('PASSWORD_SCRYPT_P', 1)
+        app.config.setdefault('PASSWORD_ARGON2_TIME_COST', 3)
+        app.config.setdefault('PASSWORD_ARGON2_MEMORY_COST', 64 * 1024)  # KiB
+        app.config.setdefault('PASSWORD_ARGON2_PARALLELISM', 1)
+        app.config.setdefault('PASSWORD_WORKERS', max(1, (os.cpu_count() or 2) // 2))  # caps the cores a burst of logins takes
+        app.config.setdefault('PASSWORD_QUEUE', 16)  # requests allowed to wait for a worker, beyond that PasswordHashingBusy
+
+        method = app.config['PASSWORD_HASH_METHOD']
+        if method not in HASH_METHODS:
+            raise ValueError(f'Unknown PASSWORD_HASH_METHOD: {method}')
+        if method == 'argon2' and argon2 is None:
+            raise ValueError("PASSWORD_HASH_METHOD 'argon2' requires the argon2-cffi package")
+        if argon2 is not None:
+            self.argon2_hasher = argon2.PasswordHasher(
+                time_cost=app.config['PASSWORD_ARGON2_TIME_COST'],
+                memory_cost=app.config['PASSWORD_ARGON2_MEMORY_COST'],
+                parallelism=app.config['PASSWORD_ARGON2_PARALLELISM']
+            )
+        self.config = app.config
+        self.dummy_hash = None
+        with self.lock:
+            if self.pool is not None:
+                self.pool.shutdown(wait=False)
+            self.pool = None
+        app.extensions['password_hashing'] = self
+
+    def _scrypt_method(self):
+        return f"scrypt:{self.config['PASSWORD_SCRYPT_N']}:{self.config['PASSWORD_SCRYPT_R']}:{self.config['PASSWORD_SCRYPT_P']}"
+
+    def hash_now(self, password):
+        """Hash password under the current settings in the calling thread"""
+        if self.config['PASSWORD_HASH_METHOD'] == 'argon2':
+            return self.argon2_hasher.hash(password)
+        return generate_password_hash(password, method=self._scrypt_method())
+
+    def verify_now(self, password_hash, password):
+        """True when password matches password_hash, checked in the calling thread"""
+        if password_hash is None:
+            # Same work as a real check, so unknown usernames cannot be told apart by timing
+            self.verify_now(self._dummy_hash(), password)
+            return False
+        if password_hash.startswith('$argon2'):
+            if self.argon2_hasher is None:
+                return False
+            try:
+                return self.argon2_hasher.verify(password_hash, password)
+            except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+                return False
+        return check_password_hash(password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True when password_hash was made with another method or other parameters"""
+        if self.config['PASSWORD_HASH_METHOD'] == 'argon2':
+            if not password_hash.startswith('$argon2'):
+                return True
+            try:
+                return self.argon2_hasher.check_needs_rehash(password_hash)
+            except argon2.exceptions.InvalidHashError:
+                return True
+        return password_hash.split('$', 1)[0] != self._scrypt_method()
+
+    def _dummy_hash(self):
+        if self.dummy_hash is None:
+            self.dummy_hash = self.hash_now(os.urandom(16).hex())
+        return self.dummy_hash
+
+    def _submit(self, fn, *args):
+        with self.lock:
+            # Worker threads do not survive a fork; each process builds its own pool
+            if self.pool is None or self.pid != os.getpid():
+                workers = self.config['PASSWORD_WORKERS']
+                self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password')
+                self.slots = threading.BoundedSemaphore(workers + self.config['PASSWORD_QUEUE'])
+                self.pid = os.getpid()
+            pool, slots = self.pool, self.slots
+        if not slots.acquire(blocking=False):
+            raise PasswordHashingBusy('Too many password checks in progress')
+        try:
+            future = pool.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future.result()
+
+    def hash(self, password):
+        """Hash password under the current settings on the worker pool"""
+        return self._submit(self.hash_now, password)
+
+    def verify(self, password_hash, password):
+        """Check password on the worker pool; a None hash (unknown user) always fails"""
+        return self._submit(self.verify_now, password_hash, password)
+
+passwords = PasswordHashing()
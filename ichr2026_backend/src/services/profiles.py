@@ -0,0 +1,18 @@
+"""Serializer profiles ('summary' for lists, 'detail' with ?view=detail) for list and detail responses"""
+
+from flask import request
+from src.services.serializers import row_serializer
+
+PROFILES = ('summary', 'detail')
+
+def requested_profile(default='summary'):
+    """Profile picked by ?view=, falling back to default"""
+    view = request.args.get('view', default)
+    return view if view in PROFILES else default
+
+def apply_profile(query, model, profile):
+    """Select only the columns the profile serializes, as plain rows"""
+    return row_serializer(model, profile).select(query)
+
+def serialize_rows(rows, model, profile):
+    return row_serializer(model, profile).dump(rows)
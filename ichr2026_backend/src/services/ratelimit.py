@@ -0,0 +1,94 @@
+"""In-memory token bucket rate limiting, per process, for admin logins"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+class TokenBucketLimiter:
+    """Token buckets for any number of keys"""
+
+    def __init__(self, capacity, rate, max_keys=10000):
+        self.capacity = capacity
+        self.rate = rate
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()  # key -> [tokens, last refill]
+        self.lock = threading.Lock()
+
+    def _refilled(self, bucket, now):
+        return min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+
+    def consume(self, key, tokens=1):
+        """(allowed, seconds until enough tokens) for an attempt costing tokens"""
+        now = time.monotonic()
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = [self.capacity, now]
+                self._prune(now)
+            else:
+                bucket[0] = self._refilled(bucket, now)
+                bucket[1] = now
+                self.buckets.move_to_end(key)
+
+            if bucket[0] >= tokens:
+                bucket[0] -= tokens
+                return True, 0
+            return False, (tokens - bucket[0]) / self.rate if self.rate else math.inf
+
+    def reset(self, key):
+        with self.lock:
+            self.buckets.pop(key, None)
+
+    def _prune(self, now):
+        if len(self.buckets) <= self.max_keys:
+            return
+        full = [key for key, bucket in self.buckets.items() if self._refilled(bucket, now) >= self.capacity]
+        for key in full:
+            del self.buckets[key]
+        while len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)
+
+    def size(self):
+        with self.lock:
+            return len(self.buckets)
+
+class LoginRateLimiter:
+    """Flask extension limiting login attempts per client address and per username"""
+
+    def __init__(self, app=None):
+        self.enabled = True
+        self.by_ip = None
+        self.by_username = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('LOGIN_RATE_LIMIT_ENABLED', True)
+        app.config.setdefault('LOGIN_ATTEMPTS_PER_IP', 20)
+        app.config.setdefault('LOGIN_ATTEMPTS_PER_USERNAME', 5)
+        app.config.setdefault('LOGIN_RATE_WINDOW', 300)  # seconds for a bucket to refill completely
+        app.config.setdefault('LOGIN_RATE_MAX_KEYS', 10000)  # beyond this, full buckets and then the least recently used are dropped
+
+        window = app.config['LOGIN_RATE_WINDOW']
+        per_ip = app.config['LOGIN_ATTEMPTS_PER_IP']
+        per_username = app.config['LOGIN_ATTEMPTS_PER_USERNAME']
+        self.enabled = app.config['LOGIN_RATE_LIMIT_ENABLED']
+        self.by_ip = TokenBucketLimiter(per_ip, per_ip / window, app.config['LOGIN_RATE_MAX_KEYS'])
+        self.by_username = TokenBucketLimiter(per_username, per_username / window, app.config['LOGIN_RATE_MAX_KEYS'])
+        app.extensions['login_rate_limiter'] = self
+
+    def attempt(self, ip, username):
+        """Seconds the client has to wait, or 0 when the attempt may go ahead"""
+        if not self.enabled:
+            return 0
+        ip_allowed, ip_wait = self.by_ip.consume(ip)
+        username_allowed, username_wait = self.by_username.consume(username.lower())
+        if ip_allowed and username_allowed:
+            return 0
+        return max(ip_wait, username_wait)
+
+    def succeeded(self, username):
+        self.by_username.reset(username.lower())
+
+login_limiter = LoginRateLimiter()
@@ -0,0 +1,102 @@
+"""Full-text search (SQLite FTS5, bm25-ranked) for the admin list endpoints, with an ILIKE fallback"""
+
+import re
+from src.models.user import db
+
+# table -> (FTS table, indexed columns, ILIKE fallback columns)
+SEARCH_INDEXES = {
+    'registrations': (
+        'registrations_fts',
+        ('full_name', 'email', 'affiliation'),
+        ('full_name', 'email', 'affiliation')
+    ),
+    'paper_submissions': (
+        'paper_submissions_fts',
+        ('title', 'abstract', 'keywords', 'authors', 'corresponding_author_email', 'document_text'),
+        ('title', 'authors', 'corresponding_author_email')
+    ),
+    'contact_messages': (
+        'contact_messages_fts',
+        ('name', 'email', 'subject', 'message'),
+        ('name', 'email', 'subject')
+    ),
+}
+
+_fts_tables = {}
+
+def fts_available(table_name):
+    """True when the FTS table exists in the bound database (cached per engine)"""
+    key = (str(db.engine.url), table_name)
+    if key not in _fts_tables:
+        if db.engine.dialect.name != 'sqlite':
+            _fts_tables[key] = False
+        else:
+            _fts_tables[key] = db.session.execute(
+                db.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {'name': table_name}
+            ).first() is not None
+    return _fts_tables[key]
+
+def match_expression(text):
+    """FTS5 query requiring every word of text, the last one as a prefix, or None if there are no words"""
+    terms = re.findall(r'\w+', text or '')
+    if not terms:
+        return None
+    # Only the word being typed is expanded; prefix scans over long doclists are the costly part
+    return ' '.join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+
+def apply_search(query, model, text):
+    """Restrict query to rows matching text, best matches first"""
+    fts_table, columns, fallback_columns = SEARCH_INDEXES[model.__tablename__]
+
+    if not fts_available(fts_table):
+        conditions = [getattr(model, column).ilike(f'%{text}%') for column in fallback_columns]
+        return query.filter(db.or_(*conditions))
+
+    expression = match_expression(text)
+    if expression is None:
+        return query
+
+    fts = db.table(fts_table, db.column('rowid'), db.column('rank'))
+    matches = db.select(
+        fts.c.rowid.label('id'), fts.c.rank.label('rank')
+    ).where(db.literal_column(fts_table).op('MATCH')(expression)).subquery()
+    return query.join(matches, matches.c.id == model.id).order_by(matches.c.rank)
+
+def drop_search_index(connection, table):
+    """Drop the FTS table and triggers of table so it can be recreated with other columns"""
+    fts_table = SEARCH_INDEXES[table][0]
+    for trigger in ('ai', 'ad', 'au'):
+        connection.exec_driver_sql(f'DROP TRIGGER IF EXISTS {fts_table}_{trigger}')
+    connection.exec_driver_sql(f'DROP TABLE IF EXISTS {fts_table}')
+    _fts_tables.clear()
+
+def create_search_indexes(connection, indexes=None):
+    """Create the FTS tables and sync triggers, then index existing rows"""
+    for table, (fts_table, columns, _) in (indexes or SEARCH_INDEXES).items():
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{column}' for column in columns)
+        old_values = ', '.join(f'old.{column}' for column in columns)
+
+        connection.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+            f"{column_list}, content='{table}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+            f"VALUES ('delete', old.id, {old_values}); END"
+        )
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list} ON {table} BEGIN "
+            f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+            f"VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        connection.exec_driver_sql(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+    _fts_tables.clear()
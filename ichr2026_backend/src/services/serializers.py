@@ -0,0 +1,142 @@
+"""Row serializers compiled per model and profile, matching to_dict() for the 'detail' profile"""
+
+import threading
+from src.models.conference import Registration, PaperSubmission, ContactMessage
+
+# Always selected: keyset cursors and row ETags are built from them
+REQUIRED_COLUMNS = ('id', 'created_at', 'updated_at')
+
+class Value:
+    """The column's value as stored"""
+
+    def __init__(self, name, column=None):
+        self.name = name
+        self.columns = (column or name,)
+
+    def expression(self, variables, namespace, model):
+        return variables[self.columns[0]]
+
+class EnumValue(Value):
+    """The .value of an Enum column, or None"""
+
+    def expression(self, variables, namespace, model):
+        column = self.columns[0]
+        table = f'_{column}_values'
+        enum_class = model.__table__.c[column].type.enum_class
+        namespace[table] = {None: None, **{member: member.value for member in enum_class}}
+        return f'{table}[{variables[column]}]'
+
+class Timestamp(Value):
+    """A DateTime column as an ISO 8601 string, or None"""
+
+    def expression(self, variables, namespace, model):
+        variable = variables[self.columns[0]]
+        return f'{variable}.isoformat() if {variable} is not None else None'
+
+class Link:
+    """A URL filled in from columns, or None when the present column is empty"""
+
+    def __init__(self, name, template, columns, present):
+        self.name = name
+        self.template = template
+        self.columns = tuple(columns) + (present,)
+        self.present = present
+
+    def expression(self, variables, namespace, model):
+        url = self.template.format(**{column: '{' + variables[column] + '}' for column in self.columns})
+        return f'f{url!r} if {variables[self.present]} else None'
+
+THUMBNAIL_LINK = Link('thumbnail_url', '/api/admin/papers/{submission_id}/thumbnail', ['submission_id'], 'thumbnail_path')
+
+# model -> profile -> fields; models without a 'summary' profile use 'detail' for both
+SCHEMAS = {
+    Registration: {
+        'detail': (
+            Value('id'), Value('registration_id'), Value('full_name'), Value('email'), Value('phone'),
+            Value('affiliation'), Value('country'), EnumValue('category'), Value('paper_title'),
+            Value('special_requirements'), EnumValue('status'), Timestamp('created_at'),
+            Timestamp('updated_at'), Value('payment_amount'), Value('payment_currency'),
+            Value('payment_status'), Value('payment_reference'),
+        ),
+    },
+    PaperSubmission: {
+        'summary': (
+            Value('id'), Value('submission_id'), Value('title'), Value('keywords'), EnumValue('category'),
+            Value('authors'), Value('corresponding_author_email'), Value('affiliation'), Value('file_name'),
+            Value('file_size'), Value('file_type'), Value('processing_status'), Value('page_count'),
+            THUMBNAIL_LINK, EnumValue('status'), Value('review_score'), Timestamp('created_at'),
+            Timestamp('updated_at'), Timestamp('review_deadline'),
+        ),
+        'detail': (
+            Value('id'), Value('submission_id'), Value('title'), Value('abstract'), Value('keywords'),
+            EnumValue('category'), Value('authors'), Value('corresponding_author_email'),
+            Value('affiliation'), Value('phone'), Value('file_name'), Value('file_path'),
+            Value('file_size'), Value('file_type'), Value('file_sha256'), Value('processing_status'),
+            Value('processing_error'), Value('page_count'), THUMBNAIL_LINK, Timestamp('processed_at'),
+            EnumValue('status'), Value('reviewer_comments'), Value('review_score'),
+            Timestamp('created_at'), Timestamp('updated_at'), Timestamp('review_deadline'),
+        ),
+    },
+    ContactMessage: {
+        'summary': (
+            Value('id'), Value('message_id'), Value('name'), Value('email'), Value('subject'),
+            Value('subject_category'), Value('status'), Value('responded_by'), Timestamp('responded_at'),
+            Timestamp('created_at'), Timestamp('updated_at'),
+        ),
+        'detail': (
+            Value('id'), Value('message_id'), Value('name'), Value('email'), Value('subject'),
+            Value('subject_category'), Value('message'), Value('status'), Value('response'),
+            Value('responded_by'), Timestamp('responded_at'), Timestamp('created_at'), Timestamp('updated_at'),
+        ),
+    },
+}
+
+class RowSerializer:
+    """A schema compiled for one model and profile"""
+
+    def __init__(self, model, profile, fields):
+        self.model = model
+        self.profile = profile
+
+        names = []
+        for column in REQUIRED_COLUMNS + tuple(column for field in fields for column in field.columns):
+            if column not in names:
+                names.append(column)
+        self.column_names = tuple(names)
+        self.columns = [getattr(model, name) for name in names]
+
+        variables = {name: f'c{index}' for index, name in enumerate(names)}
+        namespace = {}
+        items = ', '.join(f'{field.name!r}: {field.expression(variables, namespace, model)}' for field in fields)
+        self.source = (
+            f'def serialize(row):\n'
+            f'    {", ".join(variables.values())}, = row\n'
+            f'    return {{{items}}}\n'
+        )
+        exec(compile(self.source, f'<serializer {model.__tablename__}.{profile}>', 'exec'), namespace)
+        self.serialize = namespace['serialize']
+
+    def select(self, query):
+        """query returning plain rows of the columns this serializer reads"""
+        return query.with_entities(*self.columns)
+
+    def dump(self, rows):
+        return list(map(self.serialize, rows))
+
+    def __repr__(self):
+        return f'<RowSerializer {self.model.__tablename__}.{self.profile}: {len(self.column_names)} columns>'
+
+_serializers = {}
+_serializers_lock = threading.Lock()
+
+def row_serializer(model, profile='detail'):
+    """The compiled serializer of model for profile, compiled on first use"""
+    key = (model, profile)
+    serializer = _serializers.get(key)
+    if serializer is None:
+        with _serializers_lock:
+            serializer = _serializers.get(key)
+            if serializer is None:
+                profiles = SCHEMAS[model]
+                serializer = _serializers[key] = RowSerializer(model, profile, profiles.get(profile, profiles['detail']))
+    return serializer
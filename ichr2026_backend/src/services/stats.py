@@ -0,0 +1,171 @@
+"""Statistics for the stats, dashboard and summary report endpoints, mostly read from the materialized counters"""
+
+from datetime import datetime, time, timedelta
+from enum import Enum
+from src.models.user import db
+from src.models.conference import (
+    Registration, PaperSubmission, ContactMessage,
+    RegistrationCategory, RegistrationStatus, PaperCategory, PaperStatus,
+    MESSAGE_STATUSES, CONTACT_SUBJECT_KEYWORDS
+)
+from src.services.counters import COUNTED_MODELS, read_counters, daily_totals
+
+def _bucket_key(value):
+    return value.value if isinstance(value, Enum) else value
+
+def _breakdown(rows, column, members):
+    """Counts per value of a grouped column, with zero buckets for missing members"""
+    result = {_bucket_key(member): 0 for member in members}
+    for row in rows:
+        key = _bucket_key(getattr(row, column))
+        if key in result:
+            result[key] += row.count
+    return result
+
+def monthly_windows(now, months=6):
+    """Month buckets used by the dashboard trend, newest first"""
+    windows = []
+    for i in range(months):
+        month_start = now.replace(day=1) - timedelta(days=30*i)
+        month_end = month_start + timedelta(days=30)
+        windows.append((month_start, month_end))
+    return windows
+
+def _exact_count(entity, start, end):
+    model = COUNTED_MODELS[entity][0]
+    return model.query.filter(model.created_at >= start, model.created_at < end).count()
+
+def window_total(daily, entity, start, end=None):
+    """Rows of entity created in [start, end): whole days from the daily counters, partial days from the table"""
+    first_day = start.date() if start.time() == time() else start.date() + timedelta(days=1)
+    first_midnight = datetime.combine(first_day, time())
+    if end is not None and first_midnight >= end:
+        return _exact_count(entity, start, end)
+
+    total = sum(
+        count for (row_entity, day), count in daily.items()
+        if row_entity == entity and day >= first_day and (end is None or day < end.date())
+    )
+    if start < first_midnight:
+        total += _exact_count(entity, start, first_midnight)
+    if end is not None and end.time() != time():
+        total += _exact_count(entity, datetime.combine(end.date(), time()), end)
+    return total
+
+def registration_stats():
+    """Statistics for /registration/stats, read from the materialized counters"""
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    counters = read_counters()
+    recent = daily_totals(week_ago.date())
+    return {
+        'total_registrations': counters.total('registration'),
+        'category_breakdown': counters.breakdown('registration', 'category', RegistrationCategory),
+        'status_breakdown': counters.breakdown('registration', 'status', RegistrationStatus),
+        'recent_registrations': window_total(recent, 'registration', week_ago)
+    }
+
+def paper_stats():
+    """Statistics for /papers/stats, read from the materialized counters"""
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    counters = read_counters()
+    recent = daily_totals(week_ago.date())
+    scored = counters.get('paper', 'review_score', 'scored')
+    avg_score = counters.get('paper', 'review_score', 'scored', 'amount') / scored if scored else None
+    return {
+        'total_submissions': counters.total('paper'),
+        'category_breakdown': counters.breakdown('paper', 'category', PaperCategory),
+        'status_breakdown': counters.breakdown('paper', 'status', PaperStatus),
+        'recent_submissions': window_total(recent, 'paper', week_ago),
+        'pending_review': counters.get('paper', 'status', PaperStatus.SUBMITTED.value),
+        'average_review_score': round(avg_score, 2) if avg_score else None
+    }
+
+def contact_stats():
+    """Statistics for /contact/stats, read from the materialized counters"""
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    counters = read_counters()
+    recent = daily_totals(week_ago.date())
+
+    total_messages = counters.total('message')
+    responded_messages = counters.get('message', 'status', 'responded')
+    response_rate = (responded_messages / total_messages * 100) if total_messages > 0 else 0
+    return {
+        'total_messages': total_messages,
+        'status_breakdown': counters.breakdown('message', 'status', MESSAGE_STATUSES),
+        'recent_messages': window_total(recent, 'message', week_ago),
+        'unread_messages': counters.get('message', 'status', 'new'),
+        'response_rate': round(response_rate, 2),
+        'subject_breakdown': counters.breakdown('message', 'subject', CONTACT_SUBJECT_KEYWORDS)
+    }
+
+def dashboard_stats():
+    """Statistics for /admin/dashboard, read from the materialized counters"""
+    now = datetime.utcnow()
+    week_ago = now - timedelta(days=7)
+    windows = monthly_windows(now)
+    counters = read_counters()
+    daily = daily_totals(min(week_ago, windows[-1][0]).date())
+
+    return {
+        'overview': {
+            'total_registrations': counters.total('registration'),
+            'pending_registrations': counters.get('registration', 'status', RegistrationStatus.PENDING.value),
+            'confirmed_registrations': counters.get('registration', 'status', RegistrationStatus.CONFIRMED.value),
+            'total_papers': counters.total('paper'),
+            'pending_papers': counters.get('paper', 'status', PaperStatus.SUBMITTED.value),
+            'accepted_papers': counters.get('paper', 'status', PaperStatus.ACCEPTED.value),
+            'total_messages': counters.total('message'),
+            'unread_messages': counters.get('message', 'status', 'new'),
+            'total_revenue': counters.get('registration', 'payment_status', 'paid', 'amount')
+        },
+        'recent_activity': {
+            'recent_registrations': window_total(daily, 'registration', week_ago),
+            'recent_papers': window_total(daily, 'paper', week_ago),
+            'recent_messages': window_total(daily, 'message', week_ago)
+        },
+        'breakdowns': {
+            'registration_by_category': counters.breakdown('registration', 'category', RegistrationCategory),
+            'papers_by_category': counters.breakdown('paper', 'category', PaperCategory)
+        },
+        'trends': {
+            'monthly_registrations': [
+                {'month': start.strftime('%Y-%m'), 'count': window_total(daily, 'registration', start, end)}
+                for start, end in windows
+            ]
+        }
+    }
+
+def summary_report(start_date, end_date):
+    """Statistics for /admin/reports/summary over the exact [start_date, end_date] window"""
+    def grouped(model, *columns, measures=()):
+        return db.session.query(*columns, db.func.count().label('count'), *measures).filter(
+            model.created_at >= start_date, model.created_at <= end_date
+        ).group_by(*columns).all()
+
+    revenue = db.func.sum(db.case((Registration.payment_status == 'paid', Registration.payment_amount), else_=None))
+    registrations = grouped(Registration, Registration.status, Registration.category,
+                            measures=[revenue.label('revenue')])
+    papers = grouped(PaperSubmission, PaperSubmission.status, PaperSubmission.category)
+    messages = grouped(ContactMessage, ContactMessage.status)
+
+    return {
+        'period': {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat()
+        },
+        'registrations': {
+            'total': sum(row.count for row in registrations),
+            'by_status': _breakdown(registrations, 'status', RegistrationStatus),
+            'by_category': _breakdown(registrations, 'category', RegistrationCategory),
+            'revenue': sum(row.revenue or 0 for row in registrations)
+        },
+        'papers': {
+            'total': sum(row.count for row in papers),
+            'by_status': _breakdown(papers, 'status', PaperStatus),
+            'by_category': _breakdown(papers, 'category', PaperCategory)
+        },
+        'messages': {
+            'total': sum(row.count for row in messages),
+            'by_status': _breakdown(messages, 'status', MESSAGE_STATUSES)
+        }
+    }
@@ -0,0 +1,233 @@
+"""Streaming multipart uploads and resumable upload sessions for paper files"""
+
+import hashlib
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta
+from werkzeug.exceptions import ClientDisconnected
+from werkzeug.sansio.multipart import MultipartDecoder, Field, File, Data, Epilogue, NeedData
+from src.models.user import db
+from src.models.conference import ConferenceSettings, PaperUpload
+from src.services.blobs import file_sha256
+
+CHUNK_SIZE = 64 * 1024
+PIECE_SIZE = 4 * 1024 * 1024  # suggested size of each resumable PATCH
+MAX_FIELD_SIZE = 256 * 1024
+MULTIPART_OVERHEAD = 1024 * 1024  # room for the form fields next to the file
+DEFAULT_MAX_FILE_SIZE_MB = 10
+UPLOAD_SESSION_TTL = timedelta(hours=24)
+
+class UploadError(ValueError):
+    """The upload request is malformed or not acceptable"""
+
+class UploadTooLarge(Exception):
+    def __init__(self, limit):
+        self.limit = limit
+        super().__init__(f'File exceeds the maximum size of {limit / (1024 * 1024):g} MB')
+
+class UploadConflict(Exception):
+    """A resumable piece was sent for an offset other than the current one"""
+
+    def __init__(self, offset):
+        self.offset = offset
+        super().__init__(f'Upload offset mismatch; resume from byte {offset}')
+
+class StoredFile:
+    """A received file, with the size and hash seen while writing it"""
+
+    def __init__(self, filename, path, size, sha256):
+        self.filename = filename
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+
+def max_upload_bytes():
+    """Maximum paper file size from the max_file_size_mb conference setting"""
+    setting = ConferenceSettings.query.filter_by(key='max_file_size_mb').first()
+    try:
+        megabytes = float(setting.value) if setting else DEFAULT_MAX_FILE_SIZE_MB
+    except ValueError:
+        megabytes = DEFAULT_MAX_FILE_SIZE_MB
+    return int(megabytes * 1024 * 1024)
+
+def discard_upload(stored):
+    """Remove a stored file whose submission did not go through"""
+    if stored is not None and stored.path is not None and os.path.exists(stored.path):
+        os.remove(stored.path)
+
+def receive_multipart(stream, boundary, file_field, destination, limit):
+    """Decode a multipart body, writing file_field straight to destination(filename, fields)
+
+    Returns (form fields, StoredFile or None). destination sees the fields sent
+    before the file; it may raise UploadError to refuse the file before any of
+    it is written, or return None to only hash it (StoredFile.path is then None).
+    """
+    decoder = MultipartDecoder(boundary.encode('latin-1'), max_form_memory_size=MAX_FIELD_SIZE)
+    fields = {}
+    stored = None
+    part = output = hasher = None
+    receiving = False
+    buffered = []
+    size = 0
+
+    try:
+        while True:
+            event = decoder.next_event()
+            if isinstance(event, NeedData):
+                decoder.receive_data(stream.read(CHUNK_SIZE) or None)
+            elif isinstance(event, Epilogue):
+                break
+            elif isinstance(event, Field):
+                part, buffered = event, []
+            elif isinstance(event, File):
+                part = event
+                if event.name == file_field and stored is None and not receiving:
+                    if not event.filename:
+                        raise UploadError('No file selected')
+                    path = destination(event.filename, fields)
+                    output = open(path, 'xb') if path is not None else None
+                    hasher = hashlib.sha256()
+                    receiving = True
+                    size = 0
+            elif isinstance(event, Data):
+                if isinstance(part, Field):
+                    buffered.append(event.data)
+                    if not event.more_data:
+                        fields.setdefault(part.name, b''.join(buffered).decode('utf-8', 'replace'))
+                elif receiving and part.name == file_field:
+                    size += len(event.data)
+                    if size > limit:
+                        raise UploadTooLarge(limit)
+                    if output is not None:
+                        output.write(event.data)
+                    hasher.update(event.data)
+                    if not event.more_data:
+                        path = None
+                        if output is not None:
+                            output.close()
+                            path = output.name
+                        stored = StoredFile(part.filename, path, size, hasher.hexdigest())
+                        output = None
+                        receiving = False
+    except BaseException:
+        if output is not None:
+            output.close()
+            os.remove(output.name)
+        discard_upload(stored)
+        raise
+    return fields, stored
+
+# Resumable uploads
+
+def _partial_folder(upload_folder):
+    path = os.path.join(upload_folder, '.partial')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def purge_expired_uploads():
+    """Drop upload sessions (and their partial files) that were abandoned"""
+    expired = PaperUpload.query.filter(PaperUpload.expires_at < datetime.utcnow()).all()
+    for upload in expired:
+        if os.path.exists(upload.part_path):
+            os.remove(upload.part_path)
+        db.session.delete(upload)
+    db.session.commit()
+    return len(expired)
+
+def create_upload_session(filename, total_size, upload_folder, limit):
+    """Start a resumable upload of total_size bytes"""
+    if total_size <= 0:
+        raise UploadError('Upload size must be a positive number of bytes')
+    if total_size > limit:
+        raise UploadTooLarge(limit)
+    purge_expired_uploads()
+
+    upload_id = f"ICHR2026-UPL-{uuid.uuid4().hex[:12].upper()}"
+    part_path = os.path.join(_partial_folder(upload_folder), f'{upload_id}.part')
+    open(part_path, 'xb').close()
+    upload = PaperUpload(
+        upload_id=upload_id,
+        filename=filename,
+        total_size=total_size,
+        part_path=part_path,
+        expires_at=datetime.utcnow() + UPLOAD_SESSION_TTL
+    )
+    db.session.add(upload)
+    db.session.commit()
+    return upload
+
+def append_upload_chunk(upload, offset, stream):
+    """Receive a piece starting at offset; bytes received before a disconnect are kept"""
+    if offset != upload.received_size:
+        raise UploadConflict(upload.received_size)
+
+    remaining = upload.total_size - offset
+    piece_path = f'{upload.part_path}.{uuid.uuid4().hex}'
+    written = 0
+    try:
+        with open(piece_path, 'xb') as piece:
+            try:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if written + len(chunk) > remaining:
+                        # Drop the whole piece; the client resends it from the old offset
+                        raise UploadError('Chunk runs past the declared upload size')
+                    piece.write(chunk)
+                    written += len(chunk)
+            except ClientDisconnected:
+                pass
+        if written:
+            # Only the request that moves the offset on may write those bytes of the partial file
+            _claim_range(upload, offset, offset + written)
+            try:
+                with open(piece_path, 'rb') as piece, open(upload.part_path, 'r+b') as part:
+                    part.seek(offset)
+                    shutil.copyfileobj(piece, part, CHUNK_SIZE)
+            except BaseException:
+                _release_range(upload, offset, offset + written)
+                raise
+    finally:
+        if os.path.exists(piece_path):
+            os.remove(piece_path)
+    return upload.received_size
+
+def _claim_range(upload, offset, received):
+    # Conditional on the old offset so a concurrent piece for the same offset cannot both win
+    updated = PaperUpload.query.filter_by(id=upload.id, received_size=offset).update({
+        'received_size': received,
+        'updated_at': datetime.utcnow(),
+        'expires_at': datetime.utcnow() + UPLOAD_SESSION_TTL
+    })
+    db.session.commit()
+    db.session.refresh(upload)
+    if not updated:
+        raise UploadConflict(upload.received_size)
+
+def _release_range(upload, offset, received):
+    # The claimed bytes never reached the partial file; the client resends them from offset
+    PaperUpload.query.filter_by(id=upload.id, received_size=received).update({'received_size': offset})
+    db.session.commit()
+    db.session.refresh(upload)
+
+def check_upload_complete(upload):
+    if upload.received_size != upload.total_size:
+        raise UploadError(f'Upload is incomplete: {upload.received_size} of {upload.total_size} bytes received')
+
+def complete_upload(upload):
+    """Close the session of a fully received upload, handing over its partial file"""
+    check_upload_complete(upload)
+    if os.path.getsize(upload.part_path) != upload.total_size:
+        raise UploadError('Upload is incomplete; start it again')
+    # Hashed from the file itself, since the blob it becomes is named and deduplicated by this hash
+    stored = StoredFile(upload.filename, upload.part_path, upload.total_size, file_sha256(upload.part_path))
+    db.session.delete(upload)
+    return stored
+
+def cancel_upload(upload):
+    if os.path.exists(upload.part_path):
+        os.remove(upload.part_path)
+    db.session.delete(upload)
+    db.session.commit()
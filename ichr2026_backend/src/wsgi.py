@@ -0,0 +1,5 @@
+"""Production entry point: `gunicorn src.wsgi:app`, configured by gunicorn.conf.py"""
+
+from src.main import create_app
+
+app = create_app()
@@ -0,0 +1,41 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from src.main import create_app
+from src.migrations.runner import prepare_database
+from src.models.user import db
+from src.services.auth import token_denylist
+
+@pytest.fixture
+def app(tmp_path):
+    """The application on a fresh, migrated database, storing files under tmp_path"""
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'app.db'}",
+        'JWT_SECRET_KEY': 'ichr2026_test_jwt_secret_key_long_enough',
+        'JOB_AUTOSTART': False,
+        'CACHE_ENABLED': False,
+        'PASSWORD_SCRYPT_N': 2 ** 10,
+    })
+    app.root_path = str(tmp_path)
+    with app.app_context():
+        prepare_database()
+    yield app
+    token_denylist.stop()
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+def login(client, username='admin', password='admin123'):
+    response = client.post('/api/admin/login', json={'username': username, 'password': password})
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+def bearer(token):
+    return {'Authorization': f'Bearer {token}'}
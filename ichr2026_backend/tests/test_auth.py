@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from flask_jwt_extended import get_jti
+from conftest import login, bearer
+from src.models.user import db
+from src.models.conference import RevokedToken
+from src.services.auth import token_denylist
+
+def create_admin(client, token, username):
+    response = client.post('/api/admin/users', headers=bearer(token), json={
+        'username': username, 'email': f'{username}@example.org', 'password': 'secret123', 'role': 'admin'
+    })
+    assert response.status_code == 201
+    return response.get_json()['data']['id']
+
+def test_deleted_admin_tokens_stay_revoked_after_reload(app, client):
+    admin = login(client)
+    bob_id = create_admin(client, admin['access_token'], 'bob')
+    bob = login(client, 'bob', 'secret123')
+
+    assert client.delete(f'/api/admin/users/{bob_id}', headers=bearer(admin['access_token'])).status_code == 200
+    token_denylist.refresh()
+
+    assert client.get('/api/admin/users', headers=bearer(bob['access_token'])).status_code == 401
+    assert client.post('/api/admin/refresh', headers=bearer(bob['refresh_token'])).status_code == 401
+
+def test_deleted_admin_id_is_not_reused(app, client):
+    admin = login(client)
+    bob_id = create_admin(client, admin['access_token'], 'bob')
+    bob = login(client, 'bob', 'secret123')
+    client.delete(f'/api/admin/users/{bob_id}', headers=bearer(admin['access_token']))
+
+    assert create_admin(client, admin['access_token'], 'carol') != bob_id
+    token_denylist.refresh()
+    assert client.get('/api/admin/users', headers=bearer(bob['access_token'])).status_code == 401
+
+def test_admin_created_elsewhere_is_accepted_before_reload(app, client):
+    admin = login(client)
+    create_admin(client, admin['access_token'], 'dave')
+    # Another worker has not seen dave yet
+    token_denylist.refresh()
+    token_denylist.versions = {}
+    token_denylist.max_user_id = 1
+    dave = login(client, 'dave', 'secret123')
+    assert client.get('/api/admin/users', headers=bearer(dave['access_token'])).status_code == 200
+
+def test_logout_of_a_token_revoked_by_another_worker(app, client):
+    tokens = login(client)
+    assert client.post('/api/admin/logout', headers=bearer(tokens['access_token']),
+                       json={'refresh_token': tokens['refresh_token']}).status_code == 200
+
+    # This worker has not reloaded since another one logged the same session out
+    second = login(client)
+    token_denylist.revoked_jtis = frozenset()
+    response = client.post('/api/admin/logout', headers=bearer(second['access_token']),
+                           json={'refresh_token': tokens['refresh_token']})
+    assert response.status_code == 200
+
+    token_denylist.refresh()
+    assert client.post('/api/admin/refresh', headers=bearer(tokens['refresh_token'])).status_code == 401
+
+def test_login_with_non_string_credentials_is_rejected(client):
+    for body in ({'username': ['admin'], 'password': 'admin123'}, {'username': 'admin', 'password': 12345678},
+                 {'username': {'name': 'admin'}, 'password': 'x'}, ['admin', 'admin123']):
+        assert client.post('/api/admin/login', json=body).status_code == 400
+    login(client)
+
+def test_logout_with_another_admins_refresh_token_revokes_nothing(app, client):
+    admin = login(client)
+    create_admin(client, admin['access_token'], 'erin')
+    erin = login(client, 'erin', 'secret123')
+
+    response = client.post('/api/admin/logout', headers=bearer(admin['access_token']),
+                           json={'refresh_token': erin['refresh_token']})
+    assert response.status_code == 400
+
+    assert client.get('/api/admin/users', headers=bearer(admin['access_token'])).status_code == 200
+    with app.app_context():
+        assert RevokedToken.query.count() == 0
+
+def test_expired_revocations_are_purged_outside_logout(app, client):
+    with app.app_context():
+        db.session.add(RevokedToken(jti='expired', token_type='access', expires_at=datetime.utcnow() - timedelta(days=1)))
+        db.session.commit()
+
+    tokens = login(client)
+    assert client.post('/api/admin/logout', headers=bearer(tokens['access_token'])).status_code == 200
+    with app.app_context():
+        assert RevokedToken.query.filter_by(jti='expired').count() == 1
+
+    assert token_denylist.purge_expired() == 1
+    with app.app_context():
+        assert [row.jti for row in RevokedToken.query] == [get_jti(tokens['access_token'])]
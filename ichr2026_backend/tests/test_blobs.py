@@ -0,0 +1,52 @@
+import io
+import os
+from conftest import login, bearer
+from src.models.user import db
+from src.models.conference import FileBlob
+from src.services.blobs import blob_path, acquire_blob, release_blob, remove_unreferenced_blob
+from src.services.uploads import StoredFile
+
+PAPER = b'%PDF-1.4\nblob test\n%%EOF\n'
+
+def submit(client):
+    response = client.post('/api/papers/submit', content_type='multipart/form-data', data={
+        'title': 'Blob test', 'abstract': 'Abstract', 'keywords': 'blob', 'category': 'research',
+        'authors': 'Blob Test', 'email': 'blob@example.org', 'affiliation': 'University of Vavuniya',
+        'phone': '+94 77 000 0000', 'file': (io.BytesIO(PAPER), 'paper.pdf')
+    })
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['data']
+
+def test_release_keeps_the_blob_until_commit(app, client):
+    paper = submit(client)
+    with app.app_context():
+        path = blob_path(paper['file_sha256'])
+        assert release_blob(paper['file_sha256'])
+        db.session.rollback()
+
+        assert os.path.exists(path)
+        assert FileBlob.query.filter_by(sha256=paper['file_sha256']).one().ref_count == 1
+
+def test_blob_referenced_again_after_release_is_kept(app, client):
+    paper = submit(client)
+    with app.app_context():
+        sha256 = paper['file_sha256']
+        release_blob(sha256)
+        db.session.commit()
+        # Another submission of the same content arrives before the file is unlinked
+        acquire_blob(StoredFile('paper.pdf', None, len(PAPER), sha256))
+        db.session.commit()
+
+        assert not remove_unreferenced_blob(sha256)
+        assert os.path.exists(blob_path(sha256))
+
+def test_delete_paper_removes_the_blob_with_the_last_reference(app, client):
+    first, second = submit(client), submit(client)
+    token = login(client)['access_token']
+    with app.app_context():
+        path = blob_path(first['file_sha256'])
+
+    assert client.delete(f"/api/papers/{first['submission_id']}", headers=bearer(token)).status_code == 200
+    assert os.path.exists(path)
+    assert client.delete(f"/api/papers/{second['submission_id']}", headers=bearer(token)).status_code == 200
+    assert not os.path.exists(path)
@@ -0,0 +1,52 @@
+import uuid
+from datetime import datetime, timedelta
+from conftest import login, bearer
+from src.models.user import db
+from src.models.conference import Registration, RegistrationCategory, RegistrationStatus
+from src.services.counters import check_counters
+from src.services.stats import monthly_windows
+
+def add_registration(created_at):
+    db.session.add(Registration(
+        registration_id=f'ICHR2026-REG-{uuid.uuid4().hex[:8]}', full_name='Stats Test', email='stats@example.org',
+        phone='+94 77 000 0000', affiliation='University of Vavuniya', country='Sri Lanka',
+        category=RegistrationCategory.STUDENT, created_at=created_at
+    ))
+
+def exact_count(start, end=None):
+    query = Registration.query.filter(Registration.created_at >= start)
+    if end is not None:
+        query = query.filter(Registration.created_at < end)
+    return query.count()
+
+def test_windows_count_exact_times_not_whole_days(app, client):
+    now = datetime.utcnow()
+    week_ago = now - timedelta(days=7)
+    with app.app_context():
+        # Either side of every window edge, on the edge's own day
+        for edge in [week_ago] + [moment for window in monthly_windows(now) for moment in window]:
+            add_registration(edge - timedelta(minutes=1))
+            add_registration(edge + timedelta(minutes=1))
+        db.session.commit()
+        expected_recent = exact_count(week_ago)
+        expected_months = [exact_count(start, end) for start, end in monthly_windows(now)]
+
+    token = login(client)['access_token']
+    dashboard = client.get('/api/admin/dashboard', headers=bearer(token)).get_json()['data']
+    assert dashboard['recent_activity']['recent_registrations'] == expected_recent
+    assert [month['count'] for month in dashboard['trends']['monthly_registrations']] == expected_months
+
+    stats = client.get('/api/registration/stats').get_json()['data']
+    assert stats['recent_registrations'] == expected_recent
+
+def test_counters_follow_updates_of_expired_rows(app):
+    with app.app_context():
+        add_registration(datetime.utcnow())
+        db.session.commit()
+        # The commit expired the row, so the old status is only known if assignment loads it
+        registration = Registration.query.one()
+        db.session.expire(registration)
+        registration.status = RegistrationStatus.CONFIRMED
+        db.session.commit()
+
+        assert check_counters() == []
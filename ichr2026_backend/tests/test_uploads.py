@@ -0,0 +1,46 @@
+import hashlib
+import io
+import pytest
+from src.services.uploads import (
+    create_upload_session, append_upload_chunk, complete_upload, UploadConflict
+)
+
+class RacingStream:
+    """A request body during whose first read another request sends the same offset"""
+
+    def __init__(self, data, race):
+        self.body = io.BytesIO(data)
+        self.race = race
+
+    def read(self, size):
+        chunk = self.body.read(size)
+        if self.race:
+            race, self.race = self.race, None
+            race()
+        return chunk
+
+def test_same_offset_piece_loses_without_touching_the_file(app, tmp_path):
+    with app.app_context():
+        upload = create_upload_session('paper.pdf', 8, str(tmp_path), 1024)
+        append_upload_chunk(upload, 0, io.BytesIO(b'head'))
+
+        winner = lambda: append_upload_chunk(upload, 4, io.BytesIO(b'BBBB'))
+        with pytest.raises(UploadConflict) as conflict:
+            append_upload_chunk(upload, 4, RacingStream(b'AAAA', winner))
+
+        assert conflict.value.offset == 8
+        stored = complete_upload(upload)
+        with open(stored.path, 'rb') as part:
+            assert part.read() == b'headBBBB'
+        assert stored.sha256 == hashlib.sha256(b'headBBBB').hexdigest()
+
+def test_stale_offset_patch_returns_conflict(app, client):
+    response = client.post('/api/papers/uploads', json={'filename': 'paper.pdf', 'size': 8})
+    assert response.status_code == 201
+    location = response.headers['Location']
+
+    assert client.patch(location, data=b'head', headers={'Upload-Offset': '0'}).status_code == 200
+    response = client.patch(location, data=b'head', headers={'Upload-Offset': '0'})
+
+    assert response.status_code == 409
+    assert response.headers['Upload-Offset'] == '4'